@@ -0,0 +1,82 @@
+#!/usr/bin/env python3
+"""
+엑셀 내보내기 벤치마크
+
+기존 방식(openpyxl write-only로 시트를 하나씩 기록)과 그룹 시트 XML을 여러 프로세스에서
+병렬로 직렬화하는 방식의 소요 시간과 파일 크기를 같은 결과로 비교합니다.
+
+사용법:
+  python excel_export_benchmark.py -i resources/sample_keywords.xlsx --workers 1 2 4
+  python excel_export_benchmark.py --rows 200000     # 처음 20만 행만 사용
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import tempfile
+import time
+
+from keyword_generator import (
+    RESULT_COLUMNS, KeywordSummary, build_dashboard_data, generate_compact_results, load_source_data
+)
+from output_sinks import ParallelExcelWriter, StreamingExcelWriter
+
+def export(writer, results, chunk_size, dashboard_data):
+    """결과를 writer로 내보내고 소요 시간(초) 반환"""
+    start = time.perf_counter()
+    for chunk_start in range(0, len(results), chunk_size):
+        writer.write_chunk(results.iloc[chunk_start:chunk_start + chunk_size])
+    writer.write_dashboard(dashboard_data)
+    writer.close()
+    return time.perf_counter() - start
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(description='엑셀 내보내기 벤치마크')
+    parser.add_argument('-i', '--input', default='resources/sample_keywords.xlsx', help='입력 엑셀 파일')
+    parser.add_argument('--workers', type=int, nargs='+', default=[1, 2, 4],
+                        help='병렬 직렬화에 사용할 프로세스 수 목록 (기본값: 1 2 4)')
+    parser.add_argument('--rows', type=int, default=None, help='사용할 최대 행 수 (기본값: 전체)')
+    parser.add_argument('--chunk-size', type=int, default=100_000, help='청크당 행 수 (기본값: 100000)')
+    parser.add_argument('--skip-baseline', action='store_true', help='기존 방식 측정 생략')
+    return parser.parse_args()
+
+def main():
+    args = parse_arguments()
+
+    with contextlib.redirect_stdout(io.StringIO()):
+        df_data, column_numbers, category_titles = load_source_data(args.input)
+        if df_data is None:
+            print(f"❌ 입력 파일을 읽을 수 없습니다: {args.input}")
+            return 1
+        results = generate_compact_results(df_data, column_numbers, category_titles).to_dataframe()
+    if args.rows:
+        results = results.head(args.rows)
+    dashboard_data = build_dashboard_data(KeywordSummary.from_dataframe(results))
+
+    print(f"입력: {args.input}")
+    print(f"행 수: {len(results):,}, 그룹 수: {results['group'].nunique()}, CPU: {os.cpu_count()}")
+    print()
+
+    rows = []
+    with tempfile.TemporaryDirectory() as work_dir:
+        if not args.skip_baseline:
+            path = os.path.join(work_dir, 'streaming.xlsx')
+            seconds = export(StreamingExcelWriter(path, RESULT_COLUMNS), results, args.chunk_size, dashboard_data)
+            rows.append(('openpyxl 스트리밍', seconds, os.path.getsize(path)))
+
+        for workers in args.workers:
+            path = os.path.join(work_dir, f'parallel_{workers}.xlsx')
+            writer = ParallelExcelWriter(path, RESULT_COLUMNS, workers)
+            seconds = export(writer, results, args.chunk_size, dashboard_data)
+            rows.append((f'병렬 직렬화 ({workers}프로세스)', seconds, os.path.getsize(path)))
+
+    baseline = rows[0][1]
+    print(f"{'방식':<24}{'시간(초)':>10}{'행/초':>14}{'크기(MB)':>10}{'속도 향상':>10}")
+    for name, seconds, size in rows:
+        print(f"{name:<24}{seconds:>10.2f}{len(results) / seconds:>14,.0f}"
+              f"{size / 1024 / 1024:>10.1f}{baseline / seconds:>9.1f}x")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,357 @@
+#!/usr/bin/env python3
+"""
+여러 워크북 일괄 키워드 생성
+
+디렉토리나 glob 패턴으로 고른 워크북들을 미리 띄워 둔 프로세스 풀(--jobs)에서 동시에 처리합니다.
+워커 프로세스는 pandas/openpyxl을 한 번만 import한 채로 여러 파일을 이어서 처리하므로 파일마다 CLI를
+새로 실행하는 시작 비용이 들지 않습니다.
+
+파일마다 <출력>/<워크북 이름>/ 아래에 결과, 실행 로그(run.log), 실행 보고서(run.report.json)를 저장하고
+전체 결과는 일괄 처리 보고서(JSON) 하나로 모읍니다. 한 파일이 실패해도 나머지 파일은 계속 처리하며,
+워커 프로세스가 비정상 종료(메모리 부족 등)되면 결과를 받지 못한 파일을 새 풀에서 다시 처리하고,
+거듭 실패하는 파일은 단독 프로세스에서 확인해 실패로 기록합니다.
+
+'--' 뒤의 옵션은 keyword_generator.py의 생성 옵션으로 모든 파일에 그대로 적용합니다.
+
+사용법:
+  python keyword_batch.py clients/                                   # 디렉토리의 모든 .xlsx
+  python keyword_batch.py "clients/**/*.xlsx" -o nightly --jobs 4 -- -f csv --quiet
+  python keyword_batch.py a.xlsx b.xlsx --report batch.json -- --max-rows 1000000 --budget-policy sample
+"""
+
+import argparse
+import contextlib
+import glob
+import json
+import multiprocessing
+import os
+import signal
+import sys
+import time
+import traceback
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+
+from keyword_generator import format_duration, parse_arguments as parse_generator_arguments, run
+
+# 일괄 처리 보고서 형식 버전
+BATCH_REPORT_VERSION = 1
+
+# 처리할 워크북 확장자
+WORKBOOK_EXTENSIONS = ('.xlsx',)
+
+# 워크북별 출력 디렉토리에 함께 저장하는 로그와 실행 보고서
+LOG_FILE = 'run.log'
+REPORT_FILE = 'run.report.json'
+
+# 파일마다 정해지므로 생성 옵션으로 넘길 수 없는 옵션
+RESERVED_OPTIONS = ('-i', '--input', '-o', '--output', '--report', '--profile')
+
+# 워커 비정상 종료로 이 횟수만큼 결과를 받지 못한 파일은 단독 프로세스에서 다시 시도
+CRASH_RETRIES = 2
+
+# 종료 코드별 상태
+STATUS_BY_EXIT_CODE = {0: 'ok', 130: 'cancelled'}
+
+def find_workbooks(sources):
+    """디렉토리(바로 아래 .xlsx), glob 패턴, 파일 경로 목록에서 처리할 워크북 경로를 순서대로 수집
+
+    엑셀 잠금 파일(~$...)은 건너뛰고, 여러 패턴에 걸리는 같은 파일은 한 번만 처리합니다.
+    존재하지 않는 파일 경로는 그대로 두어 해당 파일의 실패로 기록합니다.
+    """
+    workbooks = []
+    seen = set()
+    for source in sources:
+        if os.path.isdir(source):
+            candidates = sorted(glob.glob(os.path.join(source, '*')))
+        elif any(char in source for char in '*?['):
+            candidates = sorted(glob.glob(source, recursive=True))
+        else:
+            candidates = [source]
+        for path in candidates:
+            name = os.path.basename(path)
+            if name.startswith('~$') or not name.lower().endswith(WORKBOOK_EXTENSIONS):
+                continue
+            key = os.path.abspath(path)
+            if key not in seen:
+                seen.add(key)
+                workbooks.append(path)
+    return workbooks
+
+def assign_output_dirs(workbooks, output_dir):
+    """워크북마다 <output_dir>/<워크북 이름> 출력 디렉토리 지정 (이름이 겹치면 _2, _3을 붙임)"""
+    targets = []
+    used = set()
+    for path in workbooks:
+        stem = os.path.splitext(os.path.basename(path))[0]
+        name = stem
+        suffix = 2
+        while name in used:
+            name = f"{stem}_{suffix}"
+            suffix += 1
+        used.add(name)
+        targets.append((path, os.path.join(output_dir, name)))
+    return targets
+
+# 워커 프로세스에서 확인하는 중지 요청 (init_worker에서 설정)
+stop_event = None
+
+def init_worker(event):
+    """워커 초기화: 대기 중인 워커는 Ctrl+C를 무시하고 중지 요청은 event로 확인
+
+    처리 중인 파일은 생성기(run)가 설치한 처리기가 Ctrl+C를 받아 현재 청크를 마친 뒤 취소하고,
+    run()이 끝나면 무시 상태로 되돌립니다.
+    """
+    global stop_event
+    stop_event = event
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+
+def last_error_line(log_path):
+    """실패한 실행 로그에서 마지막 오류 메시지(❌로 시작하는 줄, 없으면 마지막 줄)"""
+    try:
+        with open(log_path, encoding='utf-8') as f:
+            lines = [line.strip() for line in f if line.strip()]
+    except OSError:
+        return None
+    errors = [line.removeprefix('❌').strip() for line in lines if line.startswith('❌')]
+    return (errors or lines or [None])[-1]
+
+def process_workbook(path, output_dir, options, cancel=None, progress=None):
+    """워커 프로세스에서 워크북 하나를 생성하고 결과 항목(dict) 반환
+
+    keyword_generator의 run()을 그대로 호출하며 출력은 실행 로그 파일로 보냅니다.
+    예외가 나도 기록만 하고 실패 항목을 반환하므로 다른 파일 처리에 영향을 주지 않습니다.
+    cancel(CancellationToken)과 progress(진행 상황 콜백)는 run()에 그대로 넘깁니다.
+    """
+    # 중지 요청 전에 워커에 넘어간 파일은 시작하지 않음
+    if stop_event is not None and stop_event.is_set():
+        return {'input': path, 'output_dir': output_dir, 'status': 'skipped'}
+    
+    os.makedirs(output_dir, exist_ok=True)
+    log_path = os.path.join(output_dir, LOG_FILE)
+    report_path = os.path.join(output_dir, REPORT_FILE)
+    # 이전 실행의 보고서를 이번 결과로 읽지 않도록 삭제
+    with contextlib.suppress(FileNotFoundError):
+        os.remove(report_path)
+
+    entry = {'input': path, 'output_dir': output_dir, 'log': log_path, 'pid': os.getpid()}
+    started = time.perf_counter()
+    exit_code = None
+    with open(log_path, 'w', encoding='utf-8') as log, contextlib.redirect_stdout(log), \
+            contextlib.redirect_stderr(log):
+        try:
+            args = parse_generator_arguments(['-i', path, '-o', output_dir, *options, '--report', report_path])
+            exit_code = run(args, cancel, progress)
+        except Exception as e:
+            traceback.print_exc()
+            entry['error'] = f"{type(e).__name__}: {e}"
+    entry['seconds'] = round(time.perf_counter() - started, 3)
+    entry['exit_code'] = exit_code
+    entry['status'] = STATUS_BY_EXIT_CODE.get(exit_code, 'failed')
+
+    if os.path.exists(report_path):
+        with open(report_path, encoding='utf-8') as f:
+            report = json.load(f)
+        entry['report'] = report_path
+        entry['output'] = report['info'].get('output')
+        entry['keywords'] = report['info'].get('keywords')
+        entry['stages'] = {stage['name']: stage['seconds'] for stage in report['stages']}
+    if entry['status'] != 'ok' and 'error' not in entry:
+        entry['error'] = last_error_line(log_path)
+    return entry
+
+def crash_entry(path, output_dir):
+    """워커 프로세스가 비정상 종료된 파일의 결과 항목"""
+    return {'input': path, 'output_dir': output_dir, 'log': os.path.join(output_dir, LOG_FILE),
+            'status': 'failed', 'exit_code': None,
+            'error': '워커 프로세스가 비정상 종료되었습니다 (메모리 부족 등)'}
+
+def run_pool(targets, options, jobs, on_result):
+    """워크북들을 프로세스 풀 하나에서 처리하고 끝나는 대로 on_result(항목) 호출
+
+    (워커 비정상 종료로 결과를 받지 못한 목록, Ctrl+C로 시작하지 못한 목록, 중지 요청 여부)를 반환합니다.
+    """
+    crashed = []
+    event = multiprocessing.Event()
+    executor = ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(event,))
+    futures = {executor.submit(process_workbook, path, output_dir, options): (path, output_dir)
+               for path, output_dir in targets}
+    pending = set(futures)
+    stopping = False
+    try:
+        while pending:
+            try:
+                for future in as_completed(pending):
+                    pending.discard(future)
+                    if future.cancelled():
+                        continue
+                    try:
+                        on_result(future.result())
+                    except BrokenProcessPool:
+                        crashed.append(futures[future])
+            except KeyboardInterrupt:
+                if stopping:
+                    raise
+                # 처리 중인 파일은 각 워커의 생성기가 현재 청크를 마친 뒤 취소하고, 시작 전인 파일은 건너뜀
+                print("\n⏹ 중지 요청: 처리 중인 파일을 취소하고 남은 파일은 건너뜁니다 (한 번 더 누르면 즉시 종료)")
+                stopping = True
+                event.set()
+                for future in pending:
+                    future.cancel()
+                pending = {future for future in pending if not future.cancelled()}
+    except BaseException:
+        executor.shutdown(wait=False, cancel_futures=True)
+        raise
+    executor.shutdown()
+    skipped = [futures[future] for future in futures if future.cancelled()]
+    return crashed, skipped, stopping
+
+def run_batch(targets, options, jobs, on_result):
+    """워크북들을 처리하고 끝나는 대로 on_result(항목) 호출, Ctrl+C로 건너뛴 목록 반환
+
+    워커가 비정상 종료되면 풀 전체가 멈추므로 결과를 받지 못한 파일은 새 풀에서 다시 처리하고,
+    두 번 이상 함께 실패한 파일은 원인을 가릴 수 있도록 하나씩 단독 프로세스에서 마지막으로 시도합니다.
+    """
+    failures = {}
+    isolated = []
+    remaining = list(targets)
+    while remaining:
+        crashed, skipped, stopping = run_pool(remaining, options, min(jobs, len(remaining)), on_result)
+        if stopping:
+            return skipped + crashed + isolated
+        remaining = []
+        for target in crashed:
+            failures[target] = failures.get(target, 0) + 1
+            (isolated if failures[target] >= CRASH_RETRIES else remaining).append(target)
+        if crashed:
+            print(f"  ↻ 워커 프로세스가 종료되어 {len(crashed):,}개 파일을 다시 처리합니다")
+
+    for path, output_dir in isolated:
+        print(f"  ↻ 단독 프로세스에서 다시 시도: {path}")
+        with ProcessPoolExecutor(max_workers=1, initializer=init_worker, initargs=(multiprocessing.Event(),)) as retry:
+            try:
+                on_result(retry.submit(process_workbook, path, output_dir, options).result())
+            except BrokenProcessPool:
+                on_result(crash_entry(path, output_dir))
+    return []
+
+def print_entry(entry, done, total):
+    """파일 하나의 처리 결과 한 줄 출력"""
+    name = os.path.basename(entry['input'])
+    seconds = f"{entry['seconds']:.1f}초" if 'seconds' in entry else '-'
+    if entry['status'] == 'ok':
+        keywords = f"{entry['keywords']:,}개" if entry.get('keywords') is not None else '계획만 출력'
+        print(f"[{done}/{total}] ✅ {name}: {keywords}, {seconds} → {entry.get('output') or entry['output_dir']}")
+    elif entry['status'] == 'cancelled':
+        print(f"[{done}/{total}] ⏹ {name}: 취소됨 ({seconds})")
+    elif entry['status'] == 'skipped':
+        print(f"[{done}/{total}] ⏭ {name}: 건너뜀")
+    else:
+        print(f"[{done}/{total}] ❌ {name}: {entry.get('error') or '실패'} ({seconds}, 로그: {entry['log']})")
+
+def split_options(argv):
+    """명령행을 일괄 처리 옵션과 '--' 뒤의 생성 옵션으로 나눔"""
+    if '--' in argv:
+        position = argv.index('--')
+        return argv[:position], argv[position + 1:]
+    return argv, []
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        description='여러 워크북 일괄 키워드 생성',
+        usage='%(prog)s SOURCE [SOURCE ...] [-o OUTPUT] [-j JOBS] [--report PATH] [-- 생성 옵션 ...]',
+        epilog="'--' 뒤의 옵션은 keyword_generator.py 옵션으로 모든 파일에 적용됩니다 (예: -- -f csv --quiet)",
+        allow_abbrev=False
+    )
+    parser.add_argument('sources', nargs='+', metavar='SOURCE',
+                        help='워크북 파일, 디렉토리(바로 아래 .xlsx) 또는 glob 패턴 (예: "clients/**/*.xlsx")')
+    parser.add_argument('-o', '--output', default=os.path.join('output', 'batch'),
+                        help='출력 디렉토리 (워크북마다 하위 디렉토리 생성, 기본값: output/batch)')
+    parser.add_argument('-j', '--jobs', type=int, default=min(4, os.cpu_count() or 1),
+                        help='동시에 처리할 워크북 수 (워커 프로세스 수, 기본값: CPU 수와 4 중 작은 값)')
+    parser.add_argument('--report', default=None, metavar='PATH',
+                        help='일괄 처리 보고서 JSON 경로 (기본값: <출력>/batch_<시각>.report.json)')
+    return parser, parser.parse_args(argv)
+
+def main(argv=None):
+    own, options = split_options(sys.argv[1:] if argv is None else argv)
+    parser, args = parse_arguments(own)
+
+    # 생성 옵션은 시작 전에 한 번 해석해 잘못된 옵션이면 바로 종료
+    for option in options:
+        if option.split('=', 1)[0] in RESERVED_OPTIONS:
+            parser.error(f"{option}: 일괄 처리에서는 파일마다 정해지는 옵션이라 생성 옵션으로 넘길 수 없습니다")
+    # 줄임 옵션(--out)이나 붙여 쓴 옵션(-oX)도 막도록 해석 결과로 확인
+    generator_args = parse_generator_arguments(['-i', 'batch', '-o', 'batch', *options])
+    if (generator_args.input, generator_args.output, generator_args.report, generator_args.profile) != \
+            ('batch', 'batch', None, None):
+        parser.error("입력/출력/보고서/프로파일 경로는 일괄 처리에서 파일마다 정해지는 옵션이라 "
+                     "생성 옵션으로 넘길 수 없습니다")
+    if args.jobs < 1:
+        parser.error("--jobs는 1 이상이어야 합니다")
+
+    workbooks = find_workbooks(args.sources)
+    if not workbooks:
+        print(f"❌ 처리할 워크북을 찾을 수 없습니다: {' '.join(args.sources)}")
+        return 1
+    targets = assign_output_dirs(workbooks, args.output)
+    jobs = min(args.jobs, len(targets))
+    os.makedirs(args.output, exist_ok=True)
+    report_path = args.report or os.path.join(
+        args.output, f"batch_{datetime.now().strftime('%Y%m%d_%H%M%S')}.report.json"
+    )
+
+    print("=== 일괄 키워드 생성 시작 ===")
+    print(f"워크북 {len(targets):,}개, 동시 처리 {jobs}개, 출력: {args.output}")
+    if options:
+        print(f"생성 옵션: {' '.join(options)}")
+
+    created = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+    started = time.perf_counter()
+    entries = {}
+
+    def on_result(entry):
+        entries[entry['input']] = entry
+        print_entry(entry, len(entries), len(targets))
+
+    skipped = run_batch(targets, options, jobs, on_result)
+    for path, output_dir in skipped:
+        entries.setdefault(path, {'input': path, 'output_dir': output_dir, 'status': 'skipped'})
+
+    # 보고서는 입력 순서대로 기록
+    files = [entries[path] for path, _ in targets if path in entries]
+    counts = {status: sum(entry['status'] == status for entry in files)
+              for status in ('ok', 'failed', 'cancelled', 'skipped')}
+    total_seconds = time.perf_counter() - started
+    report = {
+        'version': BATCH_REPORT_VERSION,
+        'created': created,
+        'command': sys.argv,
+        'sources': args.sources,
+        'output': args.output,
+        'jobs': jobs,
+        'options': options,
+        'total_seconds': round(total_seconds, 3),
+        'counts': counts,
+        'keywords': sum(entry.get('keywords') or 0 for entry in files),
+        'files': files
+    }
+    with open(report_path, 'w', encoding='utf-8') as f:
+        json.dump(report, f, ensure_ascii=False, indent=2)
+
+    print("\n=== 일괄 키워드 생성 결과 ===")
+    print(f"성공 {counts['ok']:,}개, 실패 {counts['failed']:,}개, 취소 {counts['cancelled']:,}개, "
+          f"건너뜀 {counts['skipped']:,}개 / 전체 {len(targets):,}개")
+    print(f"키워드 {report['keywords']:,}개, 소요 시간 {format_duration(total_seconds)}")
+    for entry in files:
+        if entry['status'] == 'failed':
+            print(f"  ❌ {entry['input']}: {entry.get('error') or '실패'}")
+    print(f"일괄 처리 보고서 저장: {report_path}")
+
+    if counts['cancelled'] or counts['skipped']:
+        return 130
+    return 1 if counts['failed'] else 0
+
+if __name__ == "__main__":
+    exit(main())
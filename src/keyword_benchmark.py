@@ -0,0 +1,338 @@
+#!/usr/bin/env python3
+"""
+키워드 생성 벤치마크 (합성 워크로드)
+
+resources/sample_template.xlsx와 같은 형식(1행 컬럼 번호, 2행 조합/그룹/카테고리 제목, 3행부터 규칙과 값)의
+합성 워크북을 컬럼 수, 컬럼별 값 수, 규칙 수, 규칙당 컬럼 수로 만들고, 로드/생성/출력 형식별 내보내기 단계의
+처리량과 최대 메모리(peak RSS)를 측정합니다. 단계마다 새 프로세스에서 실행하므로 앞 단계의 메모리가 섞이지 않습니다.
+
+결과는 --output으로 JSON 저장하고, --baseline으로 저장해 둔 결과와 비교해
+처리량이 줄거나 메모리가 늘어난 단계를 표시합니다.
+
+사용법:
+  python keyword_benchmark.py                                        # small 시나리오
+  python keyword_benchmark.py --scenario small medium --output bench.json
+  python keyword_benchmark.py --columns 12 --values 40 --rules 60 --arity 3
+  python keyword_benchmark.py --baseline bench.json --fail-on-regression
+"""
+
+import argparse
+import contextlib
+import io
+import itertools
+import json
+import multiprocessing
+import os
+import platform
+import sys
+import tempfile
+import time
+from datetime import datetime
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+from keyword_generator import (
+    RESULT_COLUMNS, generate_compact_results, iter_keyword_chunks, load_source_data, save_chunks
+)
+from output_sinks import OUTPUT_FORMATS, create_sink
+
+# 결과 JSON 형식 버전
+RESULT_VERSION = 1
+
+# 기본 제공 시나리오 (규칙마다 values ** arity개 키워드)
+SCENARIOS = {
+    'small': {'columns': 8, 'values': 20, 'rules': 20, 'arity': 3, 'groups': 4},
+    'medium': {'columns': 12, 'values': 40, 'rules': 40, 'arity': 3, 'groups': 6},
+    'large': {'columns': 16, 'values': 60, 'rules': 60, 'arity': 3, 'groups': 8},
+    'wide': {'columns': 12, 'values': 15, 'rules': 20, 'arity': 4, 'groups': 4},
+}
+
+# 합성 값을 만들 음절/단어 (실제 입력처럼 한글과 영문이 섞이도록)
+SYLLABLES = ['보', '톡', '스', '필', '러', '리', '프', '팅', '레', '이', '저', '피', '부', '관', '리', '강', '남']
+WORDS = ['clinic', 'laser', 'skin', 'care', 'best', 'price', 'review', 'near', 'me', 'lift', 'filler', 'botox']
+
+# 기준 결과 대비 이 비율 이상 느려지거나 메모리가 늘면 회귀로 표시 (기본값)
+REGRESSION_THRESHOLD = 0.1
+
+def synthetic_value(rng):
+    """한글 단어 또는 영문 단어 1~3개로 이루어진 합성 컬럼 값"""
+    if rng.random() < 0.5:
+        return ''.join(rng.choice(SYLLABLES, size=rng.integers(2, 6)))
+    return ' '.join(rng.choice(WORDS, size=rng.integers(1, 4)))
+
+def build_synthetic_rules(columns, rules, arity, rng):
+    """서로 다른 컬럼 arity개로 이루어진 조합 규칙 rules개 (가능한 조합 수를 넘으면 그만큼만)"""
+    arity = min(arity, columns)
+    available = list(itertools.permutations(range(1, columns + 1), arity))
+    order = rng.permutation(len(available))[:rules]
+    return [",".join(map(str, available[index])) for index in sorted(order)]
+
+def build_synthetic_workbook(path, columns, values, rules, arity, groups=4, seed=0):
+    """sample_template.xlsx 형식의 합성 워크북을 저장하고 (규칙 수, 예상 키워드 수) 반환"""
+    rng = np.random.default_rng(seed)
+    rule_strs = build_synthetic_rules(columns, rules, arity, rng)
+    column_values = []
+    for _ in range(columns):
+        unique = {}
+        while len(unique) < values:
+            unique.setdefault(synthetic_value(rng), None)
+        column_values.append(list(unique))
+
+    workbook = Workbook(write_only=True)
+    sheet = workbook.create_sheet('Sheet1')
+    sheet.append(['규칙', None] + list(range(1, columns + 1)))
+    sheet.append(['조합', '그룹'] + [f'카테고리{number}' for number in range(1, columns + 1)])
+    for row in range(max(len(rule_strs), values)):
+        rule = rule_strs[row] if row < len(rule_strs) else None
+        group = f'그룹{row % groups + 1}' if rule else None
+        sheet.append([rule, group] + [column[row] if row < values else None for column in column_values])
+    workbook.save(path)
+
+    keywords = len(rule_strs) * values ** min(arity, columns)
+    return len(rule_strs), keywords
+
+def peak_rss():
+    """이 프로세스와 종료된 자식 프로세스(병렬 워커) 중 가장 큰 최대 RSS (바이트, 측정할 수 없으면 None)"""
+    try:
+        import resource
+    except ImportError:
+        try:
+            import psutil
+        except ImportError:
+            return None
+        return getattr(psutil.Process().memory_info(), 'peak_wset', None)
+    # ru_maxrss 단위는 Linux에서 KB, macOS에서 바이트
+    scale = 1 if sys.platform == 'darwin' else 1024
+    return max(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss,
+               resource.getrusage(resource.RUSAGE_CHILDREN).ru_maxrss) * scale
+
+def directory_size(path):
+    """파일 또는 디렉토리(하위 파일 합계)의 크기 (바이트)"""
+    if os.path.isfile(path):
+        return os.path.getsize(path)
+    return sum(os.path.getsize(os.path.join(root, name)) for root, _, names in os.walk(path) for name in names)
+
+def run_stage(stage, source, work_dir, workers, chunk_size):
+    """로드한 입력으로 생성/내보내기 단계를 실행하고 (키워드 수, 출력 크기) 반환"""
+    df_data, column_numbers, category_titles = source
+    if stage in ('generate', 'generate_parallel'):
+        items = 0
+        for chunk in iter_keyword_chunks(df_data, column_numbers, category_titles, chunk_size,
+                                         workers=workers if stage == 'generate_parallel' else 1):
+            items += len(chunk)
+        return items, None
+
+    if stage == 'generate_compact':
+        return len(generate_compact_results(df_data, column_numbers, category_titles)), None
+
+    # 내보내기는 CLI와 같이 생성과 기록을 함께 스트리밍으로 측정
+    output_format = stage.split('_', 1)[1]
+    target = os.path.join(work_dir, 'output.xlsx' if output_format == 'xlsx' else 'output')
+    sink = create_sink(output_format, target, RESULT_COLUMNS, workers=workers)
+    chunks = iter_keyword_chunks(df_data, column_numbers, category_titles, chunk_size, workers=workers)
+    stats = save_chunks(chunks, sink)
+    return stats['total'], directory_size(target)
+
+def measure_stage(stage, workbook_path, work_dir, workers, chunk_size, queue):
+    """새 프로세스에서 단계를 실행하고 소요 시간과 최대 메모리를 queue로 전달
+
+    load 외의 단계는 입력을 읽은 뒤부터 측정하며, base_rss는 측정 시작 시점의 최대 RSS입니다.
+    """
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            if stage == 'load':
+                base_rss = peak_rss()
+                start = time.perf_counter()
+                df_data, _, _ = load_source_data(workbook_path, cache_dir=None)
+                items, output_bytes = len(df_data), None
+            else:
+                source = load_source_data(workbook_path, cache_dir=None)
+                base_rss = peak_rss()
+                start = time.perf_counter()
+                items, output_bytes = run_stage(stage, source, work_dir, workers, chunk_size)
+            seconds = time.perf_counter() - start
+        queue.put({
+            'seconds': seconds,
+            'items': items,
+            'base_rss': base_rss,
+            'peak_rss': peak_rss(),
+            'output_bytes': output_bytes
+        })
+    except Exception as e:
+        queue.put({'error': f"{type(e).__name__}: {e}"})
+
+def run_isolated(stage, workbook_path, work_dir, workers, chunk_size):
+    """단계를 별도 프로세스(spawn)에서 실행해 측정 결과 반환"""
+    context = multiprocessing.get_context('spawn')
+    queue = context.Queue()
+    stage_dir = tempfile.mkdtemp(prefix=f'{stage}_', dir=work_dir)
+    process = context.Process(target=measure_stage, args=(stage, workbook_path, stage_dir, workers, chunk_size, queue))
+    process.start()
+    result = queue.get()
+    process.join()
+    return result
+
+def stage_names(formats, workers):
+    """측정할 단계 이름 목록"""
+    stages = ['load', 'generate', 'generate_compact']
+    if workers > 1:
+        stages.append('generate_parallel')
+    return stages + [f'export_{output_format}' for output_format in formats]
+
+def run_scenario(name, params, formats, workers, chunk_size, repeat, work_dir):
+    """시나리오 하나의 합성 워크북을 만들고 단계별 측정 결과 반환 (repeat번 중 가장 빠른 시간 사용)"""
+    workbook_path = os.path.join(work_dir, f'{name}.xlsx')
+    rules, keywords = build_synthetic_workbook(workbook_path, **params)
+    scenario = {'name': name, 'params': dict(params), 'rules': rules, 'keywords': keywords, 'stages': []}
+
+    for stage in stage_names(formats, workers):
+        runs = [run_isolated(stage, workbook_path, work_dir, workers, chunk_size) for _ in range(repeat)]
+        errors = [run['error'] for run in runs if 'error' in run]
+        if errors:
+            scenario['stages'].append({'stage': stage, 'error': errors[0]})
+            print(f"  {stage:<20} 실패: {errors[0]}")
+            continue
+        best = min(runs, key=lambda run: run['seconds'])
+        entry = {
+            'stage': stage,
+            'unit': 'rows' if stage == 'load' else 'keywords',
+            'items': best['items'],
+            'seconds': round(best['seconds'], 4),
+            'all_seconds': [round(run['seconds'], 4) for run in runs],
+            'throughput': round(best['items'] / best['seconds'], 1) if best['seconds'] else None,
+            'base_rss': best['base_rss'],
+            'peak_rss': max((run['peak_rss'] or 0) for run in runs) or None,
+            'output_bytes': best['output_bytes']
+        }
+        scenario['stages'].append(entry)
+        print_stage(entry)
+    return scenario
+
+def format_mb(value):
+    return f"{value / 1024 / 1024:,.1f}" if value else '-'
+
+def print_stage(entry):
+    print(f"  {entry['stage']:<20}{entry['seconds']:>10.2f}{entry['throughput'] or 0:>14,.0f}"
+          f"{format_mb(entry['peak_rss']):>12}{format_mb(entry['output_bytes']):>12}")
+
+def machine_info():
+    """결과를 비교할 때 참고할 실행 환경 정보"""
+    return {
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpu_count': os.cpu_count(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__
+    }
+
+def compare_with_baseline(results, baseline, threshold=REGRESSION_THRESHOLD):
+    """같은 시나리오/단계끼리 처리량과 최대 메모리를 비교한 행 목록과 회귀 수 반환
+
+    처리량이 기준보다 threshold 비율 이상 줄거나 최대 메모리가 threshold 비율 이상 늘면 회귀로 봅니다.
+    """
+    baseline_stages = {
+        (scenario['name'], entry['stage']): entry
+        for scenario in baseline.get('scenarios', []) for entry in scenario['stages'] if 'error' not in entry
+    }
+    rows = []
+    regressions = 0
+    for scenario in results['scenarios']:
+        for entry in scenario['stages']:
+            previous = baseline_stages.get((scenario['name'], entry['stage']))
+            if previous is None or 'error' in entry:
+                continue
+            speed = entry['throughput'] / previous['throughput'] if previous['throughput'] else None
+            memory = entry['peak_rss'] / previous['peak_rss'] if entry['peak_rss'] and previous['peak_rss'] else None
+            regressed = (speed is not None and speed < 1 - threshold) or (memory is not None and memory > 1 + threshold)
+            regressions += regressed
+            rows.append((scenario['name'], entry['stage'], speed, memory, regressed))
+    return rows, regressions
+
+def print_comparison(rows):
+    print(f"\n{'시나리오':<10}{'단계':<20}{'처리량':>10}{'메모리':>10}")
+    for name, stage, speed, memory, regressed in rows:
+        speed_text = f"{speed:.2f}x" if speed is not None else '-'
+        memory_text = f"{memory:.2f}x" if memory is not None else '-'
+        print(f"{name:<10}{stage:<20}{speed_text:>10}{memory_text:>10}{'  ⚠️ 회귀' if regressed else ''}")
+
+def parse_arguments():
+    parser = argparse.ArgumentParser(
+        description='키워드 생성 벤치마크 (합성 워크로드)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="시나리오: " + ", ".join(
+            f"{name}({', '.join(f'{key}={value}' for key, value in params.items())})"
+            for name, params in SCENARIOS.items()
+        )
+    )
+    parser.add_argument('--scenario', nargs='+', choices=list(SCENARIOS), default=None,
+                        help='실행할 기본 제공 시나리오 (기본값: small)')
+    parser.add_argument('--columns', type=int, default=None, help='사용자 지정 시나리오의 컬럼 수')
+    parser.add_argument('--values', type=int, default=None, help='사용자 지정 시나리오의 컬럼별 값 수')
+    parser.add_argument('--rules', type=int, default=None, help='사용자 지정 시나리오의 조합 규칙 수')
+    parser.add_argument('--arity', type=int, default=None, help='사용자 지정 시나리오의 규칙당 컬럼 수')
+    parser.add_argument('--groups', type=int, default=None, help='사용자 지정 시나리오의 그룹 수')
+    parser.add_argument('--seed', type=int, default=0, help='합성 데이터 난수 시드 (기본값: 0)')
+    parser.add_argument('--formats', nargs='+', choices=OUTPUT_FORMATS, default=OUTPUT_FORMATS,
+                        help='측정할 출력 형식 (기본값: 전체)')
+    parser.add_argument('-w', '--workers', type=int, default=1,
+                        help='병렬 생성/xlsx 직렬화 프로세스 수 (2 이상이면 generate_parallel 단계 추가)')
+    parser.add_argument('--chunk-size', type=int, default=100_000, help='청크당 행 수 (기본값: 100000)')
+    parser.add_argument('--repeat', type=int, default=1, help='단계별 반복 횟수 (가장 빠른 결과 사용, 기본값: 1)')
+    parser.add_argument('-o', '--output', default=None, help='결과 JSON 저장 경로')
+    parser.add_argument('--baseline', default=None, help='비교할 기준 결과 JSON')
+    parser.add_argument('--threshold', type=float, default=REGRESSION_THRESHOLD,
+                        help=f'회귀로 표시할 변화 비율 (기본값: {REGRESSION_THRESHOLD})')
+    parser.add_argument('--fail-on-regression', action='store_true', help='회귀가 있으면 종료 코드 1로 종료')
+    return parser.parse_args()
+
+def main():
+    args = parse_arguments()
+
+    scenarios = {name: SCENARIOS[name] for name in args.scenario or []}
+    custom = {key: getattr(args, key) for key in ('columns', 'values', 'rules', 'arity', 'groups')}
+    if any(value is not None for value in custom.values()):
+        defaults = SCENARIOS['small']
+        scenarios['custom'] = {key: defaults[key] if value is None else value for key, value in custom.items()}
+    if not scenarios:
+        scenarios['small'] = SCENARIOS['small']
+
+    results = {
+        'version': RESULT_VERSION,
+        'created': datetime.now().strftime("%Y-%m-%d %H:%M:%S"),
+        'machine': machine_info(),
+        'settings': {'workers': args.workers, 'chunk_size': args.chunk_size, 'repeat': args.repeat,
+                     'seed': args.seed},
+        'scenarios': []
+    }
+
+    with tempfile.TemporaryDirectory() as work_dir:
+        for name, params in scenarios.items():
+            params = dict(params, seed=args.seed)
+            print(f"\n=== {name}: " + ", ".join(f"{key}={value}" for key, value in params.items()) + " ===")
+            print(f"  {'단계':<20}{'시간(초)':>10}{'처리량(/초)':>14}{'최대 RSS(MB)':>12}{'출력(MB)':>12}")
+            results['scenarios'].append(
+                run_scenario(name, params, args.formats, args.workers, args.chunk_size, args.repeat, work_dir)
+            )
+
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            json.dump(results, f, ensure_ascii=False, indent=2)
+        print(f"\n결과 저장: {args.output}")
+
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as f:
+            baseline = json.load(f)
+        for key in ('settings', 'machine'):
+            if baseline.get(key) != results[key]:
+                print(f"\n⚠️ 기준 결과와 {key}가 다릅니다: {baseline.get(key)}")
+        rows, regressions = compare_with_baseline(results, baseline, args.threshold)
+        print_comparison(rows)
+        print(f"\n기준 결과 대비 회귀: {regressions}개 단계")
+        if regressions and args.fail_on_regression:
+            return 1
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -1,34 +1,190 @@
 import pandas as pd
+import numpy as np
+import contextlib
+import hashlib
+import io
 import itertools
 import os
+import re
+import signal
 import argparse
+import threading
+import cProfile
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
 from datetime import datetime
 
-def load_source_data(file_path):
+from openpyxl import load_workbook
+
+from output_manifest import (
+    OutputManifest, RuleOutputCache, hash_text, hash_values, manifest_path_for, rule_cache_dir_for
+)
+from output_sinks import COMPRESSIONS, DASHBOARD_NAME, OUTPUT_FORMATS, create_sink
+from run_report import RunReport
+
+# 파싱된 입력 워크북 캐시 디렉토리 (환경 변수로 변경 가능)
+DEFAULT_CACHE_DIR = os.environ.get(
+    'KEYWORD_GENERATOR_CACHE_DIR',
+    os.path.join(os.path.expanduser('~'), '.cache', 'keyword_generator')
+)
+
+# 캐시에 보관할 최대 워크북 수 (오래된 것부터 삭제)
+CACHE_MAX_FILES = 32
+
+def read_source_bytes(source):
+    """파일 경로, 바이트, 파일 객체(업로드 파일 등)에서 원본 바이트 읽기"""
+    if isinstance(source, (bytes, bytearray)):
+        return bytes(source)
+    if isinstance(source, (str, os.PathLike)):
+        with open(source, 'rb') as f:
+            return f.read()
+    if hasattr(source, 'getvalue'):
+        return source.getvalue()
+    source.seek(0)
+    return source.read()
+
+def content_hash(data):
+    """파일 내용의 SHA-256 해시 (캐시 키)"""
+    return hashlib.sha256(data).hexdigest()
+
+def convert_cell(value):
+    """openpyxl 셀 값을 pd.read_excel과 같은 형태로 변환"""
+    if value is None or value == '':
+        return np.nan
+    # 정수로 표현되는 실수는 int로 (pd.read_excel과 동일)
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+def find_sheet_name(sheet_names, candidates):
+    """시트 이름 목록에서 candidates 중 하나와 같은(대소문자/앞뒤 공백 무시) 첫 시트 이름 (없으면 None)"""
+    wanted = {name.casefold() for name in candidates}
+    return next((name for name in sheet_names if name.strip().casefold() in wanted), None)
+
+def read_workbook_raw(data, sheet_names=None):
+    """첫 번째 시트의 사용 범위만 read-only 모드로 읽어 header 없는 DataFrame으로 반환
+    
+    pd.read_excel(header=None)과 같은 결과를 만들되, 셀을 스트리밍으로 순회하고
+    다른 시트는 읽지 않습니다. xlsx가 아닌 파일(.xls)은 pd.read_excel을 사용합니다.
+    sheet_names를 주면 그 이름의 시트를 읽고, 해당 시트가 없으면 빈 DataFrame을 반환합니다.
+    """
+    if not data.startswith(b'PK'):
+        if sheet_names is None:
+            return pd.read_excel(io.BytesIO(data), header=None)
+        with pd.ExcelFile(io.BytesIO(data)) as excel_file:
+            sheet_name = find_sheet_name(excel_file.sheet_names, sheet_names)
+            if sheet_name is None:
+                return pd.DataFrame()
+            return excel_file.parse(sheet_name, header=None)
+    
+    workbook = load_workbook(io.BytesIO(data), read_only=True, data_only=True)
+    try:
+        if sheet_names is None:
+            worksheet = workbook.worksheets[0]
+        else:
+            sheet_name = find_sheet_name(workbook.sheetnames, sheet_names)
+            if sheet_name is None:
+                return pd.DataFrame()
+            worksheet = workbook[sheet_name]
+        rows = []
+        width = 0
+        last_used_row = 0
+        for row in worksheet.iter_rows(values_only=True):
+            row = [convert_cell(value) for value in row]
+            # 행 끝의 빈 셀은 사용 범위에서 제외
+            used = len(row)
+            while used and row[used - 1] is np.nan:
+                used -= 1
+            rows.append(row[:used])
+            if used:
+                width = max(width, used)
+                last_used_row = len(rows)
+    finally:
+        workbook.close()
+    
+    # 마지막 사용 행 이후의 빈 행은 제외
+    rows = [row + [np.nan] * (width - len(row)) for row in rows[:last_used_row]]
+    return pd.DataFrame(rows, columns=range(width))
+
+def load_raw_workbook(source, cache_dir=DEFAULT_CACHE_DIR, sheet_names=None):
+    """원본 워크북을 읽어 header 없는 DataFrame 반환 (내용 해시 기준 디스크 캐시 사용)
+    
+    같은 내용의 파일을 다시 읽으면 파싱을 건너뛰고 캐시된 결과를 사용합니다.
+    cache_dir이 None이면 캐시를 사용하지 않습니다. (df_raw, 캐시 적중 여부)를 반환합니다.
+    sheet_names를 주면 첫 번째 시트 대신 그 이름의 시트를 읽습니다 (read_workbook_raw 참고).
+    """
+    data = read_source_bytes(source)
+    if cache_dir is None:
+        return read_workbook_raw(data, sheet_names), False
+    
+    cache_key = content_hash(data)
+    if sheet_names is not None:
+        cache_key = f"{cache_key}.{content_hash(','.join(sheet_names).encode('utf-8'))[:12]}"
+    cache_path = os.path.join(cache_dir, f"{cache_key}.pkl")
+    if os.path.exists(cache_path):
+        try:
+            df_raw = pd.read_pickle(cache_path)
+            # 최근 사용 순으로 정리되도록 수정 시각 갱신
+            os.utime(cache_path)
+            return df_raw, True
+        except Exception:
+            pass
+    
+    df_raw = read_workbook_raw(data, sheet_names)
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        # 다른 프로세스가 덜 쓴 파일을 읽지 않도록 임시 파일에 쓴 뒤 교체
+        temp_path = f"{cache_path}.{os.getpid()}.tmp"
+        df_raw.to_pickle(temp_path)
+        os.replace(temp_path, cache_path)
+        prune_cache(cache_dir)
+    except OSError as e:
+        print(f"캐시 저장 실패 (무시하고 계속): {e}")
+    return df_raw, False
+
+def prune_cache(cache_dir, max_files=CACHE_MAX_FILES):
+    """캐시 파일이 max_files개를 넘으면 오래 사용하지 않은 것부터 삭제"""
+    entries = [os.path.join(cache_dir, name) for name in os.listdir(cache_dir) if name.endswith('.pkl')]
+    if len(entries) <= max_files:
+        return
+    entries.sort(key=os.path.getmtime)
+    for path in entries[:len(entries) - max_files]:
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+def split_source_data(df_raw):
+    """원본 DataFrame을 (데이터, 컬럼 번호 목록, 카테고리 제목 목록)으로 분리"""
+    # First row (Excel row 1): Column numbers
+    column_numbers = df_raw.iloc[0].tolist()
+    
+    # Second row (Excel row 2): Category titles
+    category_titles = df_raw.iloc[1].tolist()
+    
+    # Actual data starts from row 3 (index 2)
+    df_data = df_raw.iloc[2:].reset_index(drop=True)
+    
+    # Set column names to category titles
+    df_data.columns = category_titles
+    
+    return df_data, column_numbers, category_titles
+
+def load_source_data(file_path, cache_dir=DEFAULT_CACHE_DIR):
     """Load and preprocess source Excel file"""
     try:
         if not os.path.exists(file_path):
             print(f"File not found: {file_path}")
             return None, None, None
             
-        # Read with header=None to get raw data
-        df_raw = pd.read_excel(file_path, header=None)
-        print(f"Raw data loaded: {df_raw.shape}")
+        # Read with header=None to get raw data (cached by file content hash)
+        df_raw, cache_hit = load_raw_workbook(file_path, cache_dir)
+        print(f"Raw data loaded: {df_raw.shape}{' (cache)' if cache_hit else ''}")
         
-        # First row (Excel row 1): Column numbers
-        column_numbers = df_raw.iloc[0].tolist()
+        df_data, column_numbers, category_titles = split_source_data(df_raw)
         print(f"Column numbers: {column_numbers}")
-        
-        # Second row (Excel row 2): Category titles
-        category_titles = df_raw.iloc[1].tolist()
         print(f"Category titles: {category_titles}")
-        
-        # Actual data starts from row 3 (index 2)
-        df_data = df_raw.iloc[2:].reset_index(drop=True)
-        
-        # Set column names to category titles
-        df_data.columns = category_titles
-        
         print(f"Data shape: {df_data.shape}")
         print(f"Column names: {df_data.columns.tolist()}")
         
@@ -64,12 +220,73 @@ def get_column_values(df, col_index, category_titles):
         return unique_values
     return []
 
-def generate_keyword_combinations(df_data, column_numbers, category_titles):
-    """모든 조합 규칙에 따라 키워드 조합 생성"""
-    results = []
+# 한국어 띄어쓰기 정규화 방식
+KOREAN_SPACING_MODES = ['keep', 'join', 'split']
+
+# 한글 음절 사이의 공백 / 한글과 영문·숫자의 경계
+HANGUL_GAP = re.compile(r'(?<=[가-힣])\s+(?=[가-힣])')
+HANGUL_BOUNDARY = re.compile(r'(?<=[가-힣])(?=[A-Za-z0-9])|(?<=[A-Za-z0-9])(?=[가-힣])')
+
+class ValueNormalizer:
+    """컬럼 값 정규화 (컬럼 인덱스를 만들 때 값마다 한 번만 적용)
+    
+    collapse_whitespace: 앞뒤 공백 제거, 연속 공백/탭/줄바꿈을 공백 하나로
+    case_fold: 대소문자 구분 제거 (str.casefold)
+    korean_spacing: 'keep'(그대로), 'join'(한글 음절 사이 공백 제거, "보톡스 가격" -> "보톡스가격"),
+                    'split'(한글과 영문·숫자 사이에 공백, "보톡스100유닛" -> "보톡스 100 유닛")
+    
+    정규화 후 같아진 값은 하나로 합쳐지므로 조합 수도 함께 줄어듭니다.
+    """
+    
+    def __init__(self, collapse_whitespace=True, case_fold=False, korean_spacing='keep'):
+        if korean_spacing not in KOREAN_SPACING_MODES:
+            raise ValueError(f"지원하지 않는 한국어 띄어쓰기 방식: {korean_spacing}")
+        self.collapse_whitespace = collapse_whitespace
+        self.case_fold = case_fold
+        self.korean_spacing = korean_spacing
+        self.values_in = 0
+        self.values_out = 0
+    
+    def __call__(self, value):
+        if self.collapse_whitespace:
+            value = " ".join(value.split())
+        if self.case_fold:
+            value = value.casefold()
+        if self.korean_spacing == 'join':
+            value = HANGUL_GAP.sub('', value)
+        elif self.korean_spacing == 'split':
+            value = HANGUL_BOUNDARY.sub(' ', value)
+        return value
+    
+    def normalize_values(self, values):
+        """값 목록을 정규화하고 빈 값과 정규화 후 중복된 값을 제거 (처음 나온 순서 유지)"""
+        normalized = [value for value in dict.fromkeys(self(value) for value in values) if value.strip()]
+        self.values_in += len(values)
+        self.values_out += len(normalized)
+        return normalized
+    
+    def describe(self):
+        options = []
+        if self.collapse_whitespace:
+            options.append('공백 정리')
+        if self.case_fold:
+            options.append('대소문자 통일')
+        if self.korean_spacing != 'keep':
+            options.append(f"한국어 띄어쓰기 {self.korean_spacing}")
+        return ", ".join(options) or '없음'
+
+# 스트리밍 생성 시 청크당 기본 행 수
+DEFAULT_CHUNK_SIZE = 100_000
+
+# 결과 데이터의 컬럼 순서
+RESULT_COLUMNS = ['rule', 'group', 'columns', 'keyword', 'components']
+
+def build_rule_group_mapping(df_data, verbose=True):
+    """조합 규칙(A열)과 그룹(B열)으로 규칙-그룹 매핑 생성"""
     rule_group_mapping = {}
     
-    print("\n=== 조합 규칙-그룹 매핑 ===")
+    if verbose:
+        print("\n=== 조합 규칙-그룹 매핑 ===")
     for idx, row in df_data.iterrows():
         rule = row.iloc[0]  # 조합 규칙 (A열)
         group = row.iloc[1]  # 그룹 (B열)
@@ -79,21 +296,81 @@ def generate_keyword_combinations(df_data, column_numbers, category_titles):
             if pd.isna(group) or str(group).strip() == '':
                 group = 'ungrouped'
             rule_group_mapping[str(rule)] = str(group)
-            print(f"  {rule} -> {group}")
+            if verbose:
+                print(f"  {rule} -> {group}")
     
-    print(f"총 {len(rule_group_mapping)}개 매핑")
+    if verbose:
+        print(f"총 {len(rule_group_mapping)}개 매핑")
+    return rule_group_mapping
+
+def build_column_index(df_data, category_titles, normalizer=None):
+    """컬럼 번호(규칙 번호) -> 정리된 컬럼 값 인덱스를 한 번만 생성
     
-    print("\n=== 데이터 구조 확인 ===")
-    print("컬럼 번호와 카테고리 매핑:")
-    for i, (col_num, category) in enumerate(zip(column_numbers, category_titles)):
-        if pd.notna(col_num) and pd.notna(category):
-            print(f"  {col_num} -> {category}")
+    각 항목은 컬럼명, 중복과 빈 값을 제거한 뒤 문자열로 변환한 값 목록,
+    값별 글자 수/UTF-8 바이트 수와 그 합계를 담고 있어 생성기, 계획, 웹앱이
+    규칙마다 고유값을 다시 계산하지 않고 그대로 사용합니다.
+    normalizer(ValueNormalizer)를 주면 값을 정규화한 뒤 다시 중복을 제거합니다.
+    """
+    column_index = {}
+    # 조합/그룹 컬럼(0, 1번 인덱스) 다음부터가 1번 컬럼
+    for col_index in range(2, len(category_titles)):
+        col_values = get_column_values(df_data, col_index, category_titles)
+        if not col_values:
+            continue
+        values = [str(item) for item in col_values]
+        if normalizer is not None:
+            values = normalizer.normalize_values(values)
+            if not values:
+                continue
+        lengths = [len(value) for value in values]
+        byte_lengths = [len(value.encode('utf-8')) for value in values]
+        column_index[col_index - 1] = {
+            'name': category_titles[col_index],
+            'values': values,
+            'lengths': lengths,
+            'byte_lengths': byte_lengths,
+            'total_length': sum(lengths),
+            'total_bytes': sum(byte_lengths),
+            'wide': any(not value.isascii() for value in values)
+        }
+    return column_index
+
+def resolve_rule_columns(column_index, rule_numbers, verbose=True):
+    """규칙 번호 목록에 해당하는 컬럼 인덱스 항목 목록 반환 (값이 없는 컬럼은 제외)"""
+    entries = []
+    
+    for rule_num in rule_numbers:
+        # rule_num은 1부터 시작하는 컬럼 번호
+        entry = column_index.get(rule_num)
+        if entry:
+            entries.append(entry)
+            if verbose:
+                print(f"  컬럼 번호 {rule_num} ({entry['name']}): {len(entry['values'])}개 값")
     
-    print(f"\n총 {len(rule_group_mapping)}개의 조합 규칙 처리 시작...")
+    return entries
+
+def iter_rule_specs(df_data, column_numbers, category_titles, column_index=None, verbose=True):
+    """처리할 조합 규칙마다 (규칙, 그룹, 컬럼명 목록, 문자열 값 목록, 컬럼 번호 튜플)을 반환하는 제너레이터
+    
+    verbose가 False면 규칙마다 출력하던 진행 상황을 출력하지 않습니다 (CLI --quiet).
+    """
+    rule_group_mapping = build_rule_group_mapping(df_data, verbose)
+    if column_index is None:
+        column_index = build_column_index(df_data, category_titles)
+    
+    if verbose:
+        print("\n=== 데이터 구조 확인 ===")
+        print("컬럼 번호와 카테고리 매핑:")
+        for i, (col_num, category) in enumerate(zip(column_numbers, category_titles)):
+            if pd.notna(col_num) and pd.notna(category):
+                print(f"  {col_num} -> {category}")
+        
+        print(f"\n총 {len(rule_group_mapping)}개의 조합 규칙 처리 시작...")
     
     for rule_str, group in rule_group_mapping.items():
-        print(f"\n조합 규칙 '{rule_str}' 처리 중...")
-        print(f"  그룹: {group}")
+        if verbose:
+            print(f"\n조합 규칙 '{rule_str}' 처리 중...")
+            print(f"  그룹: {group}")
         
         # 조합 규칙 파싱
         rule_numbers = parse_combination_rule(rule_str)
@@ -101,51 +378,1842 @@ def generate_keyword_combinations(df_data, column_numbers, category_titles):
             continue
         
         # 각 규칙 번호에 해당하는 컬럼 값들 가져오기
-        column_values_list = []
-        column_names = []
-        
-        for rule_num in rule_numbers:
-            # rule_num은 1부터 시작하는 컬럼 번호
-            # category_titles에서 찾기 위해 인덱스 조정
-            col_values = get_column_values(df_data, rule_num + 1, category_titles)  # +1은 조합/그룹 컬럼 때문
-            if col_values:
-                column_values_list.append(col_values)
-                # 컬럼명 찾기
-                if rule_num + 1 < len(category_titles):
-                    col_name = category_titles[rule_num + 1]
-                    column_names.append(col_name)
-                    print(f"  컬럼 번호 {rule_num} ({col_name}): {len(col_values)}개 값")
-        
-        if not column_values_list:
+        entries = resolve_rule_columns(column_index, rule_numbers, verbose)
+        if not entries:
             continue
         
-        # 카테시안 곱으로 모든 조합 생성
-        combinations = list(itertools.product(*column_values_list))
-        print(f"  생성된 조합: {len(combinations)}개")
+        str_values_list = [entry['values'] for entry in entries]
+        column_keys = tuple(rule_num for rule_num in rule_numbers if rule_num in column_index)
+        if verbose:
+            print(f"  생성된 조합: {count_combinations(str_values_list)}개")
+        yield rule_str, group, [entry['name'] for entry in entries], str_values_list, column_keys
+
+def count_combinations(column_values_list):
+    """조합을 생성하지 않고 카테시안 곱의 크기만 계산"""
+    total = 1
+    for col_values in column_values_list:
+        total *= len(col_values)
+    return total
+
+# 출력 크기 추정 계수: CSV 텍스트 대비 압축 결과 크기 (샘플 워크북 실측 기반 근사치)
+XLSX_SIZE_RATIO = 0.2
+PARQUET_SIZE_RATIO = 0.15
+
+# JSON Lines 한 행의 고정 부분: {"rule":"","group":"","columns":"","keyword":"","components":""}\n
+JSONL_ROW_OVERHEAD = 66
+
+# 파이썬 str 객체 고정 크기 (ASCII / 비ASCII)
+STR_OBJECT_OVERHEAD = 49
+WIDE_STR_OBJECT_OVERHEAD = 74
+
+def plan_rule(rule_str, group, entries, limits=None):
+    """조합을 생성하지 않고 컬럼 인덱스의 값 개수와 길이만으로 규칙의 출력 규모 계산
+    
+    각 값은 다른 컬럼 값 개수의 곱만큼 반복되므로 키워드 전체 길이도 정확히 구할 수 있습니다.
+    limits(KeywordLimits)를 주면 키워드 수와 글자 수는 상한을 적용해 정확히 계산하고,
+    바이트 수는 글자당 평균 바이트로 근사합니다.
+    """
+    keywords = count_combinations([entry['values'] for entry in entries])
+    keyword_chars = 0
+    keyword_bytes = 0
+    for entry in entries:
+        repeat = keywords // len(entry['values'])
+        keyword_chars += entry['total_length'] * repeat
+        keyword_bytes += entry['total_bytes'] * repeat
+    wide = any(entry['wide'] for entry in entries)
+    column_names = [entry['name'] for entry in entries]
+    
+    # 구분자: keyword는 " ", components는 " | "
+    separators = (len(entries) - 1) * keywords
+    keyword_chars += separators
+    keyword_bytes += separators
+    if limits and keywords:
+        bytes_per_char = keyword_bytes / keyword_chars if keyword_chars else 1
+        keywords, keyword_chars = limits.count([entry['values'] for entry in entries])
+        keyword_bytes = int(keyword_chars * bytes_per_char)
+        separators = (len(entries) - 1) * keywords
+    components_chars = keyword_chars + 2 * separators
+    components_bytes = keyword_bytes + 2 * separators
+    
+    columns_str = ", ".join(column_names)
+    fixed_bytes = sum(len(value.encode('utf-8')) for value in (rule_str, group, columns_str))
+    text_bytes = keywords * fixed_bytes + keyword_bytes + components_bytes
+    
+    # 메모리: 행마다 keyword/components str 객체 2개와 5개 컬럼의 객체 포인터
+    overhead = WIDE_STR_OBJECT_OVERHEAD if wide else STR_OBJECT_OVERHEAD
+    char_size = 2 if wide else 1
+    memory_bytes = keywords * (2 * overhead + 5 * 8) + (keyword_chars + components_chars) * char_size
+    
+    # CSV/TSV: 구분자 4개와 줄바꿈, 쉼표가 들어간 값(규칙 "1,2", columns 등)의 따옴표
+    quoted = sum(',' in value for value in (rule_str, group, columns_str))
+    csv_bytes = text_bytes + keywords * (5 + 2 * quoted)
+    return {
+        'rule': rule_str,
+        'group': group,
+        'columns': columns_str,
+        'keywords': keywords,
+        'avg_keyword_length': keyword_chars / keywords if keywords else 0,
+        'csv_bytes': csv_bytes,
+        'jsonl_bytes': text_bytes + keywords * JSONL_ROW_OVERHEAD,
+        'memory_bytes': memory_bytes
+    }
+
+def plan_keyword_generation(df_data, column_numbers, category_titles, chunk_size=DEFAULT_CHUNK_SIZE, workers=1,
+                            column_index=None, limits=None, constraints=None):
+    """키워드를 생성하지 않고 규칙/그룹별 키워드 수와 출력 크기, 최대 메모리를 추정
+    
+    컬럼 값 개수와 길이만 사용하므로 조합 수와 관계없이 즉시 계산됩니다.
+    제약조건(constraints)은 조합 수 계산에 반영되지 않으므로 이때의 키워드 수는 최대치입니다.
+    """
+    rule_group_mapping = build_rule_group_mapping(df_data, verbose=False)
+    if column_index is None:
+        column_index = build_column_index(df_data, category_titles)
+    rule_plans = []
+    group_keywords = {}
+    
+    for rule_str, group in rule_group_mapping.items():
+        rule_numbers = parse_combination_rule(rule_str)
+        if not rule_numbers:
+            continue
+        entries = resolve_rule_columns(column_index, rule_numbers, verbose=False)
+        if not entries:
+            continue
+        rule_plan = plan_rule(rule_str, group, entries, limits)
+        rule_plans.append(rule_plan)
+        group_keywords[group] = group_keywords.get(group, 0) + rule_plan['keywords']
+    
+    total_keywords = sum(rule_plan['keywords'] for rule_plan in rule_plans)
+    csv_bytes = sum(rule_plan['csv_bytes'] for rule_plan in rule_plans)
+    memory_bytes = sum(rule_plan['memory_bytes'] for rule_plan in rule_plans)
+    
+    # 스트리밍: 동시에 메모리에 있는 청크 수만큼의 행 (병렬이면 진행 중 청크 포함)
+    bytes_per_row = memory_bytes / total_keywords if total_keywords else 0
+    chunks_in_memory = 1 + (workers * 2 if workers > 1 else 0)
+    streaming_memory = bytes_per_row * min(total_keywords, chunk_size * chunks_in_memory)
+    
+    return {
+        'rules': rule_plans,
+        'groups': group_keywords,
+        'total_keywords': total_keywords,
+        'limits': limits.describe() if limits else None,
+        'constraints': len(constraints) if constraints else 0,
+        'output_bytes': {
+            'xlsx': int(csv_bytes * XLSX_SIZE_RATIO),
+            'csv': csv_bytes,
+            'tsv': csv_bytes,
+            'jsonl': sum(rule_plan['jsonl_bytes'] for rule_plan in rule_plans),
+            'parquet': int(csv_bytes * PARQUET_SIZE_RATIO)
+        },
+        # 전체 DataFrame 생성 시에는 청크를 합치는 동안 결과가 두 벌 존재
+        'peak_memory': {
+            'in_memory': memory_bytes * 2,
+            'streaming': int(streaming_memory)
+        }
+    }
+
+def format_bytes(bytes_size):
+    """바이트를 읽기 쉬운 형태로 변환"""
+    for unit in ['B', 'KB', 'MB', 'GB']:
+        if bytes_size < 1024.0:
+            return f"{bytes_size:.2f} {unit}"
+        bytes_size /= 1024.0
+    return f"{bytes_size:.2f} TB"
+
+def print_generation_plan(plan):
+    """생성 계획(예상 규모) 출력"""
+    print("\n=== 생성 계획 (예상 규모) ===")
+    print("규칙별 키워드 수:")
+    for rule_plan in plan['rules']:
+        print(f"  {rule_plan['rule']} [{rule_plan['group']}]: {rule_plan['keywords']:,}개 "
+              f"(평균 {rule_plan['avg_keyword_length']:.1f}자)")
+    
+    print("\n그룹별 키워드 수:")
+    for group, keywords in plan['groups'].items():
+        print(f"  {group}: {keywords:,}개")
+    
+    print(f"\n총 키워드 수: {plan['total_keywords']:,}개")
+    if plan.get('limits'):
+        print(f"  (길이/단어 수 제한 적용: {plan['limits']})")
+    if plan.get('constraints'):
+        print(f"  (제약조건 {plan['constraints']}개는 반영되지 않은 최대치)")
+    
+    print("\n예상 출력 크기:")
+    for output_format, size in plan['output_bytes'].items():
+        print(f"  {output_format}: {format_bytes(size)}")
+    
+    print("\n예상 최대 메모리:")
+    print(f"  스트리밍 저장 (CLI): {format_bytes(plan['peak_memory']['streaming'])}")
+    print(f"  전체 결과 메모리 보관: {format_bytes(plan['peak_memory']['in_memory'])}")
+
+def iter_keyword_rows(df_data, column_numbers, category_titles, column_index=None):
+    """조합 규칙별 키워드 행(dict)을 하나씩 생성하는 제너레이터
+    
+    itertools.product를 리스트로 만들지 않고 그대로 순회하므로
+    전체 조합 수와 관계없이 한 번에 한 행만 메모리에 올라갑니다.
+    """
+    rule_specs = iter_rule_specs(df_data, column_numbers, category_titles, column_index)
+    for rule_str, group, column_names, str_values_list, column_keys in rule_specs:
+        columns_str = ", ".join(column_names)
         
-        # 결과에 추가
-        for combo in combinations:
-            keyword = " ".join(str(item) for item in combo)
-            components = " | ".join(str(item) for item in combo)
-            
-            results.append({
+        # 카테시안 곱을 지연 순회하며 한 행씩 반환
+        for combo in itertools.product(*str_values_list):
+            yield {
                 'rule': rule_str,
                 'group': group,
-                'columns': ", ".join(column_names),
-                'keyword': keyword,
-                'components': components
-            })
+                'columns': columns_str,
+                'keyword': " ".join(combo),
+                'components': " | ".join(combo)
+            }
+
+def mixed_radix_codes(radices, start, stop):
+    """조합 인덱스 구간 [start, stop)을 컬럼별 값 코드 배열로 변환
+    
+    마지막 컬럼이 가장 빠르게 바뀌는 혼합 진법으로 해석하므로
+    itertools.product와 같은 순서의 코드가 나옵니다.
+    """
+    return index_codes(radices, np.arange(start, stop, dtype=np.int64))
+
+def index_codes(radices, index):
+    """조합 인덱스 배열을 컬럼별 값 코드 배열로 변환 (mixed_radix_codes 참고)"""
+    codes = []
+    stride = 1
+    for radix in reversed(radices):
+        codes.append((index // stride) % radix)
+        stride *= radix
+    codes.reverse()
+    return codes
+
+def join_keyword_arrays(str_values_list, start, stop, prefix=None):
+    """조합 인덱스 구간 [start, stop)의 keyword/components 문자열 배열을 일괄 생성
+    
+    prefix로 (접두사 컬럼 수, keyword 배열, components 배열)을 넘기면 앞쪽 컬럼들의
+    조합을 다시 연결하지 않고 미리 만들어 둔 배열을 한 자리(진법의 한 자릿수)로 사용합니다.
+    """
+    parts = []
+    if prefix is not None:
+        depth, prefix_keyword, prefix_components = prefix
+        parts.append((prefix_keyword, prefix_components))
+        str_values_list = str_values_list[depth:]
+    parts.extend(value_parts(str_values_list, first=not parts))
+    
+    codes = mixed_radix_codes([len(keyword_values) for keyword_values, _ in parts], start, stop)
+    return join_coded_parts(parts, codes)
+
+def value_parts(str_values_list, first=True):
+    """컬럼별 값 배열을 (keyword용, components용) 쌍으로 변환
+    
+    구분자를 값에 미리 붙여 두면 컬럼당 한 번의 배열 연결로 끝납니다.
+    """
+    parts = []
+    for values in str_values_list:
+        values_array = np.array(values, dtype=object)
+        if first and not parts:
+            parts.append((values_array, values_array))
+        else:
+            parts.append((" " + values_array, " | " + values_array))
+    return parts
+
+def join_coded_parts(parts, codes):
+    """컬럼별 값 코드 배열로 keyword/components 문자열 배열 조립"""
+    keyword = None
+    components = None
+    for (keyword_values, components_values), col_codes in zip(parts, codes):
+        if keyword is None:
+            keyword = keyword_values[col_codes]
+            components = components_values[col_codes]
+        else:
+            keyword = keyword + keyword_values[col_codes]
+            components = components + components_values[col_codes]
+    return keyword, components
+
+class KeywordLimits:
+    """키워드 글자 수/단어 수 상한 (None이면 제한 없음)
     
-    return pd.DataFrame(results)
+    글자 수는 구분 공백을 포함한 len(keyword), 단어 수는 공백 수 + 1로
+    KeywordSummary와 같은 기준입니다. 조합을 모두 만든 뒤 걸러내지 않고, CombinationPruner가
+    앞쪽 컬럼 값을 고를 때마다 남은 컬럼의 최소 길이를 더해도 상한을 넘는 가지를 잘라냅니다.
+    """
+    
+    def __init__(self, max_length=None, max_words=None):
+        self.max_length = max_length
+        self.max_words = max_words
+    
+    def __bool__(self):
+        return self.max_length is not None or self.max_words is not None
+    
+    def describe(self):
+        limits = []
+        if self.max_length is not None:
+            limits.append(f"최대 {self.max_length}자")
+        if self.max_words is not None:
+            limits.append(f"최대 {self.max_words}단어")
+        return ", ".join(limits) or '없음'
+    
+    def value_costs(self, str_values_list):
+        """컬럼별 (글자 수 배열, 단어 수 배열) - 두 번째 컬럼부터는 앞의 구분 공백 포함"""
+        costs = []
+        for position, values in enumerate(str_values_list):
+            lengths = np.fromiter(map(len, values), dtype=np.int64, count=len(values)) + (1 if position else 0)
+            words = np.fromiter((value.count(' ') + 1 for value in values), dtype=np.int64, count=len(values))
+            costs.append((lengths, words))
+        return costs
+    
+    def fits(self, lengths, words):
+        """(글자 수, 단어 수) 배열이 상한 안에 드는지 여부 배열"""
+        fits = np.ones(len(lengths), dtype=bool)
+        if self.max_length is not None:
+            fits &= lengths <= self.max_length
+        if self.max_words is not None:
+            fits &= words <= self.max_words
+        return fits
+    
+    def value_fits(self, costs):
+        """컬럼별로 다른 컬럼의 가장 짧은 값과 조합했을 때 상한 안에 드는 값 여부 배열 목록"""
+        min_length = sum(lengths.min() for lengths, _ in costs)
+        min_words = sum(words.min() for _, words in costs)
+        return [
+            self.fits(min_length - lengths.min() + lengths, min_words - words.min() + words)
+            for lengths, words in costs
+        ]
+    
+    def count(self, str_values_list):
+        """조합을 만들지 않고 상한을 만족하는 조합 수와 키워드 글자 수 합계 계산
+        
+        컬럼별 (글자 수, 단어 수) 분포를 차례로 합성곱하며, 상한을 넘는 칸은 버립니다.
+        """
+        costs = self.value_costs(str_values_list)
+        max_length = self.max_length if self.max_length is not None else sum(int(lengths.max()) for lengths, _ in costs)
+        max_words = self.max_words if self.max_words is not None else sum(int(words.max()) for _, words in costs)
+        counts = np.zeros((max_length + 1, max_words + 1), dtype=np.int64)
+        counts[0, 0] = 1
+        for lengths, words in costs:
+            merged = np.zeros_like(counts)
+            pairs, pair_counts = np.unique(np.stack([lengths, words]), axis=1, return_counts=True)
+            for (value_length, value_words), pair_count in zip(pairs.T, pair_counts):
+                if value_length > max_length or value_words > max_words:
+                    continue
+                merged[value_length:, value_words:] += counts[:max_length + 1 - value_length,
+                                                              :max_words + 1 - value_words] * pair_count
+            counts = merged
+        total = int(counts.sum())
+        total_length = int((counts.sum(axis=1) * np.arange(max_length + 1)).sum())
+        return total, total_length
+
+# 입력 워크북에서 제약조건을 읽을 시트 이름 (대소문자 무시)
+CONSTRAINT_SHEET_NAMES = ['제약조건', 'constraints']
+
+# 제약조건 시트 A열의 유형 표기
+CONSTRAINT_TYPES = {'제외': 'exclude', 'exclude': 'exclude', '포함': 'include', 'include': 'include'}
+
+class KeywordConstraints:
+    """입력 워크북 '제약조건' 시트의 컬럼 값 조합 제약
+    
+    시트의 각 행: 유형 | 컬럼1 | 값1 | 컬럼2 | 값2 | 그룹(선택)
+    - 제외: 컬럼1의 값1과 컬럼2의 값2를 함께 쓰지 않음
+    - 포함: 컬럼1의 값1은 컬럼2에서 포함 행에 적힌 값들과만 함께 씀
+    컬럼은 규칙 번호(1, 2, ...) 또는 카테고리 제목으로, 그룹을 적으면 그 그룹의 규칙에만 적용합니다.
+    값은 앞뒤 공백을 무시하고 비교합니다.
+    """
+    
+    def __init__(self):
+        self.excludes = []
+        self.includes = {}
+        self.warnings = []
+    
+    def __len__(self):
+        return len(self.excludes) + sum(len(values) for values in self.includes.values())
+    
+    def describe(self):
+        return f"제외 {len(self.excludes):,}개, 포함 {len(self) - len(self.excludes):,}개"
+    
+    @classmethod
+    def from_sheet(cls, df_sheet, category_titles, normalizer=None):
+        """제약조건 시트 DataFrame(header 없음)에서 제약 목록 생성"""
+        constraints = cls()
+        column_keys = {}
+        for col_index in range(2, len(category_titles)):
+            if pd.notna(category_titles[col_index]):
+                column_keys[str(category_titles[col_index]).strip()] = col_index - 1
+        
+        def column_key(cell):
+            if pd.isna(cell):
+                return None
+            text = str(cell).strip()
+            if text.isdigit():
+                return int(text) if int(text) in column_keys.values() else None
+            return column_keys.get(text)
+        
+        def value_key(cell):
+            value = str(cell)
+            if normalizer is not None:
+                value = normalizer(value)
+            return value.strip()
+        
+        for row_number, row in enumerate(df_sheet.itertuples(index=False), 1):
+            cells = list(row) + [np.nan] * (6 - len(row))
+            kind = CONSTRAINT_TYPES.get(str(cells[0]).strip().casefold()) if pd.notna(cells[0]) else None
+            if kind is None:
+                # 헤더나 빈 행
+                continue
+            first_column, second_column = column_key(cells[1]), column_key(cells[3])
+            if first_column is None or second_column is None or pd.isna(cells[2]) or pd.isna(cells[4]):
+                constraints.warnings.append(f"{row_number}행: 컬럼 또는 값을 알 수 없어 건너뜀")
+                continue
+            group = str(cells[5]).strip() if pd.notna(cells[5]) else None
+            first_value, second_value = value_key(cells[2]), value_key(cells[4])
+            if kind == 'exclude':
+                constraints.excludes.append((first_column, first_value, second_column, second_value, group))
+            else:
+                key = (first_column, first_value, second_column, group)
+                constraints.includes.setdefault(key, set()).add(second_value)
+        return constraints
+    
+    def rule_conflicts(self, group, column_keys, str_values_list):
+        """규칙에 적용되는 금지 조합 목록 [(앞 위치, 뒤 위치, 금지 여부 행렬), ...]
+        
+        행렬[a, b]가 True이면 앞 위치 컬럼의 a번째 값과 뒤 위치 컬럼의 b번째 값을 함께 쓰지 않습니다.
+        """
+        positions = {}
+        for position, key in enumerate(column_keys):
+            positions.setdefault(key, []).append(position)
+        lookups = [{} for _ in str_values_list]
+        
+        def value_positions(position, value):
+            lookup = lookups[position]
+            if not lookup:
+                for index, column_value in enumerate(str_values_list[position]):
+                    lookup.setdefault(column_value.strip(), []).append(index)
+            return lookup.get(value, [])
+        
+        matrices = {}
+        
+        def forbid(first, second, first_rows, second_rows):
+            if first > second:
+                first, second, first_rows, second_rows = second, first, second_rows, first_rows
+            matrix = matrices.get((first, second))
+            if matrix is None:
+                matrix = np.zeros((len(str_values_list[first]), len(str_values_list[second])), dtype=bool)
+                matrices[(first, second)] = matrix
+            matrix[np.ix_(first_rows, second_rows)] = True
+        
+        for first_column, first_value, second_column, second_value, constraint_group in self.excludes:
+            if constraint_group is not None and constraint_group != group:
+                continue
+            for first in positions.get(first_column, []):
+                for second in positions.get(second_column, []):
+                    if first == second:
+                        continue
+                    first_rows = value_positions(first, first_value)
+                    second_rows = value_positions(second, second_value)
+                    if first_rows and second_rows:
+                        forbid(first, second, first_rows, second_rows)
+        
+        for (first_column, first_value, second_column, constraint_group), allowed in self.includes.items():
+            if constraint_group is not None and constraint_group != group:
+                continue
+            for first in positions.get(first_column, []):
+                for second in positions.get(second_column, []):
+                    if first == second:
+                        continue
+                    first_rows = value_positions(first, first_value)
+                    allowed_rows = {index for value in allowed for index in value_positions(second, value)}
+                    second_rows = [index for index in range(len(str_values_list[second])) if index not in allowed_rows]
+                    if first_rows and second_rows:
+                        forbid(first, second, first_rows, second_rows)
+        
+        return [(first, second, matrix) for (first, second), matrix in sorted(matrices.items())]
+
+def load_constraints(source, category_titles, cache_dir=DEFAULT_CACHE_DIR, normalizer=None):
+    """워크북의 제약조건 시트를 읽어 KeywordConstraints 반환 (시트가 없거나 비어 있으면 None)"""
+    df_sheet, _ = load_raw_workbook(source, cache_dir, sheet_names=CONSTRAINT_SHEET_NAMES)
+    if df_sheet is None or df_sheet.empty:
+        return None
+    constraints = KeywordConstraints.from_sheet(df_sheet, category_titles, normalizer)
+    return constraints if len(constraints) or constraints.warnings else None
+
+def prepare_generation(source, df_data, category_titles, cache_dir=DEFAULT_CACHE_DIR, normalizer=None,
+                       limits=None, constraint_source=None, use_constraints=True, column_index=None):
+    """워크북과 생성 설정으로 KeywordEngine/plan_keyword_generation에 넘길 입력을 준비
+    
+    CLI와 웹앱이 같은 함수를 써서 같은 워크북이면 같은 정규화, 길이 상한, 제약조건으로
+    키워드를 만듭니다. 반환값 {'column_index', 'limits', 'constraints'}는 그대로
+    KeywordEngine(..., **inputs)에 넘길 수 있습니다.
+    제약조건은 constraint_source(없으면 source) 워크북의 '제약조건' 시트에서 읽고,
+    column_index를 주면(웹앱 공유 캐시 등) 다시 만들지 않습니다.
+    """
+    if column_index is None:
+        column_index = build_column_index(df_data, category_titles, normalizer)
+    constraints = None
+    if use_constraints:
+        constraints = load_constraints(constraint_source or source, category_titles, cache_dir, normalizer)
+    return {
+        'column_index': column_index,
+        'limits': limits if limits is not None else KeywordLimits(),
+        'constraints': constraints,
+    }
+
+class CombinationPruner:
+    """한 규칙의 조합을 상한(KeywordLimits)과 금지 조합(제약조건)을 어기지 않는 것만 열거
+    
+    앞쪽 컬럼부터 값을 하나씩 정하면서, 부분 조합이 금지 쌍을 포함하거나 남은 컬럼의 최소
+    길이를 더해 상한을 넘으면 그 접두사로 시작하는 부분 곱 전체를 잘라냅니다.
+    """
+    
+    def __init__(self, str_values_list, limits=None, conflicts=()):
+        self.values_list = str_values_list
+        self.limits = limits if limits else None
+        self.costs = limits.value_costs(str_values_list) if self.limits else None
+        self.conflicts = {}
+        for first, second, matrix in conflicts:
+            self.conflicts.setdefault(second, []).append((first, matrix))
+    
+    @classmethod
+    def prepare(cls, str_values_list, limits=None, conflicts=()):
+        """어떤 조합에도 쓰일 수 없는 값을 제거한 뒤 열거기 생성 (가능한 조합이 없으면 None)
+        
+        다른 컬럼의 가장 짧은 값과 조합해도 상한을 넘는 값, 다른 컬럼의 모든 값과 금지된 값을
+        더 이상 바뀌지 않을 때까지 반복해서 제거합니다.
+        """
+        values_list = [list(values) for values in str_values_list]
+        conflicts = list(conflicts)
+        while True:
+            keeps = [np.ones(len(values), dtype=bool) for values in values_list]
+            if limits:
+                keeps = limits.value_fits(limits.value_costs(values_list))
+            for first, second, matrix in conflicts:
+                keeps[first] &= ~matrix.all(axis=1)
+                keeps[second] &= ~matrix.all(axis=0)
+            if all(keep.all() for keep in keeps):
+                return cls(values_list, limits, [item for item in conflicts if item[2].any()])
+            if not all(keep.any() for keep in keeps):
+                return None
+            values_list = [[value for value, kept in zip(values, keep) if kept]
+                           for values, keep in zip(values_list, keeps)]
+            conflicts = [(first, second, matrix[np.ix_(keeps[first], keeps[second])])
+                         for first, second, matrix in conflicts]
+    
+    @property
+    def total(self):
+        """가지치기 전 조합 수 (조합 인덱스 범위)"""
+        return count_combinations(self.values_list)
+    
+    def codes(self, start, stop):
+        """조합 인덱스 구간 [start, stop) 중 허용되는 조합의 컬럼별 값 코드 배열
+        
+        구간을 벗어나는 접두사도 함께 버리므로 조합 순서(itertools.product 순서)를 유지하면서
+        각 단계의 후보 수가 구간 크기 정도로 제한됩니다.
+        """
+        radices = [len(values) for values in self.values_list]
+        strides = [1] * (len(radices) + 1)
+        for position in range(len(radices) - 1, -1, -1):
+            strides[position] = strides[position + 1] * radices[position]
+        if self.costs is not None:
+            rest_length = np.cumsum([0] + [lengths.min() for lengths, _ in reversed(self.costs)])[::-1]
+            rest_words = np.cumsum([0] + [words.min() for _, words in reversed(self.costs)])[::-1]
+            length = np.zeros(1, dtype=np.int64)
+            words = np.zeros(1, dtype=np.int64)
+        
+        prefix = np.zeros(1, dtype=np.int64)
+        codes = []
+        for position, radix in enumerate(radices):
+            parent = np.repeat(np.arange(len(prefix)), radix)
+            code = np.tile(np.arange(radix, dtype=np.int64), len(prefix))
+            prefix = prefix[parent] * radix + code
+            stride = strides[position + 1]
+            keep = (prefix * stride < stop) & ((prefix + 1) * stride > start)
+            for first, matrix in self.conflicts.get(position, []):
+                keep &= ~matrix[codes[first][parent], code]
+            if self.costs is not None:
+                value_lengths, value_words = self.costs[position]
+                length = length[parent] + value_lengths[code]
+                words = words[parent] + value_words[code]
+                keep &= self.limits.fits(length + rest_length[position + 1], words + rest_words[position + 1])
+                length, words = length[keep], words[keep]
+            prefix = prefix[keep]
+            codes = [column[parent[keep]] for column in codes] + [code[keep]]
+        return codes
+
+def constrain_rule_specs(rule_specs, pruners, limits=None, constraints=None):
+    """상한이나 제약조건이 적용되는 규칙은 쓰일 수 없는 값을 뺀 규칙 정보로 바꾸어 반환하는 제너레이터
+    
+    해당 규칙의 CombinationPruner는 pruners[규칙]에 저장하며, 조합이 하나도 남지 않는 규칙은 건너뜁니다.
+    """
+    for rule_str, group, column_names, str_values_list, column_keys in rule_specs:
+        conflicts = constraints.rule_conflicts(group, column_keys, str_values_list) if constraints else []
+        if not limits and not conflicts:
+            yield rule_str, group, column_names, str_values_list, column_keys
+            continue
+        pruner = CombinationPruner.prepare(str_values_list, limits, conflicts)
+        if pruner is None:
+            print(f"  조합 규칙 '{rule_str}': 길이 제한/제약조건을 만족하는 조합이 없어 건너뜀")
+            continue
+        pruners[rule_str] = pruner
+        yield rule_str, group, column_names, pruner.values_list, column_keys
+
+def iter_pruned_codes(pruner, chunk_size=DEFAULT_CHUNK_SIZE):
+    """허용되는 조합의 값 코드 배열을 chunk_size행씩 모아 반환하는 제너레이터
+    
+    조합 인덱스를 chunk_size 구간씩 확인하므로 많이 잘려 나간 구간의 결과는 다음 구간과 합쳐
+    청크가 지나치게 작아지지 않도록 합니다.
+    """
+    total = pruner.total
+    pending = []
+    rows = 0
+    for start in range(0, total, chunk_size):
+        codes = pruner.codes(start, min(start + chunk_size, total))
+        if not len(codes[0]):
+            continue
+        pending.append(codes)
+        rows += len(codes[0])
+        if rows >= chunk_size:
+            merged = [np.concatenate(columns) for columns in zip(*pending)]
+            yield [column[:chunk_size] for column in merged]
+            pending = [[column[chunk_size:] for column in merged]]
+            rows -= chunk_size
+    if rows:
+        yield [np.concatenate(columns) for columns in zip(*pending)]
+
+def sample_positions(start, stop, total, count):
+    """total개 중 같은 간격으로 고른 count개의 표본 중 표본 번호 [start, stop)의 위치 (i * total // count)
+    
+    큰 total에서도 int64를 넘지 않도록 몫과 나머지로 나누어 계산합니다.
+    """
+    sample = np.arange(start, stop, dtype=np.int64)
+    return sample * (total // count) + sample * (total % count) // count
+
+def iter_rule_codes(str_values_list, chunk_size=DEFAULT_CHUNK_SIZE, pruner=None, quota=None, sample=False):
+    """규칙 하나의 값 코드 배열을 최대 chunk_size행씩 반환하는 제너레이터
+    
+    pruner(CombinationPruner)를 주면 허용되는 조합만 만듭니다.
+    quota(최대 행 수, 예상 행 수)를 주면 최대 행 수만큼만 만들며, sample이 False면 조합 순서대로
+    앞에서부터, True면 조합 전체에서 같은 간격으로 고릅니다. 한도 밖의 조합은 열거하지 않으며,
+    pruner가 있는 규칙을 sample할 때만 허용되는 조합을 모두 훑습니다 (예상 행 수가 최대치면 표본이 한도보다 적을 수 있음).
+    """
+    if pruner is None:
+        radices = [len(values) for values in str_values_list]
+        total = count_combinations(str_values_list)
+        if quota is None:
+            for start in range(0, total, chunk_size):
+                yield mixed_radix_codes(radices, start, min(start + chunk_size, total))
+            return
+        limit = min(quota[0], total)
+        for start in range(0, limit, chunk_size):
+            stop = min(start + chunk_size, limit)
+            if sample:
+                yield index_codes(radices, sample_positions(start, stop, total, limit))
+            else:
+                yield mixed_radix_codes(radices, start, stop)
+        return
+    
+    if quota is None:
+        yield from iter_pruned_codes(pruner, chunk_size)
+        return
+    limit, expected = quota
+    if limit <= 0:
+        return
+    offset = 0
+    taken = 0
+    for codes in iter_pruned_codes(pruner, chunk_size):
+        rows = len(codes[0])
+        if sample:
+            # 이 청크(허용 조합 [offset, offset + rows))에 들어가는 표본 번호 구간
+            first = min(-(-offset * limit // expected), limit)
+            last = min(-(-(offset + rows) * limit // expected), limit)
+            positions = sample_positions(first, last, expected, limit) - offset
+            codes = [column[positions] for column in codes]
+        else:
+            codes = [column[:limit - taken] for column in codes]
+        offset += rows
+        if len(codes[0]):
+            taken += len(codes[0])
+            yield codes
+        if taken >= limit:
+            return
+
+def build_keyword_chunk(rule_str, group, column_names, str_values_list, start, stop, prefix=None, pruner=None):
+    """규칙의 조합 인덱스 구간 [start, stop)에 해당하는 키워드 DataFrame을 일괄 생성
+    
+    pruner(CombinationPruner)를 주면 구간 안에서 상한과 제약조건을 만족하는 조합만 생성합니다.
+    """
+    if pruner is not None:
+        return build_coded_chunk(rule_str, group, column_names, str_values_list, pruner.codes(start, stop))
+    keyword, components = join_keyword_arrays(str_values_list, start, stop, prefix)
+    return pd.DataFrame({
+        'rule': rule_str,
+        'group': group,
+        'columns': ", ".join(column_names),
+        'keyword': keyword,
+        'components': components
+    }, columns=RESULT_COLUMNS)
+
+def build_coded_chunk(rule_str, group, column_names, str_values_list, codes):
+    """컬럼별 값 코드 배열에 해당하는 키워드 DataFrame 생성"""
+    keyword, components = join_coded_parts(value_parts(str_values_list), codes)
+    return pd.DataFrame({
+        'rule': rule_str,
+        'group': group,
+        'columns': ", ".join(column_names),
+        'keyword': keyword,
+        'components': components
+    }, columns=RESULT_COLUMNS)
+
+# 접두사 트라이에 미리 연결해 둘 접두사 조합의 최대 행 수
+PREFIX_CACHE_MAX_ROWS = 200_000
+
+class PrefixTrie:
+    """규칙의 컬럼 번호 순서로 구성한 접두사 트라이
+    
+    여러 규칙이 공유하는 앞쪽 컬럼 조합(예: "2,3,4"와 "2,3,5"의 "2,3")의 연결 문자열을
+    한 번만 만들어 두고 형제 규칙들이 재사용합니다. 접두사를 쓰는 규칙이 모두
+    처리되면 배열을 해제하므로 캐시는 남은 규칙이 필요로 하는 만큼만 유지됩니다.
+    """
+    
+    def __init__(self, max_rows=PREFIX_CACHE_MAX_ROWS):
+        self.max_rows = max_rows
+        self.root = {'children': {}, 'rules': 0, 'pending': 0, 'arrays': None}
+        self.hits = 0
+    
+    def _path(self, column_keys):
+        """루트를 제외한 접두사 노드 목록 (깊이 1부터 마지막 컬럼 직전까지)"""
+        node = self.root
+        path = []
+        for key in column_keys[:-1]:
+            node = node['children'].setdefault(key, {'children': {}, 'rules': 0, 'pending': 0, 'arrays': None})
+            path.append(node)
+        return path
+    
+    def add_rule(self, column_keys):
+        """처리할 규칙의 컬럼 번호 튜플 등록"""
+        for node in self._path(column_keys):
+            node['rules'] += 1
+            node['pending'] += 1
+    
+    def acquire(self, str_values_list, column_keys):
+        """규칙이 재사용할 수 있는 가장 깊은 공유 접두사 (깊이, keyword 배열, components 배열) 반환"""
+        path = self._path(column_keys)
+        prefix = None
+        size = 1
+        for depth, node in enumerate(path, 1):
+            size *= len(str_values_list[depth - 1])
+            if size > self.max_rows:
+                break
+            # 한 컬럼짜리 접두사는 값 배열 그대로이므로 두 컬럼 이상만 캐시
+            if depth < 2 or node['rules'] < 2:
+                continue
+            if node['arrays'] is None:
+                node['arrays'] = join_keyword_arrays(str_values_list[:depth], 0, size, prefix)
+            else:
+                self.hits += 1
+            prefix = (depth, *node['arrays'])
+        return prefix
+    
+    def release(self, column_keys):
+        """규칙 처리가 끝났음을 기록하고 더 이상 쓰이지 않는 접두사 배열 해제"""
+        for node in self._path(column_keys):
+            node['pending'] -= 1
+            if node['pending'] <= 0:
+                node['arrays'] = None
+
+def iter_chunk_tasks(rule_specs, chunk_size=DEFAULT_CHUNK_SIZE, pruners=None, quotas=None, sample=False):
+    """규칙마다 조합 인덱스를 chunk_size 구간으로 나눈 작업 (규칙 정보, start, stop, pruner, codes) 반환
+    
+    quotas(규칙 -> (최대 행 수, 예상 행 수))에 있는 규칙은 남길 조합의 값 코드를 여기서 정해
+    codes로 넘기고, 워커는 키워드 문자열만 만듭니다.
+    """
+    for rule_str, group, column_names, str_values_list, column_keys in rule_specs:
+        pruner = pruners.get(rule_str) if pruners else None
+        spec = (rule_str, group, column_names, str_values_list)
+        quota = quotas.get(rule_str) if quotas else None
+        if quota is not None:
+            for codes in iter_rule_codes(str_values_list, chunk_size, pruner, quota, sample):
+                yield spec, None, None, None, codes
+            continue
+        total = count_combinations(str_values_list)
+        for start in range(0, total, chunk_size):
+            yield spec, start, min(start + chunk_size, total), pruner, None
+
+def order_rule_specs(rule_specs, priority_groups=None):
+    """priority_groups에 속한 그룹의 규칙을 그 순서대로 앞에 배치 (나머지는 원래 순서 유지)"""
+    if not priority_groups:
+        return rule_specs
+    ranks = {group: rank for rank, group in enumerate(priority_groups)}
+    return sorted(rule_specs, key=lambda spec: ranks.get(spec[1], len(ranks)))
+
+def iter_keyword_chunks(df_data, column_numbers, category_titles, chunk_size=DEFAULT_CHUNK_SIZE,
+                        workers=1, worker_stats=None, column_index=None, priority_groups=None, limits=None,
+                        constraints=None, verbose=True, quotas=None, sample=False):
+    """규칙별 키워드를 최대 chunk_size개씩 묶은 DataFrame으로 생성하는 제너레이터
+    
+    각 청크는 혼합 진법 인덱스 연산으로 NumPy 배열 단위로 만들어지며,
+    청크는 규칙 경계를 넘지 않습니다. workers가 2 이상이면 프로세스 풀에서 생성하고,
+    단일 프로세스에서는 규칙 간 공유 접두사를 PrefixTrie로 재사용합니다.
+    priority_groups를 주면 해당 그룹의 규칙을 먼저 생성합니다 (중복 제거 시 우선 그룹).
+    limits(KeywordLimits)를 주면 글자 수/단어 수 상한을 넘는 조합은 만들지 않고,
+    constraints(KeywordConstraints)를 주면 금지된 값 쌍을 포함하는 부분 조합을 통째로 건너뜁니다.
+    quotas(규칙 -> (최대 행 수, 예상 행 수))를 주면 해당 규칙은 최대 행 수만큼만 생성합니다 (iter_rule_codes 참고).
+    """
+    quotas = quotas or {}
+    rule_specs = iter_rule_specs(df_data, column_numbers, category_titles, column_index, verbose)
+    rule_specs = order_rule_specs(rule_specs, priority_groups)
+    pruners = {}
+    if limits or constraints:
+        rule_specs = constrain_rule_specs(rule_specs, pruners, limits, constraints)
+    if workers > 1:
+        tasks = iter_chunk_tasks(rule_specs, chunk_size, pruners, quotas, sample)
+        chunks = iter_keyword_chunks_parallel(tasks, workers, worker_stats)
+        yield from (chunk for chunk in chunks if len(chunk))
+        return
+    
+    rule_specs = list(rule_specs)
+    trie = PrefixTrie()
+    for spec in rule_specs:
+        # 값 목록이 줄어들거나 일부만 생성하는 규칙은 다른 규칙과 접두사를 공유할 수 없음
+        if spec[0] not in pruners and spec[0] not in quotas:
+            trie.add_rule(spec[4])
+    
+    for rule_str, group, column_names, str_values_list, column_keys in rule_specs:
+        pruner = pruners.get(rule_str)
+        quota = quotas.get(rule_str)
+        if pruner is not None or quota is not None:
+            for codes in iter_rule_codes(str_values_list, chunk_size, pruner, quota, sample):
+                yield build_coded_chunk(rule_str, group, column_names, str_values_list, codes)
+            continue
+        prefix = trie.acquire(str_values_list, column_keys)
+        total = count_combinations(str_values_list)
+        for start in range(0, total, chunk_size):
+            stop = min(start + chunk_size, total)
+            yield build_keyword_chunk(rule_str, group, column_names, str_values_list, start, stop, prefix)
+        trie.release(column_keys)
+
+def build_chunk_task(task):
+    """프로세스 풀 작업: 청크를 생성하고 (청크, 워커 PID, 소요 시간) 반환"""
+    spec, start, stop, pruner, codes = task
+    started = time.perf_counter()
+    if codes is not None:
+        chunk = build_coded_chunk(*spec, codes)
+    else:
+        chunk = build_keyword_chunk(*spec, start, stop, pruner=pruner)
+    return chunk, os.getpid(), time.perf_counter() - started
+
+def iter_keyword_chunks_parallel(tasks, workers, worker_stats=None):
+    """청크 작업을 프로세스 풀에 나누어 실행하고 결과를 작업 순서대로 반환
+    
+    결과가 소비되는 속도보다 앞서 쌓이지 않도록 동시에 진행 중인 작업은
+    워커 수의 2배로 제한합니다. worker_stats(dict)를 넘기면 워커별
+    청크 수, 행 수, 생성 시간을 누적합니다.
+    """
+    max_pending = workers * 2
+    pending = deque()
+    
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        try:
+            for task in tasks:
+                pending.append(executor.submit(build_chunk_task, task))
+                if len(pending) >= max_pending:
+                    yield collect_chunk_result(pending.popleft(), worker_stats)
+            while pending:
+                yield collect_chunk_result(pending.popleft(), worker_stats)
+        finally:
+            # 소비를 멈추면(취소 등) 아직 시작하지 않은 작업은 실행하지 않음
+            for future in pending:
+                future.cancel()
+
+def collect_chunk_result(future, worker_stats=None):
+    """완료된 청크 작업의 결과를 꺼내고 워커별 처리량 통계 갱신"""
+    chunk, pid, elapsed = future.result()
+    if worker_stats is not None:
+        stats = worker_stats.setdefault(pid, {'chunks': 0, 'rows': 0, 'seconds': 0.0})
+        stats['chunks'] += 1
+        stats['rows'] += len(chunk)
+        stats['seconds'] += elapsed
+    return chunk
+
+def print_worker_stats(worker_stats):
+    """워커별 처리량 출력"""
+    print("\n=== 워커별 처리량 ===")
+    for pid, stats in sorted(worker_stats.items()):
+        rate = stats['rows'] / stats['seconds'] if stats['seconds'] else 0
+        print(f"  워커 {pid}: {stats['chunks']}개 청크, {stats['rows']:,}행, "
+              f"{stats['seconds']:.2f}초 ({rate:,.0f}행/초)")
+
+# KeywordSummary가 중복 판별용 해시를 고유 해시 배열에 합치기 전까지 모아 두는 최소 개수
+SUMMARY_FOLD_HASHES = 1_000_000
+
+class KeywordSummary:
+    """생성 중에 한 번만 집계하는 결과 요약
+
+    규칙/그룹별 키워드 수, 키워드 길이(글자 수)와 단어 수 분포, 중복 키워드 수를
+    청크가 생성되는 대로 누적하므로 결과 DataFrame 없이 스트리밍 출력에서도 사용할 수 있습니다.
+    CLI 통계, Dashboard, 웹앱 통계가 모두 이 객체를 읽습니다.
+    중복 판별용 해시는 모아 둔 개수가 SUMMARY_FOLD_HASHES와 고유 해시 수 중 큰 값을 넘을 때마다
+    정렬된 고유 해시 배열에 합치므로, 행마다가 아니라 고유 키워드마다 8바이트(최대 두 배)만 씁니다.
+    """
+
+    def __init__(self):
+        self.total = 0
+        self.rule_counts = Counter()
+        self.group_counts = Counter()
+        self.rule_groups = {}
+        self.length_counts = Counter()
+        self.word_counts = Counter()
+        self._hashes = []
+        self._pending = 0
+        self._unique_hashes = np.array([], dtype=np.int64)
+        self._duplicates = 0
+
+    def update_rule(self, rule_str, group, keywords):
+        """한 규칙의 키워드 배열 집계"""
+        count = len(keywords)
+        if count == 0:
+            return
+        self.total += count
+        self.rule_counts[rule_str] += count
+        self.group_counts[group] += count
+        self.rule_groups[rule_str] = group
+
+        lengths = np.fromiter(map(len, keywords), dtype=np.int64, count=count)
+        self.length_counts.update(dict(zip(*np.unique(lengths, return_counts=True))))
+        words = np.fromiter((keyword.count(' ') + 1 for keyword in keywords), dtype=np.int64, count=count)
+        self.word_counts.update(dict(zip(*np.unique(words, return_counts=True))))
+        # 중복은 키워드 문자열 대신 64비트 해시로 판별 (프로세스 안에서만 비교하므로 내장 hash 사용)
+        self._hashes.append(np.fromiter(map(hash, keywords), dtype=np.int64, count=count))
+        self._pending += count
+        if self._pending >= max(SUMMARY_FOLD_HASHES, len(self._unique_hashes)):
+            self._fold_hashes()
+
+    def _fold_hashes(self):
+        """모아 둔 해시를 고유 해시 배열에 합치면서 중복 수 누적"""
+        if not self._hashes:
+            return
+        batch = np.concatenate(self._hashes)
+        self._hashes = []
+        self._pending = 0
+        unique_batch = np.unique(batch)
+        self._duplicates += len(batch) - len(unique_batch)
+        if len(self._unique_hashes):
+            positions = np.minimum(np.searchsorted(self._unique_hashes, unique_batch), len(self._unique_hashes) - 1)
+            seen = self._unique_hashes[positions] == unique_batch
+            self._duplicates += int(seen.sum())
+            unique_batch = np.sort(np.concatenate([self._unique_hashes, unique_batch[~seen]]), kind='stable')
+        self._unique_hashes = unique_batch
+
+    def update(self, chunk_df):
+        """결과 DataFrame 청크(여러 규칙이 섞여 있어도 됨) 집계"""
+        if chunk_df.empty:
+            return
+        # 생성기 청크는 규칙 하나로만 이루어지므로 groupby 없이 바로 집계
+        rules = chunk_df['rule'].unique()
+        if len(rules) == 1:
+            self.update_rule(rules[0], chunk_df['group'].iat[0], chunk_df['keyword'].to_numpy())
+            return
+        for (rule_str, group), keywords in chunk_df.groupby(['rule', 'group'], sort=False)['keyword']:
+            self.update_rule(rule_str, group, keywords.to_numpy())
+
+    @classmethod
+    def from_dataframe(cls, results_df):
+        summary = cls()
+        summary.update(results_df)
+        return summary
+
+    @property
+    def duplicates(self):
+        """다른 키워드와 문자열이 같은 키워드 수 (첫 번째를 제외한 나머지)"""
+        self._fold_hashes()
+        return self._duplicates
+
+    @property
+    def average_length(self):
+        if not self.total:
+            return 0.0
+        return sum(length * count for length, count in self.length_counts.items()) / self.total
+
+    def top_rules(self, limit=None):
+        """키워드가 많은 순서의 (규칙, 개수) 목록"""
+        return self.rule_counts.most_common(limit)
+
+    def top_groups(self, limit=None):
+        """키워드가 많은 순서의 (그룹, 개수) 목록"""
+        return self.group_counts.most_common(limit)
+
+    def length_histogram(self, bucket=10):
+        """글자 수 구간별 키워드 수 [('10~19자', 개수), ...]"""
+        buckets = Counter()
+        for length, count in self.length_counts.items():
+            buckets[length // bucket] += count
+        return [(f"{index * bucket}~{index * bucket + bucket - 1}자", buckets[index]) for index in sorted(buckets)]
+
+    def __getstate__(self):
+        # 중복 수를 확정하고 해시 배열은 저장하지 않음
+        self.duplicates
+        state = self.__dict__.copy()
+        state['_unique_hashes'] = np.array([], dtype=np.int64)
+        return state
+
+# 중복 제거 방식 (exact: 해시 집합, bloom: 확률적 bloom filter)
+DEDUP_MODES = ['none', 'exact', 'bloom']
+
+# bloom 모드에서 고유 키워드를 중복으로 오인할 확률 (기본값)
+BLOOM_ERROR_RATE = 0.001
+
+class KeywordHashSet:
+    """키워드 64비트 해시와 처음 추가한 규칙 번호를 보관하는 정렬 배열 집합
+    
+    해시를 정렬된 NumPy 배열 여러 개(run)로 나누어 두고, 새 run이 직전 run보다 크거나 같으면
+    병합해 run 수를 로그 수준으로 유지합니다. 키워드당 12바이트만 사용합니다.
+    """
+    
+    def __init__(self):
+        self.runs = []
+    
+    def __len__(self):
+        return sum(len(hashes) for hashes, _ in self.runs)
+    
+    @property
+    def nbytes(self):
+        return sum(hashes.nbytes + owners.nbytes for hashes, owners in self.runs)
+    
+    def lookup(self, hashes):
+        """각 해시를 처음 추가한 규칙 번호 배열 (없으면 -1)"""
+        owners = np.full(len(hashes), -1, dtype=np.int32)
+        for run_hashes, run_owners in self.runs:
+            positions = np.minimum(np.searchsorted(run_hashes, hashes), len(run_hashes) - 1)
+            found = run_hashes[positions] == hashes
+            owners[found] = run_owners[positions[found]]
+        return owners
+    
+    def add(self, hashes, owners):
+        """집합에 없는 고유 해시와 그 규칙 번호 추가"""
+        if len(hashes) == 0:
+            return
+        order = np.argsort(hashes)
+        run_hashes, run_owners = hashes[order], owners[order].astype(np.int32)
+        while self.runs and len(self.runs[-1][0]) <= len(run_hashes):
+            last_hashes, last_owners = self.runs.pop()
+            merged_hashes = np.concatenate([last_hashes, run_hashes])
+            order = np.argsort(merged_hashes, kind='mergesort')
+            run_hashes = merged_hashes[order]
+            run_owners = np.concatenate([last_owners, run_owners])[order]
+        self.runs.append((run_hashes, run_owners))
+
+class KeywordBloomFilter:
+    """고정 크기 비트 배열로 키워드 해시를 판별하는 bloom filter
+    
+    capacity개를 넣었을 때 오판률이 error_rate가 되도록 비트 수와 해시 함수 수를 정하며,
+    키워드 수와 관계없이 메모리가 고정됩니다. 해시 함수는 64비트 해시의 상/하위 32비트로
+    만드는 double hashing을 사용합니다.
+    """
+    
+    def __init__(self, capacity, error_rate=BLOOM_ERROR_RATE):
+        capacity = max(int(capacity), 1)
+        self.num_bits = max(int(np.ceil(-capacity * np.log(error_rate) / np.log(2) ** 2)), 64)
+        self.num_hashes = max(int(round(self.num_bits / capacity * np.log(2))), 1)
+        self.bits = np.zeros((self.num_bits + 7) // 8, dtype=np.uint8)
+    
+    @property
+    def nbytes(self):
+        return self.bits.nbytes
+    
+    def _positions(self, hashes):
+        values = hashes.view(np.uint64)
+        first = values & np.uint64(0xFFFFFFFF)
+        step = (values >> np.uint64(32)) | np.uint64(1)
+        rounds = np.arange(self.num_hashes, dtype=np.uint64)
+        return (first[:, None] + rounds[None, :] * step[:, None]) % np.uint64(self.num_bits)
+    
+    def lookup(self, hashes):
+        """각 해시가 이미 들어 있는지 여부 (오판률 error_rate로 True일 수 있음)"""
+        positions = self._positions(hashes)
+        bits = (self.bits[positions >> np.uint64(3)] >> (positions & np.uint64(7)).astype(np.uint8)) & 1
+        return bits.all(axis=1)
+    
+    def add(self, hashes):
+        positions = self._positions(hashes).ravel()
+        np.bitwise_or.at(self.bits, positions >> np.uint64(3),
+                         np.left_shift(1, positions & np.uint64(7)).astype(np.uint8))
+
+class KeywordDeduplicator:
+    """규칙/그룹 사이에서 같은 키워드 문자열을 한 번만 남기는 중복 제거 단계
+    
+    청크가 들어오는 순서대로 키워드 해시를 확인해 처음 나온 행만 남기고, 제거한 키워드 수를
+    규칙/그룹별로, exact 모드에서는 (남긴 그룹, 제거된 그룹) 쌍별로도 집계합니다.
+    우선 그룹은 iter_keyword_chunks(priority_groups=...)로 해당 그룹 규칙을 먼저 생성해
+    처음 나온 키워드가 되도록 합니다.
+    
+    exact 모드는 64비트 해시 충돌 외에는 정확하며(1억 개에서 충돌 확률 약 0.03%),
+    bloom 모드는 capacity(예상 키워드 수)만큼의 고정 메모리를 쓰는 대신 고유 키워드의
+    약 error_rate 비율이 중복으로 오인되어 빠질 수 있습니다.
+    """
+    
+    def __init__(self, mode='exact', capacity=None, error_rate=BLOOM_ERROR_RATE, priority_groups=()):
+        if mode == 'exact':
+            self.seen = KeywordHashSet()
+        elif mode == 'bloom':
+            if not capacity:
+                raise ValueError("bloom 모드에는 예상 키워드 수(capacity)가 필요합니다")
+            self.seen = KeywordBloomFilter(capacity, error_rate)
+        else:
+            raise ValueError(f"지원하지 않는 중복 제거 방식: {mode} (exact, bloom 중 선택)")
+        self.mode = mode
+        self.error_rate = error_rate
+        self.priority_groups = list(priority_groups or [])
+        self.checked = 0
+        self.removed = 0
+        self.removed_rules = Counter()
+        self.removed_groups = Counter()
+        self.collisions = Counter()
+        self.rules = []
+        self.rule_groups = []
+        self._rule_ids = {}
+    
+    def _rule_id(self, rule_str, group):
+        rule_id = self._rule_ids.get(rule_str)
+        if rule_id is None:
+            rule_id = len(self.rules)
+            self._rule_ids[rule_str] = rule_id
+            self.rules.append(rule_str)
+            self.rule_groups.append(group)
+        return rule_id
+    
+    def _row_rule_ids(self, chunk_df):
+        """청크 각 행의 규칙 번호 배열"""
+        codes, rules = pd.factorize(chunk_df['rule'])
+        if len(rules) == 1:
+            return np.full(len(chunk_df), self._rule_id(rules[0], chunk_df['group'].iat[0]), dtype=np.int32)
+        _, first_rows = np.unique(codes, return_index=True)
+        groups = chunk_df['group'].to_numpy()[first_rows]
+        rule_ids = np.array([self._rule_id(rule_str, group) for rule_str, group in zip(rules, groups)],
+                            dtype=np.int32)
+        return rule_ids[codes]
+    
+    def filter(self, chunk_df):
+        """청크에서 앞서 나온 키워드(청크 안 중복 포함)를 제거한 DataFrame 반환"""
+        if len(chunk_df) == 0:
+            return chunk_df
+        keep = self._keep(self._row_rule_ids(chunk_df), chunk_df['keyword'].to_numpy())
+        return chunk_df if keep is None else chunk_df[keep]
+    
+    def filter_codes(self, rule_str, group, keywords, codes):
+        """한 규칙의 값 코드 청크에서 앞서 나온 키워드의 행을 제거한 코드 배열 목록 반환
+        
+        keywords는 codes로 만든 키워드 문자열 배열이며, 결과를 값 코드로 보관하는 웹앱에서 사용합니다.
+        """
+        if len(keywords) == 0:
+            return codes
+        owners = np.full(len(keywords), self._rule_id(rule_str, group), dtype=np.int32)
+        keep = self._keep(owners, keywords)
+        return codes if keep is None else [column[keep] for column in codes]
+    
+    def _keep(self, owners, keywords):
+        """남길 행의 bool 배열 (제거할 행이 없으면 None)"""
+        count = len(keywords)
+        hashes = np.fromiter(map(hash, keywords), dtype=np.int64, count=count)
+        unique_hashes, first_rows, inverse = np.unique(hashes, return_index=True, return_inverse=True)
+        
+        if self.mode == 'exact':
+            prior = self.seen.lookup(unique_hashes)
+            new = prior < 0
+            self.seen.add(unique_hashes[new], owners[first_rows[new]])
+            keepers = np.where(new, owners[first_rows], prior)
+        else:
+            new = ~self.seen.lookup(unique_hashes)
+            self.seen.add(unique_hashes[new])
+            keepers = None
+        
+        keep = np.zeros(count, dtype=bool)
+        keep[first_rows[new]] = True
+        self.checked += count
+        removed = int(count - keep.sum())
+        if not removed:
+            return None
+        
+        self.removed += removed
+        removed_owners = owners[~keep]
+        for rule_id, rule_removed in zip(*np.unique(removed_owners, return_counts=True)):
+            self.removed_rules[self.rules[rule_id]] += int(rule_removed)
+            self.removed_groups[self.rule_groups[rule_id]] += int(rule_removed)
+        if keepers is not None:
+            pairs = np.stack([keepers[inverse.ravel()[~keep]], removed_owners])
+            unique_pairs, pair_counts = np.unique(pairs, axis=1, return_counts=True)
+            for (kept_id, removed_id), pair_count in zip(unique_pairs.T, pair_counts):
+                self.collisions[(self.rule_groups[kept_id], self.rule_groups[removed_id])] += int(pair_count)
+        return keep
+    
+    def filter_chunks(self, chunks):
+        """청크마다 중복을 제거하고, 모두 제거된 청크는 건너뛰는 제너레이터"""
+        for chunk in chunks:
+            chunk = self.filter(chunk)
+            if len(chunk):
+                yield chunk
+    
+    @property
+    def kept(self):
+        return self.checked - self.removed
+    
+    @property
+    def memory_bytes(self):
+        return self.seen.nbytes
+    
+    def describe(self):
+        """중복 제거 방식 설명 문자열"""
+        if self.mode == 'bloom':
+            return f"bloom (확률적, 오판률 {self.error_rate:.2%})"
+        return "exact (해시 집합)"
+    
+    def top_removed_rules(self, limit=None):
+        """제거된 키워드가 많은 순서의 (규칙, 개수) 목록"""
+        return self.removed_rules.most_common(limit)
+
+class CompactKeywordResults:
+    """딕셔너리 인코딩된 키워드 생성 결과
+    
+    rule/group/columns는 categorical 컬럼으로, 각 키워드는 규칙의 컬럼별 값 코드(정수)로만
+    저장하고 keyword/components 문자열은 내보낼 때 필요한 행만 만들어 냅니다.
+    
+    frame: 'rule', 'group', 'columns'(categorical)와 값 코드 컬럼 'c0', 'c1', ...
+           (규칙의 컬럼 수보다 뒤쪽 코드는 -1)
+    """
+    
+    def __init__(self):
+        self.rules = []
+        self.rule_groups = []
+        self.rule_columns = []
+        self.rule_values = []
+        self._rule_ids = {}
+        self._chunks = []
+        self._frame = None
+        self._group_ranges = None
+        self._summary = None
+        # 생성에 적용한 자원 예산과 적용 결과 (GenerationBudget, 없으면 None)
+        self.budget = None
+    
+    def append(self, rule_str, group, column_names, str_values_list, codes):
+        """한 규칙의 값 코드 청크 추가"""
+        rule_id = self._rule_ids.get(rule_str)
+        if rule_id is None:
+            rule_id = len(self.rules)
+            self._rule_ids[rule_str] = rule_id
+            self.rules.append(rule_str)
+            self.rule_groups.append(group)
+            self.rule_columns.append(", ".join(column_names))
+            self.rule_values.append(value_parts(str_values_list))
+        self._chunks.append((rule_id, codes))
+        self._frame = None
+        self._group_ranges = None
+        self._summary = None
+
+    @classmethod
+    def from_codes(cls, rules, rule_groups, rule_columns, rule_values, rule_ids, codes, runs=None, summary=None,
+                   budget=None):
+        """저장해 둔 규칙 정보와 행별 규칙 번호/값 코드 배열로 결과 복원
+
+        rule_ids와 codes(frame의 'c0', 'c1', ... 컬럼 배열)는 memmap이어도 되며,
+        같은 규칙이 이어지는 구간마다 복사 없이 잘라서 청크로 사용합니다.
+        runs(rule_runs()의 결과)를 주면 rule_ids를 읽지 않고 구간을 그대로 사용하며,
+        summary(KeywordSummary)를 주면 요약을 다시 집계하지 않습니다.
+        budget(GenerationBudget)은 생성에 적용한 자원 예산 기록입니다.
+        """
+        results = cls()
+        results.rules = list(rules)
+        results.rule_groups = list(rule_groups)
+        results.rule_columns = list(rule_columns)
+        results.rule_values = list(rule_values)
+        results._rule_ids = {rule_str: rule_id for rule_id, rule_str in enumerate(results.rules)}
+
+        if runs is None:
+            boundaries = np.flatnonzero(np.diff(rule_ids)) + 1
+            starts = np.concatenate([[0], boundaries]) if len(rule_ids) else []
+            stops = np.concatenate([boundaries, [len(rule_ids)]]) if len(rule_ids) else []
+            runs = [(int(rule_ids[start]), start, stop) for start, stop in zip(starts, stops)]
+        for rule_id, start, stop in runs:
+            width = len(results.rule_values[rule_id])
+            results._chunks.append((rule_id, [codes[position][start:stop] for position in range(width)]))
+        results._summary = summary
+        results.budget = budget
+        return results
+
+    @property
+    def summary(self):
+        """결과 요약 (KeywordSummary, 처음 접근할 때 청크를 한 번 훑어 집계)"""
+        if self._summary is None:
+            summary = KeywordSummary()
+            for rule_id, codes in self._chunks:
+                keyword, _ = join_coded_parts(self.rule_values[rule_id], codes)
+                summary.update_rule(self.rules[rule_id], self.rule_groups[rule_id], keyword)
+            self._summary = summary
+        return self._summary
+
+    def rule_runs(self):
+        """같은 규칙이 이어지는 행 구간 목록 [(규칙 번호, 시작 행, 끝 행), ...]"""
+        runs = []
+        row = 0
+        for rule_id, codes in self._chunks:
+            stop = row + len(codes[0])
+            if runs and runs[-1][0] == rule_id and runs[-1][2] == row:
+                runs[-1] = (rule_id, runs[-1][1], stop)
+            else:
+                runs.append((rule_id, row, stop))
+            row = stop
+        return runs
+
+    @property
+    def group_ranges(self):
+        """그룹 -> 그 그룹의 행 구간 목록 [(시작 행, 끝 행), ...] (생성 순서, 한 번만 계산)"""
+        if self._group_ranges is None:
+            group_ranges = {}
+            for rule_id, start, stop in self.rule_runs():
+                ranges = group_ranges.setdefault(self.rule_groups[rule_id], [])
+                if ranges and ranges[-1][1] == start:
+                    ranges[-1] = (ranges[-1][0], stop)
+                else:
+                    ranges.append((start, stop))
+            self._group_ranges = group_ranges
+        return self._group_ranges
+
+    def group_size(self, group):
+        """그룹의 행 수"""
+        return sum(stop - start for start, stop in self.group_ranges.get(group, []))
 
-def create_dashboard_data(results_df):
+    def slice_frame(self, start, stop):
+        """전체 frame을 만들지 않고 [start, stop) 행만 담은 frame 생성"""
+        chunks = []
+        row = 0
+        for rule_id, codes in self._chunks:
+            chunk_stop = row + len(codes[0])
+            if chunk_stop > start and row < stop:
+                begin, end = max(start, row) - row, min(stop, chunk_stop) - row
+                chunks.append((rule_id, [column[begin:end] for column in codes]))
+            if chunk_stop >= stop:
+                break
+            row = chunk_stop
+        return self._build_frame(chunks)
+
+    def page(self, groups, offset, limit):
+        """선택한 그룹들의 행을 이어 붙였을 때 offset부터 limit행의 frame
+
+        그룹별 행 구간 인덱스로 필요한 구간만 잘라내므로 전체 결과 크기와 관계없이
+        페이지 크기만큼의 비용만 듭니다.
+        """
+        frames = []
+        for group in groups:
+            for start, stop in self.group_ranges.get(group, []):
+                if limit <= 0:
+                    break
+                length = stop - start
+                if offset >= length:
+                    offset -= length
+                    continue
+                take = min(length - offset, limit)
+                frames.append(self.slice_frame(start + offset, start + offset + take))
+                offset = 0
+                limit -= take
+        if not frames:
+            return self._build_frame([])
+        return pd.concat(frames, ignore_index=True)
+
+    @property
+    def frame(self):
+        """categorical rule/group/columns와 값 코드로 이루어진 DataFrame"""
+        if self._frame is None:
+            self._frame = self._build_frame(self._chunks)
+        return self._frame
+    
+    def _build_frame(self, chunks):
+        # 일부 행만 잘라 만든 frame도 코드 컬럼 수가 같아야 페이지 조각을 이어 붙일 수 있음
+        width = max((len(parts) for parts in self.rule_values), default=0)
+        max_radix = max((len(keyword_values) for parts in self.rule_values for keyword_values, _ in parts), default=0)
+        code_dtype = np.int16 if max_radix < np.iinfo(np.int16).max else np.int32
+        
+        rule_ids = np.concatenate(
+            [np.full(len(codes[0]), rule_id, dtype=np.int32) for rule_id, codes in chunks]
+        ) if chunks else np.array([], dtype=np.int32)
+        
+        groups = list(dict.fromkeys(self.rule_groups))
+        group_codes = np.array([groups.index(group) for group in self.rule_groups], dtype=np.int32)
+        columns = list(dict.fromkeys(self.rule_columns))
+        column_codes = np.array([columns.index(name) for name in self.rule_columns], dtype=np.int32)
+        
+        frame = {
+            'rule': pd.Categorical.from_codes(rule_ids, categories=self.rules),
+            'group': pd.Categorical.from_codes(group_codes[rule_ids], categories=groups),
+            'columns': pd.Categorical.from_codes(column_codes[rule_ids], categories=columns)
+        }
+        for position in range(width):
+            frame[f'c{position}'] = np.concatenate([np.array([], dtype=code_dtype)] + [
+                codes[position].astype(code_dtype) if position < len(codes)
+                else np.full(len(codes[0]), -1, dtype=code_dtype)
+                for _, codes in chunks
+            ])
+        return pd.DataFrame(frame)
+    
+    def __len__(self):
+        return sum(len(codes[0]) for _, codes in self._chunks)
+    
+    @property
+    def empty(self):
+        return len(self) == 0
+    
+    def render(self, frame=None):
+        """frame(기본값: 전체)의 행들을 keyword/components 문자열이 포함된 결과 DataFrame으로 변환"""
+        if frame is None:
+            frame = self.frame
+        keyword = np.empty(len(frame), dtype=object)
+        components = np.empty(len(frame), dtype=object)
+        rule_ids = frame['rule'].cat.codes.to_numpy()
+        
+        for rule_id in pd.unique(rule_ids):
+            positions = np.flatnonzero(rule_ids == rule_id)
+            parts = self.rule_values[rule_id]
+            codes = [frame[f'c{position}'].to_numpy()[positions] for position in range(len(parts))]
+            keyword[positions], components[positions] = join_coded_parts(parts, codes)
+        
+        return pd.DataFrame({
+            'rule': frame['rule'].astype(object).to_numpy(),
+            'group': frame['group'].astype(object).to_numpy(),
+            'columns': frame['columns'].astype(object).to_numpy(),
+            'keyword': keyword,
+            'components': components
+        }, columns=RESULT_COLUMNS)
+    
+    def iter_chunks(self, chunk_size=DEFAULT_CHUNK_SIZE, frame=None):
+        """결과를 chunk_size행씩 문자열로 만들어 반환 (출력 싱크용)"""
+        if frame is None:
+            frame = self.frame
+        for start in range(0, len(frame), chunk_size):
+            yield self.render(frame.iloc[start:start + chunk_size])
+    
+    def to_dataframe(self):
+        """전체 결과를 문자열 DataFrame으로 변환"""
+        return self.render()
+
+def iter_code_chunks(df_data, column_numbers, category_titles, chunk_size=DEFAULT_CHUNK_SIZE, column_index=None,
+                     limits=None, constraints=None, rules=None, priority_groups=None, verbose=True, quotas=None,
+                     sample=False):
+    """규칙별 조합을 문자열 대신 컬럼별 값 코드 배열로 생성하는 제너레이터
+    
+    (규칙, 그룹, 컬럼명 목록, 문자열 값 목록, 코드 배열 목록)을 반환합니다.
+    rules(규칙 집합)를 주면 그 규칙만 생성하며, quotas는 iter_keyword_chunks와 같습니다.
+    """
+    rule_specs = iter_rule_specs(df_data, column_numbers, category_titles, column_index, verbose)
+    if rules is not None:
+        rule_specs = (spec for spec in rule_specs if spec[0] in rules)
+    rule_specs = order_rule_specs(rule_specs, priority_groups)
+    pruners = {}
+    if limits or constraints:
+        rule_specs = constrain_rule_specs(rule_specs, pruners, limits, constraints)
+    for rule_str, group, column_names, str_values_list, column_keys in rule_specs:
+        quota = quotas.get(rule_str) if quotas else None
+        for codes in iter_rule_codes(str_values_list, chunk_size, pruners.get(rule_str), quota, sample):
+            yield rule_str, group, column_names, str_values_list, codes
+
+class GenerationCancelled(Exception):
+    """취소 토큰(CancellationToken)으로 키워드 생성이 중단됨"""
+
+class CancellationToken:
+    """키워드 생성을 중간에 멈추기 위한 협조적 취소 토큰
+    
+    다른 스레드(웹앱 중지 버튼 등)나 진행 콜백에서 cancel()을 호출하면 엔진이 다음 청크를
+    만들기 전에(규칙 중간 포함) GenerationCancelled를 발생시킵니다.
+    다른 프로세스에서 취소하려면 multiprocessing Manager의 Event처럼 set()/is_set()이 있는 event를 넘깁니다.
+    """
+    
+    def __init__(self, event=None):
+        self._event = event if event is not None else threading.Event()
+    
+    def cancel(self):
+        self._event.set()
+    
+    @property
+    def cancelled(self):
+        return self._event.is_set()
+    
+    def raise_if_cancelled(self):
+        if self._event.is_set():
+            raise GenerationCancelled("키워드 생성이 취소되었습니다")
+
+def format_duration(seconds):
+    """남은 시간 등 초 단위 시간을 '1시간 2분 3초' 형태로 변환"""
+    seconds = int(round(seconds))
+    hours, rest = divmod(seconds, 3600)
+    minutes, seconds = divmod(rest, 60)
+    if hours:
+        return f"{hours}시간 {minutes}분 {seconds}초"
+    if minutes:
+        return f"{minutes}분 {seconds}초"
+    return f"{seconds}초"
+
+# 자원 예산을 넘었을 때의 처리 방식
+BUDGET_POLICIES = ('abort', 'truncate', 'sample')
+
+# 크기 문자열 단위 (예: "512M", "4G")
+SIZE_UNITS = {'': 1, 'K': 1024, 'M': 1024 ** 2, 'G': 1024 ** 3, 'T': 1024 ** 4}
+
+class BudgetExceeded(GenerationCancelled):
+    """abort 정책에서 자원 예산(GenerationBudget)을 넘어 키워드 생성이 중단됨"""
+
+def parse_size(text):
+    """'512M', '4G', '1.5GB' 같은 크기 문자열을 바이트 수로 변환"""
+    value = str(text).strip().upper()
+    if value.endswith('B'):
+        value = value[:-1]
+    unit = value[-1:] if value[-1:].isalpha() else ''
+    try:
+        return int(float(value[:-1] if unit else value) * SIZE_UNITS[unit])
+    except (ValueError, KeyError):
+        raise ValueError(f"크기를 해석할 수 없습니다: {text}") from None
+
+def current_rss():
+    """현재 프로세스의 RSS (바이트, 측정할 수 없으면 None)
+    
+    Linux는 /proc에서 바로 읽고, 그 외에는 psutil(설치된 경우)을 사용합니다.
+    """
+    try:
+        with open('/proc/self/statm') as f:
+            return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+    except (OSError, ValueError, AttributeError):
+        pass
+    try:
+        import psutil
+    except ImportError:
+        return None
+    return psutil.Process().memory_info().rss
+
+class GenerationBudget:
+    """키워드 생성 자원 예산과 적용 결과
+    
+    max_rows(전체 행 수), max_rule_rows(규칙별 행 수), max_seconds(생성 시간), max_rss(프로세스 RSS 바이트)를
+    넘을 때의 처리(policy):
+      abort: BudgetExceeded를 발생시켜 생성 중단 (행 수는 제약조건이 없으면 생성 전에 계획으로 확인)
+      truncate: 규칙마다 조합 순서대로 앞에서부터 한도까지만 생성 (전체 한도는 생성 순서대로 채움)
+      sample: 규칙마다 조합 전체에서 같은 간격으로 골라 한도만큼 생성 (전체 한도는 규칙 크기에 비례해 나눔)
+    시간/메모리 한도를 넘으면 truncate/sample은 그때까지 만든 결과로 생성을 마칩니다.
+    RSS는 이 프로세스만 측정하므로 병렬 워커의 메모리는 포함되지 않습니다.
+    
+    한도로 줄인 규칙(cuts)과 생성을 멈춘 이유(stopped)를 기록해 Dashboard 시트에 남깁니다.
+    """
+    
+    def __init__(self, max_rows=None, max_rule_rows=None, max_seconds=None, max_rss=None, policy='abort'):
+        if policy not in BUDGET_POLICIES:
+            raise ValueError(f"지원하지 않는 예산 정책입니다: {policy}")
+        self.max_rows = max_rows
+        self.max_rule_rows = max_rule_rows
+        self.max_seconds = max_seconds
+        self.max_rss = max_rss
+        self.policy = policy
+        self.cuts = {}
+        self.stopped = None
+    
+    def __bool__(self):
+        return any(limit is not None for limit in (self.max_rows, self.max_rule_rows, self.max_seconds, self.max_rss))
+    
+    def describe(self):
+        parts = []
+        if self.max_rows is not None:
+            parts.append(f"전체 {self.max_rows:,}행")
+        if self.max_rule_rows is not None:
+            parts.append(f"규칙별 {self.max_rule_rows:,}행")
+        if self.max_seconds is not None:
+            parts.append(f"생성 시간 {format_duration(self.max_seconds)}")
+        if self.max_rss is not None:
+            parts.append(f"메모리 {format_bytes(self.max_rss)}")
+        return f"{', '.join(parts) or '제한 없음'} ({self.policy})"
+    
+    def start(self, plan, priority_groups=None, exact=True):
+        """생성을 시작하기 전에 계획(plan_keyword_generation)으로 규칙별 행 한도를 정함
+        
+        반환값은 한도보다 큰 규칙의 quotas(규칙 -> (최대 행 수, 예상 행 수))입니다.
+        abort 정책에서 계획이 정확하면(exact, 제약조건 없음) 행 한도를 넘는지 여기서 바로 확인합니다.
+        """
+        self.cuts = {}
+        self.stopped = None
+        ranks = {group: rank for rank, group in enumerate(priority_groups or [])}
+        rule_plans = sorted(plan['rules'], key=lambda rule_plan: ranks.get(rule_plan['group'], len(ranks)))
+        
+        if self.policy == 'abort':
+            if exact:
+                if self.max_rows is not None and plan['total_keywords'] > self.max_rows:
+                    raise BudgetExceeded(f"예상 키워드 수 {plan['total_keywords']:,}개가 "
+                                         f"전체 행 한도 {self.max_rows:,}개를 넘습니다")
+                for rule_plan in rule_plans:
+                    if self.max_rule_rows is not None and rule_plan['keywords'] > self.max_rule_rows:
+                        raise BudgetExceeded(f"조합 규칙 '{rule_plan['rule']}'의 예상 키워드 수 "
+                                             f"{rule_plan['keywords']:,}개가 규칙별 행 한도 "
+                                             f"{self.max_rule_rows:,}개를 넘습니다")
+            return {}
+        
+        limits = [rule_plan['keywords'] for rule_plan in rule_plans]
+        if self.max_rule_rows is not None:
+            limits = [min(rows, self.max_rule_rows) for rows in limits]
+        if self.max_rows is not None and sum(limits) > self.max_rows:
+            if self.policy == 'sample':
+                total = sum(limits)
+                limits = [rows * self.max_rows // total for rows in limits]
+            else:
+                remaining = self.max_rows
+                for position, rows in enumerate(limits):
+                    limits[position] = min(rows, remaining)
+                    remaining -= limits[position]
+        
+        quotas = {}
+        for rule_plan, rows in zip(rule_plans, limits):
+            if rows < rule_plan['keywords']:
+                quotas[rule_plan['rule']] = (rows, rule_plan['keywords'])
+                self.cuts[rule_plan['rule']] = {'group': rule_plan['group'], 'planned': rule_plan['keywords'],
+                                                'limit': rows, 'rows': 0}
+        return quotas
+    
+    def check_rows(self, rule_str, rule_rows, total_rows):
+        """abort 정책에서 생성한 행 수가 한도를 넘으면 BudgetExceeded 발생"""
+        if self.policy != 'abort':
+            return
+        if self.max_rule_rows is not None and rule_rows > self.max_rule_rows:
+            raise BudgetExceeded(f"조합 규칙 '{rule_str}'이 규칙별 행 한도 {self.max_rule_rows:,}개를 넘었습니다")
+        if self.max_rows is not None and total_rows > self.max_rows:
+            raise BudgetExceeded(f"생성한 키워드가 전체 행 한도 {self.max_rows:,}개를 넘었습니다")
+    
+    def check_resources(self, elapsed, rows, rule_str=None):
+        """생성 시간/메모리 한도 확인 (넘으면 abort는 BudgetExceeded, 그 외에는 기록 후 True 반환)"""
+        reason = None
+        if self.max_seconds is not None and elapsed > self.max_seconds:
+            reason = f"생성 시간 한도 {format_duration(self.max_seconds)} 초과"
+        elif self.max_rss is not None:
+            rss = current_rss()
+            if rss is not None and rss > self.max_rss:
+                reason = f"메모리 한도 {format_bytes(self.max_rss)} 초과 (RSS {format_bytes(rss)})"
+        if reason is None:
+            return False
+        if self.policy == 'abort':
+            raise BudgetExceeded(reason)
+        self.stopped = {'reason': reason, 'rows': rows, 'rule': rule_str, 'skipped_rules': 0}
+        return True
+    
+    def record(self, rule_rows, rules_total):
+        """생성이 끝난 뒤 규칙별 실제 행 수를 기록"""
+        for rule_str, cut in self.cuts.items():
+            cut['rows'] = rule_rows.get(rule_str, 0)
+        if self.stopped is not None:
+            self.stopped['skipped_rules'] = rules_total - len(rule_rows)
+    
+    @property
+    def removed(self):
+        """한도로 생성하지 않은 키워드 수 (제약조건이 있으면 예상치 기준)"""
+        return sum(cut['planned'] - cut['rows'] for cut in self.cuts.values())
+    
+    @property
+    def applied(self):
+        """예산 때문에 결과가 줄었는지 여부"""
+        return bool(self.cuts) or self.stopped is not None
+
+class KeywordEngine:
+    """CLI와 웹앱이 함께 쓰는 키워드 생성 엔진
+    
+    규칙 해석, 컬럼 값 인덱스, 길이 제한/제약조건, 중복 제거 우선 그룹 순서를 한 곳에서 처리하고
+    청크를 만들 때마다 progress(진행 상황 dict를 받는 콜백)를 호출하며, 다음 청크를 만들기 전에
+    cancel(CancellationToken)과 budget(GenerationBudget)의 시간/메모리 한도를 확인합니다.
+    
+    진행 상황 dict: rule, group(방금 만든 청크의 규칙/그룹), rules_done, rules_total, rows, rows_total,
+    rows_per_sec, elapsed, eta(남은 초, 알 수 없으면 None), fraction(0~1), finished
+    rows_total은 생성 계획의 키워드 수(예산으로 줄인 규칙은 한도)이며, 제약조건이 있으면 실제보다 클 수 있는 최대치입니다.
+    """
+    
+    def __init__(self, df_data, column_numbers, category_titles, column_index=None, limits=None, constraints=None,
+                 priority_groups=None, chunk_size=DEFAULT_CHUNK_SIZE, workers=1, progress=None, cancel=None,
+                 verbose=True, budget=None):
+        self.df_data = df_data
+        self.column_numbers = column_numbers
+        self.category_titles = category_titles
+        if column_index is None:
+            column_index = build_column_index(df_data, category_titles)
+        self.column_index = column_index
+        self.limits = limits
+        self.constraints = constraints
+        self.priority_groups = priority_groups
+        self.chunk_size = chunk_size
+        self.workers = workers
+        self.progress = progress
+        self.cancel = cancel if cancel is not None else CancellationToken()
+        self.verbose = verbose
+        self.worker_stats = {}
+        self.plan = plan_keyword_generation(df_data, column_numbers, category_titles, chunk_size, workers,
+                                            column_index, limits, constraints)
+        # 예산의 행 한도는 계획으로 규칙별 한도를 정해 열거 단계에서 적용 (abort는 여기서 바로 확인)
+        self.budget = budget if budget else None
+        self.quotas = {}
+        if self.budget is not None:
+            self.quotas = self.budget.start(self.plan, priority_groups, exact=not constraints)
+        self.rows_planned = self.plan['total_keywords'] - sum(planned - rows for rows, planned in self.quotas.values())
+        self.rows = 0
+        self.rule_rows = {}
+        self._last_rule = None
+        self.started = None
+    
+    @property
+    def rules_total(self):
+        return len(self.plan['rules'])
+    
+    @property
+    def sample(self):
+        """예산으로 줄이는 규칙을 고르게 추출하는지 여부"""
+        return self.budget is not None and self.budget.policy == 'sample'
+    
+    def check_cancelled(self):
+        """취소되었으면 GenerationCancelled 발생"""
+        self.cancel.raise_if_cancelled()
+    
+    def snapshot(self, rule_str=None, group=None, finished=False):
+        """현재 진행 상황 dict"""
+        elapsed = time.perf_counter() - self.started if self.started is not None else 0.0
+        rows_per_sec = self.rows / elapsed if elapsed else 0.0
+        rows_total = max(self.rows_planned, self.rows)
+        if finished:
+            rules_done, eta, fraction = self.rules_total, 0.0, 1.0
+        else:
+            # 마지막으로 본 규칙은 아직 진행 중
+            rules_done = max(len(self.rule_rows) - 1, 0)
+            eta = (rows_total - self.rows) / rows_per_sec if rows_per_sec else None
+            fraction = self.rows / rows_total if rows_total else 0.0
+        return {
+            'rule': rule_str,
+            'group': group,
+            'rules_done': rules_done,
+            'rules_total': self.rules_total,
+            'rows': self.rows,
+            'rows_total': rows_total,
+            'rows_per_sec': rows_per_sec,
+            'elapsed': elapsed,
+            'eta': eta,
+            'fraction': fraction,
+            'finished': finished
+        }
+    
+    def advance(self, rule_str, group, rows):
+        """청크 하나만큼 진행 상황을 갱신하고 progress 콜백 호출
+        
+        엔진 밖에서 만든 청크(증분 생성에서 캐시로 만든 규칙 등)도 이 메서드로 진행 상황에 반영합니다.
+        """
+        if self.started is None:
+            self.started = time.perf_counter()
+        self.rows += rows
+        self.rule_rows[rule_str] = self.rule_rows.get(rule_str, 0) + rows
+        self._last_rule = rule_str
+        if self.budget is not None:
+            self.budget.check_rows(rule_str, self.rule_rows[rule_str], self.rows)
+        if self.progress is not None:
+            self.progress(self.snapshot(rule_str, group))
+    
+    def budget_exhausted(self):
+        """예산의 시간/메모리 한도를 넘었는지 확인 (abort 정책이면 BudgetExceeded 발생)"""
+        if self.budget is None or self.started is None:
+            return False
+        return self.budget.check_resources(time.perf_counter() - self.started, self.rows, self._last_rule)
+    
+    def finish(self):
+        """생성이 끝났음을 progress 콜백에 알리고 예산 적용 결과 기록"""
+        if self.budget is not None:
+            self.budget.record(self.rule_rows, self.rules_total)
+        if self.progress is not None:
+            self.progress(self.snapshot(finished=True))
+    
+    def _track(self, items, describe, finish=True):
+        """결과를 하나씩 넘기기 전에 취소 여부와 예산을 확인하고 진행 상황을 갱신하는 제너레이터
+        
+        시간/메모리 예산을 넘으면(truncate/sample) 그때까지 만든 결과로 끝냅니다.
+        finish가 True면 끝까지 소비했을 때 완료 진행 상황을 알립니다.
+        """
+        if self.started is None:
+            self.started = time.perf_counter()
+        iterator = iter(items)
+        try:
+            while True:
+                self.check_cancelled()
+                if self.budget_exhausted():
+                    break
+                item = next(iterator, None)
+                if item is None:
+                    break
+                rule_str, group, rows = describe(item)
+                if rows:
+                    self.advance(rule_str, group, rows)
+                yield item
+        finally:
+            # 취소되거나 소비를 멈추면 진행 중인 생성기(병렬이면 프로세스 풀 작업 포함) 정리
+            iterator.close()
+        if finish:
+            self.finish()
+    
+    def iter_chunks(self):
+        """키워드 DataFrame 청크 제너레이터 (iter_keyword_chunks 참고, workers가 2 이상이면 병렬 생성)"""
+        chunks = iter_keyword_chunks(self.df_data, self.column_numbers, self.category_titles, self.chunk_size,
+                                     self.workers, self.worker_stats, self.column_index, self.priority_groups,
+                                     self.limits, self.constraints, self.verbose, self.quotas, self.sample)
+        return self._track(chunks, lambda chunk: (
+            chunk['rule'].iat[0] if len(chunk) else None, chunk['group'].iat[0] if len(chunk) else None, len(chunk)
+        ))
+    
+    def iter_codes(self, rules=None, finish=True):
+        """값 코드 청크 (규칙, 그룹, 컬럼명 목록, 문자열 값 목록, 코드 배열 목록) 제너레이터
+        
+        rules(규칙 집합)를 주면 그 규칙만 생성합니다 (iter_code_chunks 참고).
+        """
+        items = iter_code_chunks(self.df_data, self.column_numbers, self.category_titles, self.chunk_size,
+                                 self.column_index, self.limits, self.constraints, rules=rules,
+                                 priority_groups=self.priority_groups, verbose=self.verbose, quotas=self.quotas,
+                                 sample=self.sample)
+        return self._track(items, lambda item: (item[0], item[1], len(item[4][0])), finish)
+    
+    def compact_results(self, dedup=None):
+        """모든 규칙의 키워드를 CompactKeywordResults(값 코드)로 생성
+        
+        dedup(KeywordDeduplicator)을 주면 키워드 문자열을 만들어 중복을 확인한 뒤 남은 행의 코드만 보관합니다.
+        """
+        results = CompactKeywordResults()
+        parts = {}
+        for rule_str, group, column_names, str_values_list, codes in self.iter_codes():
+            if dedup is not None:
+                if rule_str not in parts:
+                    parts = {rule_str: value_parts(str_values_list)}
+                keyword, _ = join_coded_parts(parts[rule_str], codes)
+                codes = dedup.filter_codes(rule_str, group, keyword, codes)
+                if not len(codes[0]):
+                    continue
+            results.append(rule_str, group, column_names, str_values_list, codes)
+        results.budget = self.budget
+        return results
+
+def generate_compact_results(df_data, column_numbers, category_titles, column_index=None, limits=None,
+                             constraints=None):
+    """모든 조합 규칙의 키워드를 CompactKeywordResults(값 코드)로 생성"""
+    engine = KeywordEngine(df_data, column_numbers, category_titles, column_index, limits, constraints)
+    return engine.compact_results()
+
+def generate_keyword_combinations(df_data, column_numbers, category_titles, workers=1, column_index=None,
+                                  limits=None, constraints=None):
+    """모든 조합 규칙에 따라 키워드 조합 생성
+    
+    constraints(KeywordConstraints, load_constraints로 읽음)의 제외/포함 제약은 생성 중에 적용됩니다.
+    """
+    engine = KeywordEngine(df_data, column_numbers, category_titles, column_index, limits, constraints,
+                           workers=workers)
+    chunks = list(engine.iter_chunks())
+    if not chunks:
+        return pd.DataFrame()
+    return pd.concat(chunks, ignore_index=True)
+
+def create_dashboard_data(results_df, dedup=None):
     """Dashboard 시트용 통계 데이터 생성"""
+    return build_dashboard_data(KeywordSummary.from_dataframe(results_df), dedup)
+
+def build_dashboard_data(summary, dedup=None, budget=None):
+    """결과 요약(KeywordSummary)으로 Dashboard 통계 데이터 생성
+    
+    dedup(KeywordDeduplicator)을 주면 중복 제거 결과와 그룹 간 충돌 수를,
+    budget(GenerationBudget)을 주면 자원 예산으로 줄이거나 멈춘 내역을 함께 기록합니다.
+    """
     dashboard_data = []
     
     # 기본 통계
-    total_keywords = len(results_df)
-    total_rules = results_df['rule'].nunique()
-    total_groups = results_df['group'].nunique()
+    total_keywords = summary.total
+    total_rules = len(summary.rule_counts)
+    total_groups = len(summary.group_counts)
     
     # 헤더 추가 (Numbers 호환성을 위해 === 제거)
     dashboard_data.append(['키워드 생성 통계', ''])
@@ -153,13 +2221,14 @@ def create_dashboard_data(results_df):
     dashboard_data.append(['총 키워드 수', f"{total_keywords:,}"])
     dashboard_data.append(['총 조합 규칙 수', total_rules])
     dashboard_data.append(['총 그룹 수', total_groups])
+    dashboard_data.append(['중복 키워드 수', f"{summary.duplicates:,}"])
+    dashboard_data.append(['평균 키워드 길이', f"{summary.average_length:.1f}자"])
     dashboard_data.append(['', ''])
     
     # 그룹별 통계
     dashboard_data.append(['그룹별 키워드 수', ''])
     dashboard_data.append(['그룹명', '키워드 수'])
-    group_counts = results_df['group'].value_counts()
-    for group, count in group_counts.items():
+    for group, count in summary.top_groups():
         dashboard_data.append([group, f"{count:,}"])
     
     dashboard_data.append(['', ''])
@@ -167,44 +2236,356 @@ def create_dashboard_data(results_df):
     # 규칙별 통계 (상위 15개)
     dashboard_data.append(['규칙별 키워드 수 (상위 15개)', ''])
     dashboard_data.append(['규칙', '키워드 수'])
-    rule_counts = results_df['rule'].value_counts().head(15)
-    for rule, count in rule_counts.items():
+    for rule, count in summary.top_rules(15):
         dashboard_data.append([rule, f"{count:,}"])
     
+    dashboard_data.append(['', ''])
+    
+    # 키워드 길이 분포
+    dashboard_data.append(['키워드 길이 분포', ''])
+    dashboard_data.append(['글자 수', '키워드 수'])
+    for label, count in summary.length_histogram():
+        dashboard_data.append([label, f"{count:,}"])
+    
+    if dedup is not None:
+        dashboard_data.extend(build_dedup_dashboard_rows(dedup))
+    
+    if budget is not None:
+        dashboard_data.extend(build_budget_dashboard_rows(budget))
+    
     return dashboard_data
 
-def save_to_excel(results_df, output_dir):
-    """Dashboard와 그룹별 시트로 분리하여 엑셀 파일 저장"""
+def build_dedup_dashboard_rows(dedup):
+    """중복 제거 통계(KeywordDeduplicator)의 Dashboard 행 목록"""
+    rows = [['', '']]
+    rows.append(['중복 제거', ''])
+    rows.append(['방식', dedup.describe()])
+    rows.append(['우선 그룹', ", ".join(dedup.priority_groups) or '없음 (처음 나온 키워드 유지)'])
+    rows.append(['검사한 키워드 수', f"{dedup.checked:,}"])
+    rows.append(['제거된 중복 키워드 수', f"{dedup.removed:,}"])
+    rows.append(['남은 키워드 수', f"{dedup.kept:,}"])
+    
+    if dedup.removed_groups:
+        rows.append(['', ''])
+        rows.append(['그룹별 제거된 키워드 수', ''])
+        rows.append(['그룹명', '제거된 키워드 수'])
+        for group, count in dedup.removed_groups.most_common():
+            rows.append([group, f"{count:,}"])
+    
+    if dedup.collisions:
+        rows.append(['', ''])
+        rows.append(['그룹 간 충돌 (남긴 그룹 → 제거된 그룹)', ''])
+        rows.append(['그룹', '충돌 키워드 수'])
+        for (kept_group, removed_group), count in dedup.collisions.most_common():
+            rows.append([f"{kept_group} → {removed_group}", f"{count:,}"])
+    
+    if dedup.removed_rules:
+        rows.append(['', ''])
+        rows.append(['규칙별 제거된 키워드 수 (상위 15개)', ''])
+        rows.append(['규칙', '제거된 키워드 수'])
+        for rule, count in dedup.top_removed_rules(15):
+            rows.append([rule, f"{count:,}"])
+    
+    return rows
+
+def build_budget_dashboard_rows(budget):
+    """자원 예산(GenerationBudget) 적용 결과의 Dashboard 행 목록"""
+    rows = [['', '']]
+    rows.append(['자원 예산', ''])
+    rows.append(['설정', budget.describe()])
+    if budget.stopped is not None:
+        rows.append(['생성 중단', budget.stopped['reason']])
+        rows.append(['중단 시점 키워드 수', f"{budget.stopped['rows']:,}"])
+        rows.append(['중단 시 진행 중이던 규칙', budget.stopped['rule'] or '-'])
+        rows.append(['생성하지 못한 규칙 수', f"{budget.stopped['skipped_rules']:,}"])
+    else:
+        rows.append(['생성 중단', '없음'])
+    rows.append(['한도로 줄인 규칙 수', f"{len(budget.cuts):,}"])
+    rows.append(['한도로 제외한 키워드 수', f"{budget.removed:,}"])
+    
+    if budget.cuts:
+        method = '고르게 추출' if budget.policy == 'sample' else '앞에서부터'
+        rows.append(['', ''])
+        rows.append([f'한도로 줄인 규칙 ({method}, 상위 30개)', ''])
+        rows.append(['규칙', '예상 키워드 수 → 남긴 키워드 수'])
+        cuts = sorted(budget.cuts.items(), key=lambda item: item[1]['planned'] - item[1]['rows'], reverse=True)
+        for rule_str, cut in cuts[:30]:
+            rows.append([f"{rule_str} ({cut['group']})", f"{cut['planned']:,} → {cut['rows']:,}"])
+    
+    return rows
+
+def iter_dataframe_chunks(results_df, chunk_size=DEFAULT_CHUNK_SIZE):
+    """이미 생성된 결과 DataFrame을 chunk_size개씩 나누어 반환"""
+    for start in range(0, len(results_df), chunk_size):
+        yield results_df.iloc[start:start + chunk_size]
+
+def measure(report, stage, rows=None):
+    """report(RunReport)가 있으면 단계 측정 컨텍스트, 없으면 아무것도 하지 않는 컨텍스트"""
+    if report is None:
+        return contextlib.nullcontext({'rows': 0})
+    return report.stage(stage, rows)
+
+def print_progress(progress):
+    """KeywordEngine 진행 상황 콜백 (CLI)"""
+    if progress['finished']:
+        print(f"  생성 완료: {progress['rows']:,}개, {progress['elapsed']:.1f}초 "
+              f"({progress['rows_per_sec']:,.0f}행/초)")
+        return
+    eta = format_duration(progress['eta']) if progress['eta'] is not None else '-'
+    print(f"  {progress['rows']:,}/{progress['rows_total']:,}행 ({progress['fraction']:.0%}), "
+          f"규칙 {progress['rules_done']}/{progress['rules_total']}, {progress['rows_per_sec']:,.0f}행/초, "
+          f"남은 시간 {eta}")
+
+def save_run_report(report, path, **info):
+    """실행 보고서(RunReport)에 실행 정보를 더해 JSON으로 저장하고 단계별 요약 출력"""
+    report.info.update(info)
+    report.print_summary(format_bytes)
+    report.save(path)
+    print(f"실행 보고서 저장: {path}")
+
+def make_output_path(output_dir, extension='xlsx', timestamp=True):
+    """출력 디렉토리를 준비하고 타임스탬프가 포함된 결과 경로 반환
+    
+    extension이 None이면 그룹별 파일을 담을 하위 디렉토리 경로를 반환합니다.
+    timestamp가 False면 실행마다 같은 경로(--incremental 출력)를 반환합니다.
+    """
     # 출력 디렉토리 확인/생성
     if not os.path.exists(output_dir):
         os.makedirs(output_dir)
         print(f"출력 디렉토리 생성: {output_dir}")
     
     # 파일명 생성 (타임스탬프 포함)
-    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    filename = f"generated_keywords_{timestamp}.xlsx"
-    filepath = os.path.join(output_dir, filename)
-    
-    # ExcelWriter로 여러 시트 생성
-    with pd.ExcelWriter(filepath, engine='openpyxl') as writer:
-        print("Dashboard 시트 생성 중...")
-        # Dashboard 시트
-        dashboard_data = create_dashboard_data(results_df)
-        dashboard_df = pd.DataFrame(dashboard_data, columns=['항목', '값'])
-        dashboard_df.to_excel(writer, sheet_name='Dashboard', index=False)
-        
-        print("그룹별 시트 생성 중...")
-        # 그룹별 시트 생성
-        for group in results_df['group'].unique():
-            group_data = results_df[results_df['group'] == group]
-            print(f"  '{group}' 시트 생성...")
-            group_data.to_excel(writer, sheet_name=group, index=False)
+    filename = "generated_keywords"
+    if timestamp:
+        filename = f"{filename}_{datetime.now().strftime('%Y%m%d_%H%M%S')}"
+    if extension:
+        filename = f"{filename}.{extension}"
+    return os.path.join(output_dir, filename)
+
+def save_chunks(chunks, sink, dedup=None, report=None, verbose=True, budget=None):
+    """키워드 청크를 생성되는 대로 출력 싱크에 기록하면서 결과 요약(KeywordSummary) 집계
+    
+    청크가 dedup(KeywordDeduplicator)을 거쳐 왔다면 함께 넘겨 Dashboard에 중복 제거 통계를 기록하고,
+    budget(GenerationBudget)을 주면 자원 예산 적용 결과도 기록합니다.
+    report(RunReport)를 주면 기록(write)과 Dashboard 단계를 계측합니다
+    (규칙별 생성 시간은 chunks를 report.time_chunks로 감싸 측정).
+    """
+    summary = KeywordSummary()
+    
+    for chunk in chunks:
+        with measure(report, 'write', len(chunk)):
+            sink.write_chunk(chunk)
+            summary.update(chunk)
+        if verbose:
+            print(f"  {sink.total_rows:,}개 행 기록...")
+    
+    print("Dashboard 생성 중...")
+    with measure(report, 'dashboard'):
+        sink.write_dashboard(build_dashboard_data(summary, dedup, budget))
+    with measure(report, 'write'):
+        sink.close()
+    
+    return {
+        'total': sink.total_rows,
+        'summary': summary,
+        'outputs': sink.output_names
+    }
+
+def build_manifest(df_data, category_titles, column_index, limits=None, constraints=None, priority_groups=None,
+                   settings=None):
+    """현재 입력의 컬럼별 값 해시와 규칙별 정의 해시로 OutputManifest 생성
+    
+    규칙 해시는 규칙, 그룹, 길이 제한, 규칙이 쓰는 컬럼들의 이름과 값 해시, 그 규칙에 적용되는
+    제약조건(금지된 값 쌍 행렬)으로 만들어지므로 이 중 하나라도 바뀐 규칙만 해시가 달라집니다.
+    rows와 outputs는 기록을 마친 뒤 finish_manifest로 채웁니다.
+    """
+    manifest = OutputManifest(settings)
+    for key, entry in column_index.items():
+        manifest.columns[str(key)] = {
+            'name': entry['name'],
+            'hash': hash_values(entry['values']),
+            'values': len(entry['values'])
+        }
+    
+    rule_specs = []
+    for rule_str, group in build_rule_group_mapping(df_data, verbose=False).items():
+        column_keys = tuple(key for key in parse_combination_rule(rule_str) if key in column_index)
+        if column_keys:
+            rule_specs.append((rule_str, group, column_keys))
+    
+    limits_text = limits.describe() if limits else ''
+    for rule_str, group, column_keys in order_rule_specs(rule_specs, priority_groups):
+        parts = [rule_str, group, limits_text]
+        for key in column_keys:
+            # 컬럼 이름은 출력의 조합 구성 요소에 쓰이므로 값이 같아도 이름이 바뀌면 다시 생성
+            parts += [manifest.columns[str(key)]['name'], manifest.columns[str(key)]['hash']]
+        if constraints:
+            str_values_list = [column_index[key]['values'] for key in column_keys]
+            for first, second, matrix in constraints.rule_conflicts(group, column_keys, str_values_list):
+                parts.append(f"{first},{second}:{hashlib.sha256(np.packbits(matrix).tobytes()).hexdigest()}")
+        manifest.rules[rule_str] = {
+            'group': group,
+            'columns': list(column_keys),
+            'hash': hash_text(*parts),
+            'rows': 0
+        }
+    return manifest
+
+def finish_manifest(manifest, summary, outputs, file_names=None):
+    """기록을 마친 결과 요약(KeywordSummary)으로 manifest의 규칙/그룹별 행 수와 출력 목록 채우기
+    
+    file_names(싱크의 그룹 -> 출력 파일 이름)를 주면 그룹마다 기록해 두어 다음 증분 실행에서 같은 파일을 씁니다.
+    """
+    file_names = file_names or {}
+    for rule_str, info in manifest.rules.items():
+        info['rows'] = summary.rule_counts.get(rule_str, 0)
+    for group in dict.fromkeys(info['group'] for info in manifest.rules.values()):
+        manifest.groups[group] = {
+            'rules': manifest.group_rule_hashes(group),
+            'rows': summary.group_counts.get(group, 0),
+            'file': file_names.get(group)
+        }
+    manifest.outputs = list(outputs)
+    return manifest
+
+def save_incremental(engine, sink, target, settings=None, dedup=None, report=None):
+    """이전 실행의 manifest와 비교해 바뀐 규칙만 다시 생성하고 나머지는 규칙별 캐시에서 기록
+    
+    engine(KeywordEngine)의 입력, 길이 제한/제약조건, 우선 그룹, 청크 크기를 사용하며
+    캐시에서 만든 규칙도 엔진의 진행 상황 콜백과 취소 토큰을 거칩니다.
+    target(출력 파일/디렉토리) 옆의 manifest와 규칙 캐시 디렉토리를 사용합니다.
+    그룹별 파일 싱크에서는 규칙과 설정이 모두 그대로인 그룹의 파일을 다시 쓰지 않고 재사용하며,
+    xlsx처럼 한 파일에 모든 그룹을 담는 출력은 캐시된 코드로 키워드 문자열만 다시 만들어 기록합니다.
+    dedup을 주면 규칙 순서 전체가 같을 때만 그룹 파일을 재사용합니다 (남는 키워드가 달라질 수 있으므로).
+    report(RunReport)를 주면 규칙별 생성(캐시에서 읽은 규칙은 키워드 문자열을 만드는 시간)과 기록을 계측합니다.
+    """
+    manifest_path = manifest_path_for(target)
+    previous = OutputManifest.load(manifest_path)
+    manifest = build_manifest(engine.df_data, engine.category_titles, engine.column_index, engine.limits,
+                              engine.constraints, engine.priority_groups, settings)
+    cache = RuleOutputCache(rule_cache_dir_for(target))
+    chunk_size = engine.chunk_size
+    
+    changed = {rule_str for rule_str, info in manifest.rules.items() if not cache.exists(info['hash'])}
+    print(f"증분 생성: 규칙 {len(manifest.rules)}개 중 {len(changed)}개 다시 생성")
+    
+    # 남아 있는 그룹은 이전 실행의 출력 파일 이름을 그대로 사용 (이름이 겹쳐 번호를 붙인 그룹 포함)
+    groups = {info['group'] for info in manifest.rules.values()}
+    if previous is not None:
+        sink.claim_file_names({group: info.get('file') for group, info in previous.groups.items() if group in groups})
+    
+    # 규칙 해시 목록과 설정이 이전과 같은 그룹은 출력 파일 재사용
+    reused_groups = set()
+    if previous is not None and previous.settings_hash == manifest.settings_hash:
+        rule_hashes = [info['hash'] for info in manifest.rules.values()]
+        previous_hashes = [info['hash'] for info in previous.rules.values()]
+        if dedup is None or rule_hashes == previous_hashes:
+            for group, info in previous.groups.items():
+                if info['rules'] == manifest.group_rule_hashes(group) and sink.reuse_group(group, info['rows']):
+                    reused_groups.add(group)
+    
+    generated = itertools.groupby(engine.iter_codes(rules=changed, finish=False), key=lambda item: item[0])
+    pending = next(generated, None)
+    
+    def iter_cached_or_generated_codes(rule_str, info):
+        """규칙의 (값 목록, 코드 배열 목록)을 청크 단위로 반환 (바뀐 규칙은 생성하면서 캐시에 저장)"""
+        nonlocal pending
+        if rule_str not in changed:
+            cached = cache.load(info['hash'])
+            if cached is not None:
+                values_list, code_chunks = cached
+                for codes in code_chunks:
+                    rows = len(codes[0])
+                    for start in range(0, rows, chunk_size):
+                        engine.check_cancelled()
+                        engine.advance(rule_str, info['group'], min(chunk_size, rows - start))
+                        yield values_list, [column[start:start + chunk_size] for column in codes]
+                return
+            # 캐시 파일을 읽을 수 없으면 그 규칙만 따로 다시 생성
+            items = engine.iter_codes(rules={rule_str}, finish=False)
+        elif pending is not None and pending[0] == rule_str:
+            items = pending[1]
+            pending = None
+        else:
+            # 조합이 하나도 없는 규칙
+            items = []
+        
+        # 생성한 청크는 바로 캐시 파일에 이어 쓰고, 규칙을 끝까지 기록했을 때만 캐시로 남김
+        writer = cache.writer(info['hash'])
+        try:
+            for _, _, _, str_values_list, codes in items:
+                writer.write(str_values_list, codes)
+                yield str_values_list, codes
+        except BaseException:
+            writer.discard()
+            raise
+        writer.commit()
+        if rule_str in changed and pending is None:
+            pending = next(generated, None)
+    
+    summary = KeywordSummary()
+    written_groups = set()
+    for rule_str, info in manifest.rules.items():
+        group = info['group']
+        column_names = [engine.column_index[key]['name'] for key in info['columns']]
+        chunks = (build_coded_chunk(rule_str, group, column_names, values_list, codes)
+                  for values_list, codes in iter_cached_or_generated_codes(rule_str, info))
+        if report is not None:
+            chunks = report.time_chunks(chunks)
+        for chunk in chunks:
+            if dedup is not None:
+                chunk = dedup.filter(chunk)
+            summary.update(chunk)
+            if group not in reused_groups and len(chunk):
+                with measure(report, 'write', len(chunk)):
+                    sink.write_chunk(chunk)
+                written_groups.add(group)
+    engine.finish()
+    
+    print("Dashboard 생성 중...")
+    with measure(report, 'dashboard'):
+        sink.write_dashboard(build_dashboard_data(summary, dedup, engine.budget))
+    with measure(report, 'write'):
+        sink.close()
+    
+    # 이전 실행에만 있던 그룹(또는 이번에 키워드가 없는 그룹)의 출력 삭제
+    if previous is not None:
+        for group, info in previous.groups.items():
+            if group not in written_groups and group not in reused_groups:
+                sink.discard_group(group, info.get('file'))
+    
+    finish_manifest(manifest, summary, sink.output_names, sink.file_names).save(manifest_path)
+    cache.prune(info['hash'] for info in manifest.rules.values())
+    
+    return {
+        'total': sink.total_rows,
+        'summary': summary,
+        'outputs': sink.output_names,
+        'regenerated_rules': len(changed),
+        'reused_rules': len(manifest.rules) - len(changed),
+        'reused_groups': sorted(reused_groups)
+    }
+
+def save_to_excel(results_df, output_dir, workers=1, dedup=None):
+    """Dashboard와 그룹별 시트로 분리하여 엑셀 파일 저장
+    
+    그룹 시트가 엑셀 행 제한(1,048,576행)을 넘으면 '그룹_2', '그룹_3' 시트로 나뉩니다.
+    workers가 2 이상이면 그룹 시트를 여러 프로세스에서 병렬로 직렬화합니다.
+    dedup(KeywordDeduplicator)을 주면 중복 키워드를 제거하고 저장합니다.
+    """
+    filepath = make_output_path(output_dir)
+    
+    print("그룹별 시트 생성 중...")
+    chunks = iter_dataframe_chunks(results_df)
+    if dedup is not None:
+        chunks = dedup.filter_chunks(chunks)
+    stats = save_chunks(chunks, create_sink('xlsx', filepath, RESULT_COLUMNS, workers=workers), dedup)
     
     print(f"결과 저장 완료: {filepath}")
-    return filepath, len(results_df)
+    return filepath, stats['total']
 
-def parse_arguments():
-    """명령행 인자 파싱"""
+def build_parser():
+    """명령행 인자 파서 (일괄 처리(keyword_batch.py)에서도 파일마다 같은 옵션을 해석하는 데 사용)"""
     parser = argparse.ArgumentParser(
         description='키워드 조합 생성기',
         formatter_class=argparse.RawDescriptionHelpFormatter,
@@ -214,6 +2595,15 @@ def parse_arguments():
   %(prog)s -i data.xlsx                              # 특정 파일 사용
   %(prog)s -i data.xlsx -o results                   # 출력 디렉토리 지정
   %(prog)s --input path/to/file.xlsx --output ./out  # 전체 경로 지정
+  %(prog)s -i data.xlsx -f csv --compression gzip    # 그룹별 CSV(gzip) 파일로 저장
+  %(prog)s -i data.xlsx --workers 8                  # 8개 프로세스로 병렬 생성
+  %(prog)s -i data.xlsx --plan                       # 생성 없이 예상 규모만 확인
+  %(prog)s -i data.xlsx --dedup exact                # 규칙/그룹 간 중복 키워드 제거
+  %(prog)s -i data.xlsx --collapse-whitespace --max-length 80  # 값 공백 정리, 80자 넘는 키워드 제외
+  %(prog)s -i data.xlsx -f csv --incremental         # 바뀐 규칙만 다시 생성하고 나머지 그룹 파일은 재사용
+  %(prog)s -i data.xlsx --max-rows 1000000 --budget-policy sample  # 최대 100만 행을 규칙별로 고르게 추출
+  %(prog)s -i data.xlsx --quiet --report             # 진행 출력 없이 단계별 실행 보고서(JSON) 저장
+  %(prog)s -i data.xlsx --profile run.prof           # cProfile 결과 저장
         """
     )
     
@@ -229,18 +2619,238 @@ def parse_arguments():
         help='출력 디렉토리 경로 (기본값: output)'
     )
     
+    parser.add_argument(
+        '-f', '--format',
+        choices=OUTPUT_FORMATS,
+        default='xlsx',
+        help='출력 형식 (기본값: xlsx). xlsx 외 형식은 그룹별 파일을 하위 디렉토리에 저장'
+    )
+    
+    parser.add_argument(
+        '--compression',
+        choices=COMPRESSIONS,
+        default='none',
+        help='csv/tsv/jsonl/parquet 출력 압축 방식 (기본값: none, zstd는 zstandard 패키지 필요)'
+    )
+    
+    parser.add_argument(
+        '-w', '--workers',
+        type=int,
+        default=1,
+        help='사용할 프로세스 수 (기본값: 1, 2 이상이면 규칙/청크를 병렬 생성하고 xlsx 시트도 병렬로 직렬화)'
+    )
+    
+    parser.add_argument(
+        '--collapse-whitespace',
+        action='store_true',
+        help='컬럼 값의 앞뒤 공백을 지우고 연속 공백을 하나로 정리 (정리 후 같아진 값은 하나로 합침)'
+    )
+    
+    parser.add_argument(
+        '--case-fold',
+        action='store_true',
+        help='컬럼 값의 대소문자 구분 제거 (예: "Botox"와 "botox"를 같은 값으로 처리)'
+    )
+    
+    parser.add_argument(
+        '--korean-spacing',
+        choices=KOREAN_SPACING_MODES,
+        default='keep',
+        help='한국어 띄어쓰기 정규화 (기본값: keep, join: 한글 사이 공백 제거, split: 한글과 영문·숫자 사이 공백 추가)'
+    )
+    
+    parser.add_argument(
+        '--max-length',
+        type=int,
+        default=None,
+        help='키워드 최대 글자 수 (넘는 조합은 생성하지 않음)'
+    )
+    
+    parser.add_argument(
+        '--max-words',
+        type=int,
+        default=None,
+        help='키워드 최대 단어 수 (넘는 조합은 생성하지 않음)'
+    )
+    
+    parser.add_argument(
+        '--constraints',
+        default=None,
+        metavar='FILE',
+        help="제외/포함 제약조건 시트('제약조건')를 읽을 워크북 (기본값: 입력 파일)"
+    )
+    
+    parser.add_argument(
+        '--no-constraints',
+        action='store_true',
+        help='제약조건 시트가 있어도 적용하지 않음'
+    )
+    
+    parser.add_argument(
+        '--dedup',
+        choices=DEDUP_MODES,
+        default='none',
+        help='규칙/그룹 간 중복 키워드 제거 (기본값: none, exact: 해시 집합, bloom: 고정 메모리 확률적 판별)'
+    )
+    
+    parser.add_argument(
+        '--dedup-priority',
+        nargs='+',
+        metavar='GROUP',
+        default=[],
+        help='중복 키워드를 남길 우선 그룹 (지정한 순서대로 먼저 생성, 기본값: 처음 나온 키워드 유지)'
+    )
+    
+    parser.add_argument(
+        '--dedup-error-rate',
+        type=float,
+        default=BLOOM_ERROR_RATE,
+        help=f'bloom 모드에서 고유 키워드를 중복으로 오인할 확률 (기본값: {BLOOM_ERROR_RATE})'
+    )
+    
+    parser.add_argument(
+        '--max-rows',
+        type=int,
+        default=None,
+        help='생성할 전체 키워드 수 한도 (넘을 때의 처리는 --budget-policy)'
+    )
+    
+    parser.add_argument(
+        '--max-rule-rows',
+        type=int,
+        default=None,
+        help='조합 규칙 하나에서 생성할 키워드 수 한도'
+    )
+    
+    parser.add_argument(
+        '--max-seconds',
+        type=float,
+        default=None,
+        help='키워드 생성 시간 한도 (초)'
+    )
+    
+    parser.add_argument(
+        '--max-rss',
+        type=parse_size,
+        default=None,
+        metavar='SIZE',
+        help='생성 중 프로세스 메모리(RSS) 한도 (예: 512M, 4G, 병렬 워커 메모리는 제외)'
+    )
+    
+    parser.add_argument(
+        '--budget-policy',
+        choices=BUDGET_POLICIES,
+        default='abort',
+        help='한도를 넘을 때의 처리 (기본값: abort, truncate: 규칙 앞에서부터 한도까지, '
+             'sample: 규칙 전체에서 고르게 추출, 시간/메모리 한도는 그때까지 만든 결과로 마무리)'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='이전 실행의 manifest와 비교해 입력 컬럼/그룹이 바뀐 규칙만 다시 생성 (출력 이름 고정: generated_keywords)'
+    )
+    
+    parser.add_argument(
+        '--quiet',
+        action='store_true',
+        help='규칙/청크마다 출력하는 진행 상황을 생략'
+    )
+    
+    parser.add_argument(
+        '--report',
+        nargs='?',
+        const='',
+        default=None,
+        metavar='PATH',
+        help='단계별/규칙별 소요 시간과 행/초를 JSON 실행 보고서로 저장 (기본 경로: <출력>.report.json)'
+    )
+    
+    parser.add_argument(
+        '--trace-memory',
+        action='store_true',
+        help='실행 보고서에 단계별 tracemalloc 최대 메모리 기록 (--report 포함, 실행이 몇 배 느려짐)'
+    )
+    
+    parser.add_argument(
+        '--profile',
+        default=None,
+        metavar='PATH',
+        help='실행 전체의 cProfile 결과를 PATH에 저장 (python -m pstats PATH로 확인)'
+    )
+    
+    parser.add_argument(
+        '--plan',
+        action='store_true',
+        help='키워드를 생성하지 않고 규칙/그룹별 키워드 수, 예상 출력 크기와 메모리만 출력'
+    )
+    
+    parser.add_argument(
+        '--cache-dir',
+        default=DEFAULT_CACHE_DIR,
+        help='파싱된 입력 워크북 캐시 디렉토리 (기본값: ~/.cache/keyword_generator)'
+    )
+    
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='입력 워크북 캐시를 사용하지 않고 항상 새로 파싱'
+    )
+    
     parser.add_argument(
         '--version',
         action='version',
         version='키워드 생성기 v1.0'
     )
     
-    return parser.parse_args()
+    return parser
+
+def parse_arguments(argv=None):
+    """명령행 인자 파싱"""
+    return build_parser().parse_args(argv)
 
 def main():
     """메인 함수"""
     # 명령행 인자 파싱
     args = parse_arguments()
+    if not args.profile:
+        return run(args)
+    
+    # --profile: 실행 전체를 cProfile로 기록 (병렬 워커 프로세스는 포함되지 않음)
+    profiler = cProfile.Profile()
+    try:
+        return profiler.runcall(run, args)
+    finally:
+        profiler.dump_stats(args.profile)
+        print(f"프로파일 저장: {args.profile} (확인: python -m pstats {args.profile})")
+
+def run(args, cancel=None, progress=None):
+    """명령행 인자에 따라 키워드 생성 실행
+    
+    cancel(CancellationToken)과 progress(진행 상황 콜백)를 주면 Ctrl+C 외에 호출한 쪽에서도
+    생성을 취소하고 진행 상황을 받을 수 있습니다 (일괄 처리, 작업 서버).
+    메인 스레드에서 호출하면 생성하는 동안 Ctrl+C가 현재 청크를 마친 뒤 취소하도록 바꾸고,
+    끝나면 원래 SIGINT 처리기로 되돌립니다.
+    """
+    # --report: 단계별 시간/행 수 계측 (--trace-memory면 tracemalloc 최대 메모리도 기록)
+    if args.trace_memory and args.report is None:
+        args.report = ''
+    report = RunReport(trace_memory=args.trace_memory) if args.report is not None else None
+    previous_handler = None
+    if threading.current_thread() is threading.main_thread():
+        previous_handler = signal.getsignal(signal.SIGINT)
+    try:
+        return run_generation(args, cancel, progress, report, interruptible=previous_handler is not None)
+    finally:
+        if previous_handler is not None:
+            signal.signal(signal.SIGINT, previous_handler)
+        if report is not None:
+            # 워커 프로세스에서 이어서 처리하는 다음 작업이 메모리 추적을 물려받지 않도록 중지
+            report.close()
+
+def run_generation(args, cancel=None, progress=None, report=None, interruptible=False):
+    """run()의 본체 (report는 RunReport, interruptible이면 엔진을 준비한 뒤 Ctrl+C를 취소 요청으로 처리)"""
+    verbose = not args.quiet
     
     print("=== 키워드 생성기 시작 ===")
     print(f"소스 파일: {args.input}")
@@ -256,44 +2866,225 @@ def main():
         return 1
     
     # 1. 소스 데이터 로드
-    df_data, column_numbers, category_titles = load_source_data(args.input)
+    cache_dir = None if args.no_cache else args.cache_dir
+    with measure(report, 'load') as stage:
+        df_data, column_numbers, category_titles = load_source_data(args.input, cache_dir)
+        stage['rows'] = 0 if df_data is None else len(df_data)
     if df_data is None:
         print("❌ 데이터 로드 실패")
         return 1
     
-    # 2. 키워드 조합 생성
-    results_df = generate_keyword_combinations(df_data, column_numbers, category_titles)
-    if results_df.empty:
-        print("❌ 키워드 조합 생성 실패")
+    # 컬럼별 고유값 인덱스 (계획과 생성에서 공유, 값 정규화는 여기서 한 번만 적용)
+    with measure(report, 'mapping') as stage:
+        normalizer = None
+        if args.collapse_whitespace or args.case_fold or args.korean_spacing != 'keep':
+            normalizer = ValueNormalizer(args.collapse_whitespace, args.case_fold, args.korean_spacing)
+        # 제외/포함 제약조건은 입력 워크북 또는 --constraints 워크북의 '제약조건' 시트
+        inputs = prepare_generation(args.input, df_data, category_titles, cache_dir, normalizer,
+                                    KeywordLimits(args.max_length, args.max_words),
+                                    args.constraints, not args.no_constraints)
+        column_index, limits, constraints = inputs['column_index'], inputs['limits'], inputs['constraints']
+        stage['rows'] = sum(len(entry['values']) for entry in column_index.values())
+    if normalizer is not None:
+        print(f"값 정규화 ({normalizer.describe()}): 컬럼 값 {normalizer.values_in:,}개 -> {normalizer.values_out:,}개")
+    if constraints is not None:
+        print(f"제약조건: {constraints.describe()}")
+        for warning in constraints.warnings:
+            print(f"  ⚠️ {warning}")
+    
+    # 생성 계획만 출력하고 종료
+    if args.plan:
+        with measure(report, 'plan') as stage:
+            plan = plan_keyword_generation(df_data, column_numbers, category_titles, workers=args.workers,
+                                           column_index=column_index, limits=limits, constraints=constraints)
+            stage['rows'] = plan['total_keywords']
+        print_generation_plan(plan)
+        if report is not None:
+            save_run_report(report, args.report or os.path.join(args.output, 'plan.report.json'),
+                            input=args.input, plan=True)
+        return 0
+    
+    # 자원 예산 (행 수 한도는 계획으로 규칙별 한도를 정하고, 시간/메모리는 청크마다 확인)
+    budget = GenerationBudget(args.max_rows, args.max_rule_rows, args.max_seconds, args.max_rss, args.budget_policy)
+    if budget:
+        print(f"자원 예산: {budget.describe()}")
+        if args.incremental and budget.policy != 'abort':
+            print("❌ --incremental은 결과를 줄이는 예산 정책(truncate/sample)과 함께 사용할 수 없습니다")
+            return 1
+    
+    # 2. 생성 엔진 준비 (진행 상황은 청크마다 출력, Ctrl+C는 현재 청크를 마친 뒤 중단)
+    priority_groups = args.dedup_priority if args.dedup != 'none' else None
+    if cancel is None:
+        cancel = CancellationToken()
+    
+    def report_progress(snapshot):
+        if verbose:
+            print_progress(snapshot)
+        if progress is not None:
+            progress(snapshot)
+    
+    try:
+        with measure(report, 'plan'):
+            engine = KeywordEngine(df_data, column_numbers, category_titles, column_index, limits, constraints,
+                                   priority_groups, workers=args.workers,
+                                   progress=report_progress if verbose or progress is not None else None,
+                                   cancel=cancel, verbose=verbose, budget=budget)
+    except BudgetExceeded as e:
+        print(f"❌ 자원 예산 초과: {e}")
         return 1
+    worker_stats = engine.worker_stats
+    if engine.quotas:
+        print(f"자원 예산: 조합 규칙 {len(engine.quotas):,}개를 한도에 맞게 줄여 최대 {engine.rows_planned:,}개 생성")
+    
+    def request_cancel(signum, frame):
+        print("\n⏹ 중지 요청: 현재 청크를 마친 뒤 멈춥니다 (한 번 더 누르면 즉시 종료)")
+        cancel.cancel()
+        signal.signal(signal.SIGINT, signal.default_int_handler)
+    
+    if interruptible:
+        signal.signal(signal.SIGINT, request_cancel)
+    
+    # 중복 제거 단계 준비
+    dedup = None
+    if args.dedup != 'none':
+        groups = set(build_rule_group_mapping(df_data, verbose=False).values())
+        for group in args.dedup_priority:
+            if group not in groups:
+                print(f"⚠️ 우선 그룹을 찾을 수 없습니다: {group}")
+        capacity = engine.plan['total_keywords'] if args.dedup == 'bloom' else None
+        dedup = KeywordDeduplicator(args.dedup, capacity, args.dedup_error_rate, args.dedup_priority)
+    
+    # 키워드 조합 생성 (청크 단위 스트리밍, --incremental은 저장 단계에서 바뀐 규칙만 생성)
+    if not args.incremental:
+        chunks = engine.iter_chunks()
+        if dedup is not None:
+            chunks = dedup.filter_chunks(chunks)
+        if report is not None:
+            chunks = report.time_chunks(chunks)
+        try:
+            first_chunk = next(chunks, None)
+        except BudgetExceeded as e:
+            print(f"❌ 자원 예산 초과: {e}")
+            return 1
+        except GenerationCancelled:
+            print("⏹ 키워드 생성이 취소되었습니다.")
+            return 130
+        if first_chunk is None:
+            print("❌ 키워드 조합 생성 실패")
+            return 1
     
-    # 3. 엑셀 파일로 저장
+    # 3. 생성되는 대로 출력 형식에 맞게 기록
+    sink = None
     try:
-        filepath, total_count = save_to_excel(results_df, args.output)
-        print(f"총 {total_count:,}개의 키워드 조합이 저장되었습니다.")
+        extension = 'xlsx' if args.format == 'xlsx' else None
+        filepath = make_output_path(args.output, extension, timestamp=not args.incremental)
+        sink = create_sink(args.format, filepath, RESULT_COLUMNS, args.compression, workers=args.workers)
+        # 규칙 해시에 들어가지 않지만 출력 파일 내용에 영향을 주는 설정
+        settings = {
+            'format': args.format,
+            'compression': args.compression,
+            'dedup': args.dedup,
+            'dedup_priority': args.dedup_priority,
+            'dedup_error_rate': args.dedup_error_rate
+        }
+        if budget and budget.policy != 'abort':
+            settings['budget'] = budget.describe()
+        
+        sample_rows = []
+        
+        def collect_sample(chunks):
+            """스트리밍 중 처음 10개 행을 샘플로 보관"""
+            for chunk in chunks:
+                if len(sample_rows) < 10:
+                    sample_rows.extend(chunk.head(10 - len(sample_rows)).to_dict('records'))
+                yield chunk
+        
+        print(f"\n그룹별 {args.format} 출력 생성 중...")
+        if args.incremental:
+            stats = save_incremental(engine, sink, filepath, settings, dedup, report)
+            if not stats['total']:
+                print("❌ 키워드 조합 생성 실패")
+                return 1
+            print(f"증분 생성: 규칙 {stats['regenerated_rules']:,}개 다시 생성, {stats['reused_rules']:,}개 캐시 사용, "
+                  f"그룹 출력 {len(stats['reused_groups']):,}개 재사용")
+        else:
+            stats = save_chunks(collect_sample(itertools.chain([first_chunk], chunks)), sink, dedup, report,
+                                verbose=False, budget=engine.budget)
+            with measure(report, 'manifest'):
+                manifest = build_manifest(df_data, category_titles, column_index, limits, constraints,
+                                          priority_groups, settings)
+                finish_manifest(manifest, stats['summary'], stats['outputs'],
+                                sink.file_names).save(manifest_path_for(filepath))
+        print(f"결과 저장 완료: {filepath}")
+        print(f"총 {stats['total']:,}개의 키워드 조합이 저장되었습니다.")
         
         # 통계 출력
         print("\n=== 생성 결과 통계 ===")
         print("규칙별 키워드 개수 (상위 10개):")
-        print(results_df['rule'].value_counts().head(10))
+        summary = stats['summary']
+        for rule, count in summary.top_rules(10):
+            print(f"  {rule}: {count:,}")
         
         print("\n그룹별 키워드 개수:")
-        print(results_df['group'].value_counts())
+        for group, count in summary.top_groups():
+            print(f"  {group}: {count:,}")
+        
+        print(f"\n중복 키워드: {summary.duplicates:,}개, 평균 길이: {summary.average_length:.1f}자")
+        if (limits or constraints is not None) and not budget.applied:
+            unlimited = plan_keyword_generation(df_data, column_numbers, category_titles,
+                                                column_index=column_index)['total_keywords']
+            limited = dedup.checked if dedup is not None else summary.total
+            print(f"길이 제한/제약조건: {unlimited:,}개 조합 중 {unlimited - limited:,}개를 생성 전에 제외")
+        if dedup is not None:
+            print(f"중복 제거 - {dedup.describe()}: {dedup.checked:,}개 중 {dedup.removed:,}개 제거, "
+                  f"{format_bytes(dedup.memory_bytes)} 사용")
+            for (kept_group, removed_group), count in dedup.collisions.most_common(10):
+                print(f"  {kept_group} → {removed_group}: {count:,}")
+        if budget.applied:
+            print(f"자원 예산 - {budget.describe()}:")
+            if budget.cuts:
+                print(f"  조합 규칙 {len(budget.cuts):,}개를 한도에 맞게 줄여 {budget.removed:,}개 제외")
+            if budget.stopped is not None:
+                print(f"  ⚠️ {budget.stopped['reason']}: {budget.stopped['rows']:,}개 생성 후 중단, "
+                      f"규칙 {budget.stopped['skipped_rules']:,}개 생성하지 못함")
         
-        print(f"\n생성된 시트:")
-        print(f"  1. Dashboard (통계 정보)")
-        for i, group in enumerate(results_df['group'].unique(), 2):
-            group_count = len(results_df[results_df['group'] == group])
-            print(f"  {i}. {group} ({group_count:,}개 키워드)")
+        print(f"\n생성된 {'시트' if args.format == 'xlsx' else '파일'}:")
+        for i, output_name in enumerate(stats['outputs'], 1):
+            if i == 1 and output_name.startswith(DASHBOARD_NAME):
+                print(f"  {i}. {output_name} (통계 정보)")
+            else:
+                print(f"  {i}. {output_name}")
         
-        print(f"\n=== 생성된 키워드 샘플 (처음 10개) ===")
-        for i, row in results_df.head(10).iterrows():
-            print(f"{i+1}. [{row['rule']}] [{row['group']}] {row['keyword']}")
+        if worker_stats:
+            print_worker_stats(worker_stats)
+        
+        if sample_rows:
+            print(f"\n=== 생성된 키워드 샘플 (처음 10개) ===")
+            for i, row in enumerate(sample_rows):
+                print(f"{i+1}. [{row['rule']}] [{row['group']}] {row['keyword']}")
+        
+        if report is not None:
+            save_run_report(report, args.report or f"{filepath}.report.json", input=args.input, output=filepath,
+                            format=args.format, workers=args.workers, keywords=stats['total'],
+                            worker_stats={str(pid): worker for pid, worker in worker_stats.items()})
         
         print("\n=== 키워드 생성기 완료 ===")
         return 0
         
+    except BudgetExceeded as e:
+        if sink is not None:
+            sink.close()
+        print(f"❌ 자원 예산 초과로 생성을 중단했습니다: {e} ({engine.rows:,}개 생성 후 중단, 출력은 완성되지 않았습니다)")
+        return 1
+    except GenerationCancelled:
+        # 열린 출력은 기록한 데까지 닫아 둠 (Dashboard 없음)
+        if sink is not None:
+            sink.close()
+        print(f"⏹ 키워드 생성이 취소되었습니다 ({engine.rows:,}개 생성 후 중단, 출력은 완성되지 않았습니다).")
+        return 130
     except Exception as e:
+        if sink is not None:
+            sink.abort()
         print(f"❌ 저장 중 오류 발생: {e}")
         return 1
 
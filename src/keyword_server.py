@@ -0,0 +1,578 @@
+#!/usr/bin/env python3
+"""
+키워드 생성 작업 서버 (HTTP)
+
+다른 도구가 워크북을 올려 키워드 생성을 요청하고, 작업 ID로 진행 상황을 확인한 뒤 결과를 내려받을 수 있는
+작은 HTTP 서버입니다 (표준 라이브러리만 사용). 생성은 미리 띄워 둔 워커 프로세스 풀(--jobs)에서
+keyword_batch와 같은 방식으로 run()을 호출해 처리하므로 HTTP 요청을 처리하는 스레드를 막지 않습니다.
+동시에 실행하는 작업은 --jobs개, 대기열은 --max-queue개까지이며 대기열이 차면 503으로 거절합니다.
+
+API:
+  POST   /jobs?format=csv&max-rows=1000000   본문: 워크북(.xlsx) 바이트 → 202 {"id", "status", ...}
+  GET    /jobs                               작업 목록
+  GET    /jobs/<id>                          상태와 진행 상황 (queued, running, ok, failed, cancelled)
+  GET    /jobs/<id>/result                   결과 내려받기 (xlsx는 그대로, 디렉토리 출력은 zip으로 스트리밍)
+  GET    /jobs/<id>/log                      실행 로그
+  DELETE /jobs/<id>                          대기/실행 중이면 취소, 끝난 작업이면 파일까지 삭제
+  GET    /health                             실행/대기 작업 수
+
+쿼리 매개변수는 keyword_generator.py의 긴 옵션 이름(예: max-rows=1000000, dedup=exact, quiet)이며
+값이 없으면 플래그로, 같은 이름을 여러 번 주면 여러 값(dedup-priority=A&dedup-priority=B)으로 넘깁니다.
+name은 옵션이 아니라 작업 이름(내려받을 파일 이름)입니다.
+
+사용법:
+  python keyword_server.py --port 8765 --jobs 2
+  python keyword_server.py --jobs 4 --max-workers 2 -- --max-rss 4G --budget-policy truncate --quiet
+  curl --data-binary @clients.xlsx "http://127.0.0.1:8765/jobs?name=clients.xlsx&format=csv"
+"""
+
+import argparse
+import contextlib
+import json
+import multiprocessing
+import os
+import shutil
+import signal
+import sys
+import tempfile
+import threading
+import time
+import urllib.parse
+import uuid
+import zipfile
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from datetime import datetime
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from keyword_batch import (
+    CRASH_RETRIES, LOG_FILE, RESERVED_OPTIONS, crash_entry, init_worker, process_workbook, split_options
+)
+from keyword_generator import CancellationToken, build_parser as build_generator_parser, parse_size
+
+# 작업 디렉토리 (환경 변수로 변경 가능)
+DEFAULT_JOB_DIR = os.environ.get(
+    'KEYWORD_GENERATOR_JOB_DIR',
+    os.path.join(tempfile.gettempdir(), 'keyword_generator_jobs')
+)
+
+# 끝난 작업을 보관하는 시간 (초, 새 작업을 받을 때 지난 작업 삭제)
+JOB_TTL_SECONDS = 6 * 60 * 60
+
+# 업로드와 내려받기를 읽고 쓰는 단위
+STREAM_BLOCK_SIZE = 1024 * 1024
+
+# 끝난 작업 상태
+FINISHED_STATUSES = ('ok', 'failed', 'cancelled')
+
+# 요청마다 정해지거나 서버에서 처리할 수 없는 옵션
+SERVER_RESERVED_OPTIONS = (*RESERVED_OPTIONS, '-h', '--help', '--version')
+
+# 옵션이 아닌 쿼리 매개변수 (작업 이름)
+NAME_PARAM = 'name'
+
+class JobRequestError(Exception):
+    """잘못된 작업 요청 (HTTP 상태 코드와 메시지)"""
+
+    def __init__(self, status, message):
+        super().__init__(message)
+        self.status = status
+
+def query_options(params):
+    """쿼리 매개변수 목록 [(이름, 값)]을 생성 옵션 인자 목록으로 변환
+
+    값이 없으면 플래그(--quiet), 값이 하나면 --이름=값, 같은 이름이 여러 번이면 --이름 값1 값2로 넘깁니다.
+    """
+    values = {}
+    for key, value in params:
+        if key != NAME_PARAM:
+            values.setdefault(f"--{key.replace('_', '-')}", []).append(value)
+    options = []
+    for option, items in values.items():
+        if option in SERVER_RESERVED_OPTIONS:
+            raise JobRequestError(HTTPStatus.BAD_REQUEST, f"{option}: 작업 서버에서 정하는 옵션이라 지정할 수 없습니다")
+        if items == ['']:
+            options.append(option)
+        elif len(items) == 1:
+            options.append(f"{option}={items[0]}")
+        else:
+            options.extend([option, *items])
+    return options
+
+def check_options(options, max_workers):
+    """생성 옵션을 keyword_generator의 파서로 미리 해석해 잘못된 옵션이면 JobRequestError 발생
+
+    줄임 옵션(--inp 등)으로 입력/출력 경로를 바꾸지 못하도록 해석 결과도 확인합니다.
+    """
+    parser = build_generator_parser()
+
+    def error(message):
+        raise JobRequestError(HTTPStatus.BAD_REQUEST, message)
+
+    parser.error = error
+    args = parser.parse_args(['-i', 'job', '-o', 'job', *options])
+    if (args.input, args.output, args.report, args.profile) != ('job', 'job', None, None):
+        error("입력/출력/보고서 경로는 작업 서버에서 정하는 옵션이라 지정할 수 없습니다")
+    if args.workers > max_workers:
+        error(f"--workers는 이 서버에서 {max_workers} 이하여야 합니다")
+    return args
+
+def run_job(path, output_dir, options, cancel_event, progress):
+    """워커 프로세스에서 작업 하나를 처리 (취소는 cancel_event, 진행 상황은 progress dict로 주고받음)"""
+    return process_workbook(path, output_dir, options, CancellationToken(cancel_event), progress.update)
+
+class Job:
+    """작업 하나의 상태 (입력, 출력 디렉토리, 생성 옵션, 진행 상황, 결과 항목)"""
+
+    def __init__(self, job_id, name, job_dir, options, cancel_event, progress):
+        self.id = job_id
+        self.name = name
+        self.job_dir = job_dir
+        self.input = os.path.join(job_dir, 'input.xlsx')
+        self.output_dir = os.path.join(job_dir, 'output')
+        self.options = options
+        self.cancel_event = cancel_event
+        self.progress = progress
+        self.status = 'queued'
+        self.created = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.started = None
+        self.finished = None
+        self.finished_at = None
+        self.crashes = 0
+        self.entry = {}
+
+    @property
+    def result_path(self):
+        """결과 파일(xlsx) 또는 디렉토리 경로 (성공하지 않았으면 None)"""
+        if self.status != 'ok':
+            return None
+        output = self.entry.get('output')
+        return output if output and os.path.exists(output) else None
+
+    def to_dict(self, position=None):
+        progress = self.progress if isinstance(self.progress, dict) else dict(self.progress)
+        data = {
+            'id': self.id,
+            'name': self.name,
+            'status': self.status,
+            'options': self.options,
+            'created': self.created,
+            'started': self.started,
+            'finished': self.finished,
+            'progress': progress or None,
+            'cancel_requested': self.status == 'running' and self.cancel_event.is_set()
+        }
+        if position is not None:
+            data['position'] = position
+        if self.status in FINISHED_STATUSES:
+            data.update({key: self.entry.get(key) for key in ('keywords', 'seconds', 'stages', 'error')})
+            if self.result_path is not None:
+                data['result'] = f"/jobs/{self.id}/result"
+        return data
+
+class JobService:
+    """작업 대기열과 워커 프로세스 풀
+
+    작업은 대기열(최대 max_queue개)에 쌓이고 jobs개의 배분 스레드가 하나씩 꺼내 프로세스 풀에 넘기므로
+    동시에 실행되는 작업은 항상 jobs개 이하입니다. 취소 Event와 진행 상황 dict는 Manager 프로세스를 거쳐
+    워커와 공유합니다. 워커가 비정상 종료되면 풀을 새로 만들고, 그때 실행 중이던 작업은 CRASH_RETRIES번까지
+    대기열 맨 앞에서 다시 실행합니다.
+    """
+
+    def __init__(self, root=DEFAULT_JOB_DIR, jobs=2, max_queue=16, max_workers=1, max_upload=None,
+                 ttl=JOB_TTL_SECONDS, options=()):
+        self.root = root
+        self.jobs = jobs
+        self.max_queue = max_queue
+        self.max_workers = max_workers
+        self.max_upload = max_upload
+        self.ttl = ttl
+        self.options = list(options)
+        self.jobs_by_id = {}
+        self.queue = deque()
+        self.condition = threading.Condition()
+        self.closed = False
+        os.makedirs(root, exist_ok=True)
+        # HTTP 처리 스레드가 도는 중에 fork하지 않도록 워커와 Manager는 spawn으로 시작
+        self.context = multiprocessing.get_context('spawn')
+        self.manager = self.context.Manager()
+        self.executor = self.new_executor()
+        self.dispatchers = [threading.Thread(target=self.dispatch, name=f"job-dispatcher-{i}", daemon=True)
+                            for i in range(jobs)]
+        for thread in self.dispatchers:
+            thread.start()
+
+    def new_executor(self):
+        return ProcessPoolExecutor(max_workers=self.jobs, mp_context=self.context, initializer=init_worker,
+                                   initargs=(None,))
+
+    def get(self, job_id):
+        with self.condition:
+            job = self.jobs_by_id.get(job_id)
+        if job is None:
+            raise JobRequestError(HTTPStatus.NOT_FOUND, f"작업을 찾을 수 없습니다: {job_id}")
+        return job
+
+    def describe(self, job):
+        with self.condition:
+            position = self.queue.index(job) + 1 if job.status == 'queued' else None
+            return job.to_dict(position)
+
+    def list(self):
+        with self.condition:
+            jobs = list(self.jobs_by_id.values())
+        return [self.describe(job) for job in jobs]
+
+    def health(self):
+        with self.condition:
+            running = sum(job.status == 'running' for job in self.jobs_by_id.values())
+            return {'running': running, 'queued': len(self.queue), 'jobs': self.jobs, 'max_queue': self.max_queue}
+
+    def submit(self, stream, length, params):
+        """업로드 본문(stream에서 length바이트)을 작업 디렉토리에 저장하고 대기열에 넣은 작업 반환"""
+        if length is None:
+            raise JobRequestError(HTTPStatus.LENGTH_REQUIRED, "Content-Length가 필요합니다")
+        if self.max_upload and length > self.max_upload:
+            raise JobRequestError(HTTPStatus.REQUEST_ENTITY_TOO_LARGE,
+                                  f"워크북이 너무 큽니다 ({length:,}바이트, 한도 {self.max_upload:,}바이트)")
+        options = query_options(params)
+        check_options([*self.options, *options], self.max_workers)
+        name = os.path.basename(dict(params).get(NAME_PARAM) or 'workbook.xlsx')
+        self.cleanup()
+        with self.condition:
+            if len(self.queue) >= self.max_queue:
+                raise JobRequestError(HTTPStatus.SERVICE_UNAVAILABLE,
+                                      f"대기열이 가득 찼습니다 ({self.max_queue}개), 잠시 후 다시 요청해 주세요")
+
+        job_id = uuid.uuid4().hex
+        job_dir = os.path.join(self.root, job_id)
+        job = Job(job_id, name, job_dir, [*self.options, *options], self.manager.Event(), self.manager.dict())
+        os.makedirs(job_dir)
+        try:
+            with open(job.input, 'wb') as f:
+                head = stream.read(min(length, 4))
+                if head != b'PK\x03\x04':
+                    raise JobRequestError(HTTPStatus.UNSUPPORTED_MEDIA_TYPE, "xlsx 워크북만 받을 수 있습니다")
+                f.write(head)
+                remaining = length - len(head)
+                while remaining:
+                    block = stream.read(min(remaining, STREAM_BLOCK_SIZE))
+                    if not block:
+                        raise JobRequestError(HTTPStatus.BAD_REQUEST, "업로드가 중간에 끊겼습니다")
+                    f.write(block)
+                    remaining -= len(block)
+            with self.condition:
+                # 업로드하는 동안 다른 요청이 대기열을 채웠을 수 있으므로 다시 확인
+                if len(self.queue) >= self.max_queue:
+                    raise JobRequestError(HTTPStatus.SERVICE_UNAVAILABLE,
+                                          f"대기열이 가득 찼습니다 ({self.max_queue}개), 잠시 후 다시 요청해 주세요")
+                self.jobs_by_id[job_id] = job
+                self.queue.append(job)
+                self.condition.notify()
+        except BaseException:
+            shutil.rmtree(job_dir, ignore_errors=True)
+            raise
+        return job
+
+    def cancel(self, job):
+        """대기 중이면 바로 취소, 실행 중이면 현재 청크를 마친 뒤 취소되도록 요청, 끝난 작업이면 파일 삭제
+
+        작업이 삭제되었으면 True를 반환합니다.
+        """
+        with self.condition:
+            if job.status == 'queued':
+                self.queue.remove(job)
+                self.finish(job, {'status': 'cancelled'})
+                return False
+            if job.status == 'running':
+                job.cancel_event.set()
+                return False
+            self.jobs_by_id.pop(job.id, None)
+        shutil.rmtree(job.job_dir, ignore_errors=True)
+        return True
+
+    def cleanup(self):
+        """끝난 지 ttl이 지난 작업과 파일 삭제"""
+        now = time.monotonic()
+        with self.condition:
+            expired = [job for job in self.jobs_by_id.values()
+                       if job.finished_at is not None and now - job.finished_at > self.ttl]
+            for job in expired:
+                del self.jobs_by_id[job.id]
+        for job in expired:
+            shutil.rmtree(job.job_dir, ignore_errors=True)
+
+    def finish(self, job, entry):
+        """작업을 끝난 상태로 기록 (condition을 잡은 채 호출)
+
+        진행 상황은 Manager와의 연결 없이 볼 수 있도록 마지막 값을 복사해 둡니다.
+        """
+        job.entry = entry
+        job.status = entry['status']
+        job.finished = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        job.finished_at = time.monotonic()
+        with contextlib.suppress(Exception):
+            job.progress = dict(job.progress)
+
+    def dispatch(self):
+        """배분 스레드: 대기열에서 작업을 꺼내 프로세스 풀에서 실행하고 끝날 때까지 기다림"""
+        while True:
+            with self.condition:
+                while not self.queue and not self.closed:
+                    self.condition.wait()
+                if self.closed:
+                    return
+                job = self.queue.popleft()
+                job.status = 'running'
+                job.started = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+                executor = self.executor
+            try:
+                entry = executor.submit(run_job, job.input, job.output_dir, job.options, job.cancel_event,
+                                        job.progress).result()
+            except BrokenProcessPool:
+                self.replace_executor(executor)
+                with self.condition:
+                    job.crashes += 1
+                    if job.crashes < CRASH_RETRIES and not job.cancel_event.is_set() and not self.closed:
+                        print(f"  ↻ 워커 프로세스가 종료되어 작업을 다시 실행합니다: {job.id}")
+                        job.status = 'queued'
+                        self.queue.appendleft(job)
+                        self.condition.notify()
+                        continue
+                entry = crash_entry(job.input, job.output_dir)
+            except Exception as e:
+                entry = {'status': 'failed', 'error': f"{type(e).__name__}: {e}"}
+            with self.condition:
+                self.finish(job, entry)
+            keywords = entry.get('keywords')
+            print(f"  작업 {job.id} ({job.name}): {job.status}"
+                  f"{f', 키워드 {keywords:,}개' if keywords is not None else ''}")
+
+    def replace_executor(self, broken):
+        """비정상 종료된 프로세스 풀을 새 풀로 교체 (여러 배분 스레드가 동시에 알아채도 한 번만)"""
+        with self.condition:
+            if self.executor is broken:
+                broken.shutdown(wait=False, cancel_futures=True)
+                self.executor = self.new_executor()
+
+    def shutdown(self):
+        """대기 중인 작업은 취소하고 실행 중인 작업은 현재 청크를 마친 뒤 취소되도록 요청한 뒤 종료"""
+        with self.condition:
+            self.closed = True
+            while self.queue:
+                self.finish(self.queue.popleft(), {'status': 'cancelled'})
+            for job in self.jobs_by_id.values():
+                if job.status == 'running':
+                    job.cancel_event.set()
+            self.condition.notify_all()
+        self.executor.shutdown(wait=True)
+        for thread in self.dispatchers:
+            thread.join()
+        self.manager.shutdown()
+
+class ChunkedWriter:
+    """HTTP/1.1 chunked 전송으로 쓰는 파일 객체 (zip 스트리밍용, block_size씩 모아서 전송)"""
+
+    def __init__(self, wfile, block_size=STREAM_BLOCK_SIZE):
+        self.wfile = wfile
+        self.block_size = block_size
+        self.buffer = bytearray()
+
+    def write(self, data):
+        self.buffer += data
+        if len(self.buffer) >= self.block_size:
+            self.flush()
+        return len(data)
+
+    def flush(self):
+        if self.buffer:
+            self.wfile.write(f"{len(self.buffer):X}\r\n".encode('ascii') + bytes(self.buffer) + b"\r\n")
+            self.buffer.clear()
+
+    def close(self):
+        self.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+def download_name(job, extension):
+    """내려받을 파일 이름 (작업 이름 + _keywords)"""
+    stem = os.path.splitext(job.name)[0] or job.id
+    return f"{stem}_keywords.{extension}"
+
+class JobRequestHandler(BaseHTTPRequestHandler):
+    """작업 API 요청 처리 (server.service의 JobService 사용)"""
+
+    protocol_version = 'HTTP/1.1'
+    server_version = 'KeywordJobServer/1'
+
+    @property
+    def service(self):
+        return self.server.service
+
+    def route(self):
+        """경로를 ('jobs', 작업 ID, 하위 경로) 형태로 나누고 쿼리 매개변수 목록과 함께 반환"""
+        url = urllib.parse.urlsplit(self.path)
+        parts = [part for part in url.path.split('/') if part]
+        params = urllib.parse.parse_qsl(url.query, keep_blank_values=True)
+        return parts, params
+
+    def send_json(self, status, data):
+        body = json.dumps(data, ensure_ascii=False, indent=2).encode('utf-8')
+        self.send_response(status)
+        self.send_header('Content-Type', 'application/json; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        if status == HTTPStatus.SERVICE_UNAVAILABLE:
+            self.send_header('Retry-After', '30')
+        self.end_headers()
+        self.wfile.write(body)
+
+    def send_error_json(self, error):
+        # 본문을 읽지 않고 거절한 요청은 연결을 다시 쓰지 않음
+        self.close_connection = True
+        self.send_json(error.status, {'error': str(error)})
+
+    def handle_request(self, method):
+        try:
+            parts, params = self.route()
+            if parts == ['health'] and method == 'GET':
+                return self.send_json(HTTPStatus.OK, self.service.health())
+            if parts == ['jobs'] and method == 'GET':
+                return self.send_json(HTTPStatus.OK, {'jobs': self.service.list()})
+            if parts == ['jobs'] and method == 'POST':
+                length = self.headers.get('Content-Length')
+                job = self.service.submit(self.rfile, int(length) if length and length.isdigit() else None, params)
+                return self.send_json(HTTPStatus.ACCEPTED, self.service.describe(job))
+            if len(parts) in (2, 3) and parts[0] == 'jobs':
+                job = self.service.get(parts[1])
+                action = parts[2] if len(parts) == 3 else None
+                if action is None and method == 'GET':
+                    return self.send_json(HTTPStatus.OK, self.service.describe(job))
+                if action is None and method == 'DELETE':
+                    if self.service.cancel(job):
+                        return self.send_json(HTTPStatus.OK, {'id': job.id, 'deleted': True})
+                    return self.send_json(HTTPStatus.ACCEPTED, self.service.describe(job))
+                if action == 'result' and method == 'GET':
+                    return self.send_result(job)
+                if action == 'log' and method == 'GET':
+                    return self.send_log(job)
+            raise JobRequestError(HTTPStatus.NOT_FOUND, f"알 수 없는 요청: {method} {self.path}")
+        except JobRequestError as e:
+            self.send_error_json(e)
+        except (BrokenPipeError, ConnectionResetError):
+            # 내려받는 도중 클라이언트가 연결을 끊음
+            self.close_connection = True
+
+    def send_result(self, job):
+        """결과 파일은 Content-Length와 함께 블록 단위로, 디렉토리 출력은 zip으로 묶어 chunked로 스트리밍"""
+        if job.status not in FINISHED_STATUSES:
+            raise JobRequestError(HTTPStatus.CONFLICT, f"작업이 아직 끝나지 않았습니다 ({job.status})")
+        path = job.result_path
+        if path is None:
+            raise JobRequestError(HTTPStatus.NOT_FOUND, f"결과가 없습니다 ({job.status})")
+        quoted = urllib.parse.quote
+
+        if os.path.isfile(path):
+            self.send_response(HTTPStatus.OK)
+            self.send_header('Content-Type', 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet')
+            self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quoted(download_name(job, 'xlsx'))}")
+            self.send_header('Content-Length', str(os.path.getsize(path)))
+            self.end_headers()
+            with open(path, 'rb') as f:
+                shutil.copyfileobj(f, self.wfile, STREAM_BLOCK_SIZE)
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'application/zip')
+        self.send_header('Content-Disposition', f"attachment; filename*=UTF-8''{quoted(download_name(job, 'zip'))}")
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
+        writer = ChunkedWriter(self.wfile)
+        # 이미 압축한 출력(gzip/zstd 등)은 다시 압축하지 않음
+        with zipfile.ZipFile(writer, 'w', zipfile.ZIP_DEFLATED) as archive:
+            for directory, _, names in os.walk(path):
+                for name in sorted(names):
+                    file_path = os.path.join(directory, name)
+                    compression = zipfile.ZIP_STORED if name.endswith(('.gz', '.zst', '.bz2', '.parquet')) else None
+                    archive.write(file_path, os.path.relpath(file_path, path), compress_type=compression)
+        writer.close()
+
+    def send_log(self, job):
+        try:
+            with open(os.path.join(job.output_dir, LOG_FILE), 'rb') as f:
+                body = f.read()
+        except FileNotFoundError:
+            raise JobRequestError(HTTPStatus.NOT_FOUND, f"실행 로그가 없습니다 ({job.status})")
+        self.send_response(HTTPStatus.OK)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def do_GET(self):
+        self.handle_request('GET')
+
+    def do_POST(self):
+        self.handle_request('POST')
+
+    def do_DELETE(self):
+        self.handle_request('DELETE')
+
+def parse_arguments(argv):
+    parser = argparse.ArgumentParser(
+        description='키워드 생성 작업 서버 (HTTP)',
+        usage='%(prog)s [--host HOST] [--port PORT] [-j JOBS] [--max-queue N] [-- 기본 생성 옵션 ...]',
+        epilog="'--' 뒤의 옵션은 모든 작업에 먼저 적용되는 기본 생성 옵션입니다 (요청의 쿼리 매개변수가 우선)",
+        allow_abbrev=False
+    )
+    parser.add_argument('--host', default='127.0.0.1', help='바인드할 주소 (기본값: 127.0.0.1)')
+    parser.add_argument('--port', type=int, default=8765, help='포트 (기본값: 8765)')
+    parser.add_argument('-j', '--jobs', type=int, default=min(2, os.cpu_count() or 1),
+                        help='동시에 실행할 작업 수 (워커 프로세스 수, 기본값: CPU 수와 2 중 작은 값)')
+    parser.add_argument('--max-queue', type=int, default=16,
+                        help='대기열에 둘 수 있는 작업 수 (넘으면 503, 기본값: 16)')
+    parser.add_argument('--max-workers', type=int, default=1,
+                        help='작업 하나가 --workers로 쓸 수 있는 최대 병렬 프로세스 수 (기본값: 1)')
+    parser.add_argument('--max-upload', type=parse_size, default=parse_size('100M'), metavar='SIZE',
+                        help='업로드할 수 있는 워크북 크기 (예: 50M, 0이면 제한 없음, 기본값: 100M)')
+    parser.add_argument('--ttl', type=float, default=JOB_TTL_SECONDS, metavar='SECONDS',
+                        help=f'끝난 작업과 결과를 보관하는 시간(초, 기본값: {JOB_TTL_SECONDS})')
+    parser.add_argument('--root', default=DEFAULT_JOB_DIR,
+                        help=f'작업 디렉토리 (기본값: {DEFAULT_JOB_DIR}, 환경 변수 KEYWORD_GENERATOR_JOB_DIR)')
+    return parser, parser.parse_args(argv)
+
+def main(argv=None):
+    own, options = split_options(sys.argv[1:] if argv is None else argv)
+    parser, args = parse_arguments(own)
+    if args.jobs < 1 or args.max_queue < 0 or args.max_workers < 1:
+        parser.error("--jobs와 --max-workers는 1 이상, --max-queue는 0 이상이어야 합니다")
+    try:
+        check_options(options, args.max_workers)
+    except JobRequestError as e:
+        parser.error(str(e))
+
+    # 포트를 먼저 열어 두어 실패하면 워커 프로세스를 띄우지 않음
+    server = ThreadingHTTPServer((args.host, args.port), JobRequestHandler)
+    server.daemon_threads = True
+    server.service = service = JobService(args.root, args.jobs, args.max_queue, args.max_workers, args.max_upload,
+                                          args.ttl, options)
+    # 서비스 관리자(systemd, docker 등)의 SIGTERM도 Ctrl+C처럼 작업을 정리한 뒤 종료
+    signal.signal(signal.SIGTERM, signal.default_int_handler)
+
+    print("=== 키워드 생성 작업 서버 시작 ===")
+    print(f"주소: http://{args.host}:{server.server_port}, 동시 작업 {args.jobs}개, 대기열 {args.max_queue}개")
+    print(f"작업 디렉토리: {args.root}")
+    if options:
+        print(f"기본 생성 옵션: {' '.join(options)}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        print("\n⏹ 종료 요청: 대기 중인 작업을 취소하고 실행 중인 작업이 멈출 때까지 기다립니다")
+    finally:
+        server.server_close()
+        service.shutdown()
+    print("=== 키워드 생성 작업 서버 종료 ===")
+    return 0
+
+if __name__ == "__main__":
+    exit(main())
@@ -0,0 +1,209 @@
+"""
+출력 옆에 기록하는 생성 manifest와 규칙별 결과 캐시
+
+manifest(JSON)는 컬럼별 값 해시, 규칙별 정의 해시, 그룹별 출력 파일을 기록합니다.
+--incremental 실행은 이전 manifest와 비교해 입력 컬럼이나 그룹이 바뀐 규칙만 다시 생성하고,
+나머지 규칙은 캐시 디렉토리에 저장해 둔 값 코드 배열을 그대로 사용합니다.
+"""
+
+import hashlib
+import json
+import os
+import pickle
+from datetime import datetime
+
+import numpy as np
+
+# manifest 형식 버전 (구조가 바뀌면 올려서 이전 manifest를 무시)
+MANIFEST_VERSION = 1
+
+def hash_text(*parts):
+    """문자열 조각들의 SHA-256 해시 (구분 문자로 이어 붙임)"""
+    digest = hashlib.sha256()
+    for part in parts:
+        digest.update(str(part).encode('utf-8'))
+        digest.update(b'\x1f')
+    return digest.hexdigest()
+
+def hash_values(values):
+    """컬럼 값 목록(순서 포함)의 해시"""
+    return hash_text(len(values), '\x00'.join(values))
+
+def manifest_path_for(target):
+    """출력 파일/디렉토리 옆의 manifest 경로"""
+    return f"{os.fspath(target).rstrip(os.sep)}.manifest.json"
+
+def rule_cache_dir_for(target):
+    """출력 파일/디렉토리 옆의 규칙별 결과 캐시 디렉토리"""
+    return f"{os.fspath(target).rstrip(os.sep)}.rules"
+
+class OutputManifest:
+    """한 번의 생성 실행에 대한 입력 해시와 출력 기록
+
+    columns: 컬럼 번호(문자열) -> {'name', 'hash', 'values'(값 개수)}
+    rules: 규칙 -> {'group', 'columns', 'hash', 'rows'} (생성 순서)
+    groups: 그룹 -> {'rules'(규칙 해시 목록), 'rows'}
+    outputs: 기록한 출력 이름(시트/파일) 목록
+    settings: 출력 형식처럼 규칙 해시에 들어가지 않지만 출력 파일 재사용 여부에 영향을 주는 설정
+    """
+
+    def __init__(self, settings=None):
+        self.version = MANIFEST_VERSION
+        self.created = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.settings = dict(settings or {})
+        self.columns = {}
+        self.rules = {}
+        self.groups = {}
+        self.outputs = []
+
+    @property
+    def settings_hash(self):
+        return hash_text(json.dumps(self.settings, sort_keys=True, ensure_ascii=False))
+
+    def group_rule_hashes(self, group):
+        """그룹에 속한 규칙들의 해시 목록 (생성 순서)"""
+        return [info['hash'] for info in self.rules.values() if info['group'] == group]
+
+    def to_dict(self):
+        return {
+            'version': self.version,
+            'created': self.created,
+            'settings': self.settings,
+            'columns': self.columns,
+            'rules': self.rules,
+            'groups': self.groups,
+            'outputs': self.outputs
+        }
+
+    def save(self, path):
+        """manifest를 JSON으로 저장 (임시 파일에 쓴 뒤 교체)"""
+        temp_path = f"{path}.{os.getpid()}.tmp"
+        with open(temp_path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+        os.replace(temp_path, path)
+
+    @classmethod
+    def load(cls, path):
+        """저장된 manifest 읽기 (없거나 형식이 다르면 None)"""
+        try:
+            with open(path, encoding='utf-8') as f:
+                data = json.load(f)
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        if data.get('version') != MANIFEST_VERSION:
+            return None
+        manifest = cls(data.get('settings'))
+        manifest.created = data.get('created')
+        manifest.columns = data.get('columns', {})
+        manifest.rules = data.get('rules', {})
+        manifest.groups = data.get('groups', {})
+        manifest.outputs = data.get('outputs', [])
+        return manifest
+
+class RuleCacheWriter:
+    """한 규칙의 값 코드 청크를 생성되는 대로 캐시 임시 파일에 이어 쓰는 기록기
+
+    파일은 헤더(값 목록) 뒤에 청크별 코드 배열 목록을 pickle로 차례로 덧붙인 형태이며,
+    규칙 전체 코드를 메모리에 모으지 않습니다. commit() 전까지는 임시 파일에만 쓰므로
+    중간에 취소되거나 실패한 규칙은 discard()로 지워 캐시에 남지 않습니다.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.temp_path = f"{path}.{os.getpid()}.tmp"
+        self.file = open(self.temp_path, 'wb')
+        self.header_written = False
+
+    def write_header(self, values_list):
+        pickle.dump({'values': values_list}, self.file, protocol=pickle.HIGHEST_PROTOCOL)
+        self.header_written = True
+
+    def write(self, values_list, codes):
+        """청크 하나의 컬럼별 값 코드 배열 기록 (values_list는 첫 청크에서만 헤더로 저장)"""
+        if not self.header_written:
+            self.write_header(values_list)
+        pickle.dump([np.asarray(column, dtype=np.int32) for column in codes], self.file,
+                    protocol=pickle.HIGHEST_PROTOCOL)
+
+    def commit(self):
+        """기록을 마치고 캐시 파일로 교체 (청크가 없으면 조합이 없는 규칙으로 저장)"""
+        if not self.header_written:
+            self.write_header(None)
+        self.file.close()
+        os.replace(self.temp_path, self.path)
+
+    def discard(self):
+        self.file.close()
+        try:
+            os.remove(self.temp_path)
+        except OSError:
+            pass
+
+class RuleOutputCache:
+    """규칙별 생성 결과(값 목록과 컬럼별 값 코드 배열)를 규칙 해시 이름의 파일로 보관하는 캐시
+
+    문자열 대신 코드만 저장하므로 결과 크기와 관계없이 작고, 다시 읽을 때 조합을 열거하거나
+    제약조건을 검사하지 않고 바로 키워드 문자열을 만들 수 있습니다.
+    쓰기(RuleCacheWriter)와 읽기 모두 청크 단위라 큰 규칙도 청크 하나만큼의 메모리만 씁니다.
+    """
+
+    def __init__(self, cache_dir):
+        self.cache_dir = cache_dir
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def path(self, rule_hash):
+        return os.path.join(self.cache_dir, f"{rule_hash}.codes")
+
+    def exists(self, rule_hash):
+        return os.path.exists(self.path(rule_hash))
+
+    def writer(self, rule_hash):
+        """규칙 결과를 청크 단위로 저장할 RuleCacheWriter"""
+        return RuleCacheWriter(self.path(rule_hash))
+
+    def save(self, rule_hash, values_list, code_chunks):
+        """규칙 결과 저장 (조합이 없는 규칙은 values_list=None, code_chunks=[])"""
+        writer = self.writer(rule_hash)
+        try:
+            for codes in code_chunks:
+                writer.write(values_list, codes)
+        except BaseException:
+            writer.discard()
+            raise
+        writer.commit()
+
+    def load(self, rule_hash):
+        """(값 목록, 청크별 코드 배열 목록을 차례로 읽는 이터레이터) 반환 (없거나 읽을 수 없으면 None)
+
+        헤더만 먼저 읽고, 코드 청크는 이터레이터를 순회할 때 파일에서 하나씩 읽습니다.
+        """
+        path = self.path(rule_hash)
+        try:
+            with open(path, 'rb') as f:
+                header = pickle.load(f)
+                offset = f.tell()
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+        if not isinstance(header, dict) or 'values' not in header:
+            return None
+
+        def iter_chunks():
+            with open(path, 'rb') as f:
+                f.seek(offset)
+                while True:
+                    try:
+                        yield pickle.load(f)
+                    except EOFError:
+                        return
+
+        return header['values'], iter_chunks()
+
+    def prune(self, keep_hashes):
+        """keep_hashes에 없는 규칙 결과 삭제 (이전 형식의 캐시 파일 포함)"""
+        keep = {os.path.basename(self.path(rule_hash)) for rule_hash in keep_hashes}
+        for name in os.listdir(self.cache_dir):
+            if name not in keep:
+                try:
+                    os.remove(os.path.join(self.cache_dir, name))
+                except OSError:
+                    pass
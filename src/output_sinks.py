@@ -0,0 +1,730 @@
+"""
+키워드 생성 결과를 파일로 내보내는 스트리밍 출력 모듈
+
+모든 싱크는 같은 순서로 사용합니다:
+write_chunk(결과 청크)를 생성되는 대로 반복 호출 -> write_dashboard -> close
+"""
+
+import contextlib
+import gzip
+import itertools
+import os
+import pickle
+import re
+import shutil
+import struct
+import tempfile
+import time
+import zlib
+from concurrent.futures import ProcessPoolExecutor
+from xml.sax.saxutils import escape, quoteattr
+
+import numpy as np
+import pandas as pd
+from openpyxl import Workbook
+
+# 엑셀 시트당 최대 행 수 (헤더 포함)
+EXCEL_MAX_ROWS = 1_048_576
+
+# 엑셀 시트 이름 최대 길이
+EXCEL_MAX_SHEET_NAME = 31
+
+# 지원하는 출력 형식과 압축 방식
+OUTPUT_FORMATS = ['xlsx', 'csv', 'tsv', 'jsonl', 'parquet']
+COMPRESSIONS = ['none', 'gzip', 'zstd']
+
+# 압축 방식별 파일 확장자
+COMPRESSION_SUFFIXES = {None: '', 'gzip': '.gz', 'zstd': '.zst'}
+
+# 파일 이름에 쓸 수 없는 문자
+INVALID_FILE_CHARS = re.compile(r'[\\/:*?"<>|\x00-\x1f]')
+
+# 엑셀 시트 이름에 쓸 수 없는 문자
+INVALID_SHEET_CHARS = re.compile(r'[\\/:*?\[\]\x00-\x1f]')
+
+# Dashboard 시트/파일 이름 (그룹 출력보다 먼저 예약)
+DASHBOARD_NAME = 'Dashboard'
+
+# XML 1.0에서 쓸 수 없는 제어 문자 (셀 값에서 제거)
+ILLEGAL_XML_CHARS = re.compile(r'[\x00-\x08\x0b\x0c\x0e-\x1f]')
+
+# 이 크기 이상인 zip 항목/오프셋은 ZIP64 확장 필드로 기록 (헤더 필드에는 ZIP64_MARKER를 씀)
+ZIP64_LIMIT = 0xFFFFFFFF
+ZIP64_MARKER = 0xFFFFFFFF
+
+def safe_sheet_name(name):
+    """그룹명을 엑셀 시트 이름으로 쓸 수 있게 변환 (앞뒤 작은따옴표도 허용되지 않음)"""
+    name = INVALID_SHEET_CHARS.sub('_', str(name)).strip().strip("'")
+    return name or '_'
+
+def split_sheet_name(group, part):
+    """그룹의 part번째 시트 이름 반환 (1 -> '그룹', 2 -> '그룹_2', ...)"""
+    group = safe_sheet_name(group)
+    if part == 1:
+        return group[:EXCEL_MAX_SHEET_NAME]
+    suffix = f"_{part}"
+    return group[:EXCEL_MAX_SHEET_NAME - len(suffix)] + suffix
+
+def safe_file_name(name):
+    """그룹명을 파일 이름으로 쓸 수 있게 변환"""
+    name = INVALID_FILE_CHARS.sub('_', str(name)).strip()
+    return name or '_'
+
+def unique_name(name, used_names, max_length=None):
+    """used_names에 없는 이름 반환 (겹치면 '_2', '_3'을 붙임) 후 used_names에 추가
+
+    엑셀 시트 이름과 대소문자를 구분하지 않는 파일 시스템을 고려해 대소문자 없이 비교하며,
+    max_length를 주면 번호를 붙일 자리만큼 이름을 잘라 길이 제한을 지킵니다.
+    """
+    candidate = name
+    suffix = 2
+    while candidate.casefold() in used_names:
+        tail = f"_{suffix}"
+        candidate = (name[:max_length - len(tail)] if max_length else name) + tail
+        suffix += 1
+    used_names.add(candidate.casefold())
+    return candidate
+
+def open_text_file(path, compression=None):
+    """압축 방식에 맞게 UTF-8 텍스트 쓰기용 파일 열기"""
+    if compression is None:
+        return open(path, 'w', encoding='utf-8', newline='')
+    if compression == 'gzip':
+        return gzip.open(path, 'wt', encoding='utf-8', newline='')
+    if compression == 'zstd':
+        try:
+            import zstandard
+        except ImportError:
+            raise ImportError("zstd 압축을 사용하려면 zstandard 패키지가 필요합니다: pip install zstandard")
+        return zstandard.open(path, 'wt', encoding='utf-8', newline='')
+    raise ValueError(f"지원하지 않는 압축 방식: {compression}")
+
+class KeywordSink:
+    """키워드 결과 출력 싱크의 공통 인터페이스"""
+
+    def __init__(self, columns):
+        self.columns = list(columns)
+        self.output_names = []
+        self.total_rows = 0
+        # 그룹 -> 출력 파일 이름(확장자 제외), 그룹마다 파일을 따로 쓰는 싱크만 채움
+        self.file_names = {}
+
+    def write_chunk(self, chunk_df):
+        """결과 DataFrame 청크를 그룹별 출력에 나누어 기록"""
+        for group, group_df in chunk_df.groupby('group', sort=False):
+            self.write_group(group, group_df[self.columns])
+            self.total_rows += len(group_df)
+
+    def write_group(self, group, group_df):
+        """한 그룹의 행들을 기록"""
+        raise NotImplementedError
+
+    def write_dashboard(self, dashboard_data, header=('항목', '값')):
+        """Dashboard 통계 기록"""
+        raise NotImplementedError
+
+    def reuse_group(self, group, rows):
+        """이전 실행에서 기록한 그룹 출력을 다시 쓰지 않고 그대로 사용 (가능하면 True)
+
+        그룹마다 파일을 따로 쓰는 싱크만 지원하며, 한 파일에 모든 그룹을 담는 싱크는 False를 반환합니다.
+        """
+        return False
+
+    def claim_file_names(self, file_names):
+        """이전 실행에서 그룹들이 쓰던 출력 파일 이름을 먼저 예약 (그룹 -> 파일 이름)"""
+
+    def discard_group(self, group, file_name=None):
+        """이전 실행에서 기록했지만 더 이상 없는 그룹의 출력(file_name) 삭제"""
+
+    def close(self):
+        """열린 출력을 모두 닫고 총 기록 행 수 반환"""
+        raise NotImplementedError
+
+    def abort(self):
+        """오류로 중단할 때 열린 출력을 조용히 닫음 (Dashboard 없이 기록한 데까지 남김)"""
+        with contextlib.suppress(Exception):
+            self.close()
+
+class StreamingExcelWriter(KeywordSink):
+    """openpyxl write-only 모드로 행을 바로 시트에 기록하는 엑셀 writer
+
+    행은 시트별 임시 파일로 바로 흘려보내므로 출력 크기와 관계없이 메모리가 일정합니다.
+    그룹 시트가 엑셀 행 제한에 도달하면 '그룹_2', '그룹_3' 시트로 이어서 기록합니다.
+    시트 이름에 쓸 수 없는 문자는 '_'로 바꾸고, 바꾸거나 31자로 자른 이름이 겹치면 번호를 붙입니다.
+    """
+
+    def __init__(self, target, columns, max_rows=EXCEL_MAX_ROWS):
+        super().__init__(columns)
+        self.target = target
+        self.max_rows = max_rows
+        self.workbook = Workbook(write_only=True)
+        # Dashboard가 첫 시트가 되도록 먼저 만들고 내용은 마지막에 채움
+        self.dashboard_sheet = self.workbook.create_sheet(DASHBOARD_NAME)
+        self.output_names.append(DASHBOARD_NAME)
+        self.used_names = {DASHBOARD_NAME.casefold()}
+        self.group_sheets = {}
+
+    @property
+    def sheet_names(self):
+        return self.output_names
+
+    def _open_sheet(self, group):
+        """그룹의 다음 시트를 만들고 헤더 기록"""
+        state = self.group_sheets.get(group)
+        part = 1 if state is None else state['part'] + 1
+        name = unique_name(split_sheet_name(group, part), self.used_names, EXCEL_MAX_SHEET_NAME)
+        sheet = self.workbook.create_sheet(name)
+        sheet.append(self.columns)
+        state = {'sheet': sheet, 'rows': 1, 'part': part}
+        self.group_sheets[group] = state
+        self.output_names.append(name)
+        return state
+
+    def write_rows(self, group, rows):
+        """한 그룹의 행(튜플)들을 기록하고, 시트가 가득 차면 다음 시트로 넘김"""
+        state = self.group_sheets.get(group)
+        for row in rows:
+            if state is None or state['rows'] >= self.max_rows:
+                state = self._open_sheet(group)
+            state['sheet'].append(row)
+            state['rows'] += 1
+
+    def write_group(self, group, group_df):
+        self.write_rows(group, group_df.itertuples(index=False, name=None))
+
+    def write_dashboard(self, dashboard_data, header=('항목', '값')):
+        self.dashboard_sheet.append(list(header))
+        for row in dashboard_data:
+            self.dashboard_sheet.append(list(row))
+
+    def close(self):
+        """워크북을 대상 파일(경로 또는 파일 객체)에 저장"""
+        self.workbook.save(self.target)
+        return self.total_rows
+
+    def abort(self):
+        """저장하지 않고 시트별 임시 파일만 닫음
+
+        write-only 시트는 행을 임시 파일로 흘려보내는 제너레이터를 열어 두므로, 닫지 않으면
+        종료할 때 가비지 컬렉션에서 이미 닫힌 파일에 쓰려다 오류를 출력합니다.
+        """
+        for sheet in self.workbook.worksheets:
+            if not sheet.closed:
+                with contextlib.suppress(Exception):
+                    sheet.close()
+
+class GroupFileSink(KeywordSink):
+    """그룹마다 파일 하나씩 기록하는 싱크의 공통 부분
+
+    출력 디렉토리에 '그룹명.확장자' 파일과 'Dashboard.확장자' 파일을 만듭니다.
+    파일 이름으로 바꾼 그룹명이 겹치면(예: 'a/b'와 'a_b', 'Dashboard' 그룹) 나중에 나온 그룹에 '_2', '_3'을 붙이며,
+    Dashboard 파일 이름은 그룹보다 먼저 예약합니다.
+    """
+
+    extension = None
+
+    def __init__(self, output_dir, columns, compression=None):
+        super().__init__(columns)
+        self.output_dir = output_dir
+        self.compression = compression
+        self.handles = {}
+        self.used_names = {DASHBOARD_NAME.casefold()}
+        os.makedirs(output_dir, exist_ok=True)
+
+    def file_path(self, file_name):
+        """확장자를 뺀 파일 이름의 경로"""
+        return os.path.join(self.output_dir, f"{file_name}.{self.extension}{COMPRESSION_SUFFIXES[self.compression]}")
+
+    def path_for(self, group):
+        """그룹 출력 파일 경로 (처음 나온 순서대로 겹치지 않는 이름을 정함)"""
+        file_name = self.file_names.get(group)
+        if file_name is None:
+            file_name = unique_name(safe_file_name(group), self.used_names)
+            self.file_names[group] = file_name
+        return self.file_path(file_name)
+
+    @property
+    def dashboard_path(self):
+        return self.file_path(DASHBOARD_NAME)
+
+    def open_output(self, path):
+        """출력 파일을 열고 핸들 반환"""
+        return open_text_file(path, self.compression)
+
+    def write_frame(self, handle, frame, first):
+        """열린 핸들에 DataFrame 기록 (first는 해당 파일의 첫 기록 여부)"""
+        raise NotImplementedError
+
+    def write_group(self, group, group_df):
+        handle = self.handles.get(group)
+        first = handle is None
+        if first:
+            path = self.path_for(group)
+            handle = self.open_output(path)
+            self.handles[group] = handle
+            self.output_names.append(os.path.basename(path))
+        self.write_frame(handle, group_df, first)
+
+    def write_dashboard(self, dashboard_data, header=('항목', '값')):
+        dashboard_df = pd.DataFrame(dashboard_data, columns=list(header)).astype(str)
+        handle = self.open_output(self.dashboard_path)
+        try:
+            self.write_frame(handle, dashboard_df, True)
+        finally:
+            handle.close()
+        self.output_names.insert(0, os.path.basename(self.dashboard_path))
+
+    def reuse_group(self, group, rows):
+        path = self.path_for(group)
+        if group in self.handles or not os.path.exists(path):
+            return False
+        self.output_names.append(os.path.basename(path))
+        self.total_rows += rows
+        return True
+
+    def claim_file_names(self, file_names):
+        # 남아 있는 그룹이 이전과 같은 파일을 쓰도록 해야 새 그룹이 다른 그룹의 이전 파일을 넘겨받지 않음
+        for group, file_name in file_names.items():
+            if file_name and group not in self.file_names and file_name.casefold() not in self.used_names:
+                self.file_names[group] = file_name
+                self.used_names.add(file_name.casefold())
+
+    def discard_group(self, group, file_name=None):
+        # 이번 실행에서 다른 그룹이 같은 이름을 쓰고 있다면 이미 새 내용이므로 지우지 않음
+        file_name = file_name or safe_file_name(group)
+        own_name = self.file_names.get(group, '').casefold() == file_name.casefold()
+        if file_name.casefold() in self.used_names and not own_name:
+            return
+        with contextlib.suppress(FileNotFoundError):
+            os.remove(self.file_path(file_name))
+
+    def close(self):
+        for handle in self.handles.values():
+            handle.close()
+        self.handles = {}
+        return self.total_rows
+
+class CsvSink(GroupFileSink):
+    """그룹별 CSV 파일 싱크"""
+
+    extension = 'csv'
+    separator = ','
+
+    def write_frame(self, handle, frame, first):
+        frame.to_csv(handle, sep=self.separator, header=first, index=False)
+
+class TsvSink(CsvSink):
+    """그룹별 TSV 파일 싱크"""
+
+    extension = 'tsv'
+    separator = '\t'
+
+class JsonlSink(GroupFileSink):
+    """그룹별 JSON Lines 파일 싱크 (한 줄에 키워드 하나)"""
+
+    extension = 'jsonl'
+
+    def write_frame(self, handle, frame, first):
+        handle.write(frame.to_json(orient='records', lines=True, force_ascii=False))
+
+class ParquetSink(GroupFileSink):
+    """그룹별 Parquet 파일 싱크 (청크 하나가 row group 하나)"""
+
+    extension = 'parquet'
+
+    def __init__(self, output_dir, columns, compression=None):
+        try:
+            import pyarrow
+            import pyarrow.parquet
+        except ImportError:
+            raise ImportError("Parquet 출력을 사용하려면 pyarrow 패키지가 필요합니다: pip install pyarrow")
+        self.pa = pyarrow
+        self.pq = pyarrow.parquet
+        super().__init__(output_dir, columns, compression)
+
+    def file_path(self, file_name):
+        # Parquet은 파일 내부에서 압축하므로 확장자를 붙이지 않음
+        return os.path.join(self.output_dir, f"{file_name}.{self.extension}")
+
+    def open_output(self, path):
+        # 스키마는 첫 청크를 받을 때 정해지므로 writer는 write_frame에서 생성
+        return {'path': path, 'writer': None}
+
+    def write_frame(self, handle, frame, first):
+        table = self.pa.Table.from_pandas(frame, preserve_index=False)
+        if handle['writer'] is None:
+            handle['writer'] = self.pq.ParquetWriter(
+                handle['path'], table.schema, compression=self.compression or 'snappy'
+            )
+        handle['writer'].write_table(table)
+
+    def write_dashboard(self, dashboard_data, header=('항목', '값')):
+        dashboard_df = pd.DataFrame(dashboard_data, columns=list(header)).astype(str)
+        self.pq.write_table(
+            self.pa.Table.from_pandas(dashboard_df, preserve_index=False),
+            self.dashboard_path,
+            compression=self.compression or 'snappy'
+        )
+        self.output_names.insert(0, os.path.basename(self.dashboard_path))
+
+    def close(self):
+        for handle in self.handles.values():
+            if handle['writer'] is not None:
+                handle['writer'].close()
+        self.handles = {}
+        return self.total_rows
+
+XLSX_NAMESPACE = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+RELATIONSHIP_NAMESPACE = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+PACKAGE_RELATIONSHIP_NAMESPACE = 'http://schemas.openxmlformats.org/package/2006/relationships'
+XML_DECLARATION = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+
+# 최소 스타일 (기본 글꼴 하나)
+XLSX_STYLES = (
+    XML_DECLARATION +
+    f'<styleSheet xmlns="{XLSX_NAMESPACE}">'
+    '<fonts count="1"><font><sz val="11"/><name val="Calibri"/></font></fonts>'
+    '<fills count="2"><fill><patternFill patternType="none"/></fill>'
+    '<fill><patternFill patternType="gray125"/></fill></fills>'
+    '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>'
+    '<cellStyleXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0"/></cellStyleXfs>'
+    '<cellXfs count="1"><xf numFmtId="0" fontId="0" fillId="0" borderId="0" xfId="0"/></cellXfs>'
+    '<cellStyles count="1"><cellStyle name="Normal" xfId="0" builtinId="0"/></cellStyles>'
+    '</styleSheet>'
+)
+
+def xml_cell(value):
+    """셀 하나의 XML (숫자는 값, 나머지는 inline 문자열)"""
+    if isinstance(value, (int, float, np.integer, np.floating)) and not isinstance(value, bool):
+        if pd.isna(value):
+            return '<c/>'
+        return f'<c><v>{value}</v></c>'
+    text = escape(ILLEGAL_XML_CHARS.sub('', str(value)))
+    return f'<c t="inlineStr"><is><t xml:space="preserve">{text}</t></is></c>'
+
+def xml_rows(rows, first_row):
+    """값 목록들을 first_row번째 행부터의 <row> XML로 변환 (헤더, Dashboard용)"""
+    return ''.join(
+        f'<row r="{first_row + i}">{"".join(xml_cell(value) for value in row)}</row>'
+        for i, row in enumerate(rows)
+    )
+
+def escape_column(values):
+    """문자열 목록을 XML 이스케이프한 목록으로 변환
+
+    값들을 구분 문자로 이어 붙인 큰 문자열 하나에서 치환한 뒤 다시 나누므로 값마다
+    치환 함수를 부르지 않습니다. 구분 문자나 제어 문자가 들어 있으면 값별로 처리합니다.
+    """
+    joined = '\x00'.join(values)
+    if ILLEGAL_XML_CHARS.search(joined.replace('\x00', '')) or joined.count('\x00') != len(values) - 1:
+        return [escape(ILLEGAL_XML_CHARS.sub('', value)) for value in values]
+    return escape(joined).split('\x00') if values else []
+
+def xml_frame_rows(frame, first_row):
+    """DataFrame 행들을 <row> XML로 변환 (컬럼 단위로 이스케이프한 뒤 행 순서로 이어 붙임)"""
+    cells = []
+    for position, name in enumerate(frame.columns):
+        column = frame[name]
+        numeric = pd.api.types.is_numeric_dtype(column) and not pd.api.types.is_bool_dtype(column)
+        if numeric and not column.isna().any():
+            opening, closing = '<c><v>', '</v></c>'
+            values = column.astype(str).tolist()
+        else:
+            opening, closing = '<c t="inlineStr"><is><t xml:space="preserve">', '</t></is></c>'
+            values = escape_column(column.fillna('').astype(str).tolist())
+        cells.extend([itertools.repeat(opening), values, itertools.repeat(closing)])
+    row_starts = [f'<row r="{row}">' for row in range(first_row, first_row + len(frame))]
+    return ''.join(itertools.chain.from_iterable(
+        zip(row_starts, *cells, itertools.repeat('</row>'))
+    ))
+
+class DeflateFile:
+    """zip 항목으로 넣을 내용을 raw deflate로 압축해 파일에 쓰면서 CRC와 크기 기록"""
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = open(path, 'wb')
+        # 시트 XML은 반복이 많아 가장 빠른 압축 수준으로도 크기 차이가 거의 없음
+        self.compressor = zlib.compressobj(1, zlib.DEFLATED, -15)
+        self.crc = 0
+        self.size = 0
+        self.compressed_size = 0
+
+    def write(self, text):
+        data = text.encode('utf-8')
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        compressed = self.compressor.compress(data)
+        self.compressed_size += len(compressed)
+        self.handle.write(compressed)
+
+    def close(self, name):
+        """압축을 마치고 zip 항목 정보 반환"""
+        compressed = self.compressor.flush()
+        self.compressed_size += len(compressed)
+        self.handle.write(compressed)
+        self.handle.close()
+        return {'name': name, 'path': self.path, 'crc': self.crc,
+                'size': self.size, 'compressed_size': self.compressed_size}
+
+def deflate_entry(name, text, work_dir):
+    """문자열 하나를 압축한 zip 항목 정보 반환"""
+    deflater = DeflateFile(os.path.join(work_dir, f"{safe_file_name(name)}.deflate"))
+    deflater.write(text)
+    return deflater.close(name)
+
+def serialize_group_sheets(task):
+    """한 그룹의 임시 저장 청크를 시트 XML로 직렬화하고 압축 (작업 프로세스에서 실행)
+
+    task: (임시 저장 파일, 시트 이름 목록, 컬럼 목록, 시트당 최대 행 수, 작업 디렉토리, 첫 시트 번호)
+    반환값: [(시트 이름, zip 항목 정보), ...]
+    """
+    spool_path, sheet_names, columns, max_rows, work_dir, first_index = task
+    sheets = []
+    deflater = None
+    row = max_rows
+
+    def close_sheet():
+        deflater.write('</sheetData></worksheet>')
+        index = first_index + len(sheets)
+        sheets.append((sheet_names[len(sheets)], deflater.close(f"xl/worksheets/sheet{index}.xml")))
+
+    with open(spool_path, 'rb') as spool:
+        while True:
+            try:
+                frame = pickle.load(spool)
+            except EOFError:
+                break
+            start = 0
+            while start < len(frame):
+                # 시트가 가득 차면 다음 시트로 넘김 (헤더 포함 max_rows행)
+                if row >= max_rows:
+                    if deflater is not None:
+                        close_sheet()
+                    index = first_index + len(sheets)
+                    deflater = DeflateFile(os.path.join(work_dir, f"sheet{index}.deflate"))
+                    deflater.write(XML_DECLARATION + f'<worksheet xmlns="{XLSX_NAMESPACE}"><sheetData>')
+                    deflater.write(xml_rows([columns], 1))
+                    row = 1
+                take = min(len(frame) - start, max_rows - row)
+                deflater.write(xml_frame_rows(frame.iloc[start:start + take], row + 1))
+                row += take
+                start += take
+    if deflater is not None:
+        close_sheet()
+    return sheets
+
+def zip_timestamp():
+    """현재 시각의 DOS 형식 (시간, 날짜)"""
+    now = time.localtime()
+    dos_time = (now.tm_hour << 11) | (now.tm_min << 5) | (now.tm_sec // 2)
+    dos_date = ((now.tm_year - 1980) << 9) | (now.tm_mon << 5) | now.tm_mday
+    return dos_time, dos_date
+
+def write_zip_archive(target, entries):
+    """미리 raw deflate로 압축해 둔 항목들로 zip 파일 작성 (4GB를 넘는 값은 ZIP64로 기록)"""
+    own_file = isinstance(target, (str, os.PathLike))
+    out = open(target, 'wb') if own_file else target
+    dos_time, dos_date = zip_timestamp()
+    try:
+        offset = 0
+        central = []
+        for entry in entries:
+            name = entry['name'].encode('utf-8')
+            zip64 = entry['size'] >= ZIP64_LIMIT or entry['compressed_size'] >= ZIP64_LIMIT
+            extra = struct.pack('<2H2Q', 1, 16, entry['size'], entry['compressed_size']) if zip64 else b''
+            header = struct.pack(
+                '<I5H3I2H', 0x04034b50, 45 if zip64 else 20, 0x0800, 8, dos_time, dos_date, entry['crc'],
+                ZIP64_MARKER if zip64 else entry['compressed_size'], ZIP64_MARKER if zip64 else entry['size'],
+                len(name), len(extra)
+            )
+            out.write(header + name + extra)
+            with open(entry['path'], 'rb') as data:
+                shutil.copyfileobj(data, out, 1024 * 1024)
+            central.append((entry, name, offset))
+            offset += len(header) + len(name) + len(extra) + entry['compressed_size']
+
+        central_start = offset
+        for entry, name, local_offset in central:
+            # ZIP64 확장 필드에는 한도를 넘는 값만 (원본 크기, 압축 크기, 오프셋) 순서로 기록
+            fields = []
+            values = []
+            for value in (entry['size'], entry['compressed_size'], local_offset):
+                if value >= ZIP64_LIMIT:
+                    values.append(value)
+                    fields.append(ZIP64_MARKER)
+                else:
+                    fields.append(value)
+            extra = struct.pack(f'<2H{len(values)}Q', 1, 8 * len(values), *values) if values else b''
+            version = 45 if values else 20
+            record = struct.pack(
+                '<I6H3I5H2I', 0x02014b50, version, version, 0x0800, 8, dos_time, dos_date, entry['crc'],
+                fields[1], fields[0], len(name), len(extra), 0, 0, 0, 0, fields[2]
+            )
+            out.write(record + name + extra)
+            offset += len(record) + len(name) + len(extra)
+
+        central_size = offset - central_start
+        count = len(central)
+        if central_start >= ZIP64_LIMIT or central_size >= ZIP64_LIMIT or count >= 0xFFFF:
+            out.write(struct.pack('<IQ2H2I4Q', 0x06064b50, 44, 45, 45, 0, 0, count, count, central_size, central_start))
+            out.write(struct.pack('<2IQI', 0x07064b50, 0, offset, 1))
+            out.write(struct.pack('<I4H2IH', 0x06054b50, 0, 0, 0xFFFF, 0xFFFF, ZIP64_MARKER, ZIP64_MARKER, 0))
+        else:
+            out.write(struct.pack('<I4H2IH', 0x06054b50, 0, 0, count, count, central_size, central_start, 0))
+    finally:
+        if own_file:
+            out.close()
+
+class ParallelExcelWriter(KeywordSink):
+    """그룹별 시트 XML을 여러 프로세스에서 동시에 직렬화하는 엑셀 writer
+
+    write_chunk는 행을 그룹별 임시 파일에 나누어 담기만 하고(한 번 순회), close에서
+    작업 프로세스들이 그룹마다 시트 XML을 직접 만들어 압축한 뒤 하나의 .xlsx로 묶습니다.
+    문자열은 inline 문자열로 기록하므로 공유 문자열 표 없이 시트끼리 독립적입니다.
+    시트 구성(Dashboard가 첫 시트, 행 제한 초과 시 '그룹_2' 시트)은 StreamingExcelWriter와 같습니다.
+    """
+
+    def __init__(self, target, columns, workers=None, max_rows=EXCEL_MAX_ROWS):
+        super().__init__(columns)
+        self.target = target
+        self.workers = workers or os.cpu_count() or 1
+        self.max_rows = max_rows
+        self.work_dir = tempfile.mkdtemp(prefix='keyword_xlsx_')
+        self.spools = {}
+        self.group_rows = {}
+        self.dashboard_rows = []
+        self.output_names.append(DASHBOARD_NAME)
+
+    @property
+    def sheet_names(self):
+        return self.output_names
+
+    def write_group(self, group, group_df):
+        spool = self.spools.get(group)
+        if spool is None:
+            spool = open(os.path.join(self.work_dir, f"group{len(self.spools)}.pkl"), 'wb')
+            self.spools[group] = spool
+            self.group_rows[group] = 0
+        pickle.dump(group_df, spool, protocol=pickle.HIGHEST_PROTOCOL)
+        self.group_rows[group] += len(group_df)
+
+    def write_dashboard(self, dashboard_data, header=('항목', '값')):
+        self.dashboard_rows = [list(header)] + [list(row) for row in dashboard_data]
+
+    def _group_tasks(self):
+        """그룹별 직렬화 작업 목록 (시트 번호는 Dashboard 다음인 2번부터)"""
+        tasks = []
+        used_names = {DASHBOARD_NAME.casefold()}
+        index = 2
+        for group, spool in self.spools.items():
+            spool.close()
+            parts = max(1, -(-self.group_rows[group] // (self.max_rows - 1)))
+            # 시트 이름 규칙(문자 치환, 31자 제한, 겹치면 번호)은 StreamingExcelWriter와 같음
+            names = [unique_name(split_sheet_name(group, part), used_names, EXCEL_MAX_SHEET_NAME)
+                     for part in range(1, parts + 1)]
+            tasks.append((spool.name, names, self.columns, self.max_rows, self.work_dir, index))
+            index += parts
+        return tasks
+
+    def close(self):
+        """그룹 시트를 병렬로 직렬화하고 대상(파일 경로 또는 파일 객체)에 .xlsx로 저장"""
+        try:
+            tasks = self._group_tasks()
+            dashboard_xml = (
+                XML_DECLARATION + f'<worksheet xmlns="{XLSX_NAMESPACE}"><sheetData>'
+                + xml_rows(self.dashboard_rows, 1) + '</sheetData></worksheet>'
+            )
+            sheets = [(DASHBOARD_NAME, deflate_entry('xl/worksheets/sheet1.xml', dashboard_xml, self.work_dir))]
+            if self.workers > 1 and len(tasks) > 1:
+                with ProcessPoolExecutor(max_workers=min(self.workers, len(tasks))) as executor:
+                    for group_sheets in executor.map(serialize_group_sheets, tasks):
+                        sheets.extend(group_sheets)
+            else:
+                for task in tasks:
+                    sheets.extend(serialize_group_sheets(task))
+
+            self.output_names[:] = [name for name, _ in sheets]
+            write_zip_archive(self.target, self.package_entries(sheets) + [entry for _, entry in sheets])
+        finally:
+            shutil.rmtree(self.work_dir, ignore_errors=True)
+        return self.total_rows
+
+    def abort(self):
+        """저장하지 않고 그룹별 임시 파일과 작업 디렉토리 정리"""
+        for spool in self.spools.values():
+            spool.close()
+        shutil.rmtree(self.work_dir, ignore_errors=True)
+
+    def package_entries(self, sheets):
+        """워크북 구조 파일(콘텐츠 형식, 관계, workbook.xml, 스타일)의 zip 항목"""
+        content_types = (
+            XML_DECLARATION +
+            '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">'
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>'
+            '<Default Extension="xml" ContentType="application/xml"/>'
+            '<Override PartName="/xl/workbook.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet.main+xml"/>'
+            '<Override PartName="/xl/styles.xml" '
+            'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.styles+xml"/>'
+            + ''.join(
+                f'<Override PartName="/{entry["name"]}" '
+                'ContentType="application/vnd.openxmlformats-officedocument.spreadsheetml.worksheet+xml"/>'
+                for _, entry in sheets
+            )
+            + '</Types>'
+        )
+        root_rels = (
+            XML_DECLARATION + f'<Relationships xmlns="{PACKAGE_RELATIONSHIP_NAMESPACE}">'
+            f'<Relationship Id="rId1" Type="{RELATIONSHIP_NAMESPACE}/officeDocument" Target="xl/workbook.xml"/>'
+            '</Relationships>'
+        )
+        workbook = (
+            XML_DECLARATION + f'<workbook xmlns="{XLSX_NAMESPACE}" xmlns:r="{RELATIONSHIP_NAMESPACE}"><sheets>'
+            + ''.join(
+                f'<sheet name={quoteattr(name)} sheetId="{i}" r:id="rId{i}"/>'
+                for i, (name, _) in enumerate(sheets, 1)
+            )
+            + '</sheets></workbook>'
+        )
+        workbook_rels = (
+            XML_DECLARATION + f'<Relationships xmlns="{PACKAGE_RELATIONSHIP_NAMESPACE}">'
+            + ''.join(
+                f'<Relationship Id="rId{i}" Type="{RELATIONSHIP_NAMESPACE}/worksheet" '
+                f'Target="{entry["name"][len("xl/"):]}"/>'
+                for i, (_, entry) in enumerate(sheets, 1)
+            )
+            + f'<Relationship Id="rId{len(sheets) + 1}" Type="{RELATIONSHIP_NAMESPACE}/styles" Target="styles.xml"/>'
+            '</Relationships>'
+        )
+        return [
+            deflate_entry('[Content_Types].xml', content_types, self.work_dir),
+            deflate_entry('_rels/.rels', root_rels, self.work_dir),
+            deflate_entry('xl/workbook.xml', workbook, self.work_dir),
+            deflate_entry('xl/_rels/workbook.xml.rels', workbook_rels, self.work_dir),
+            deflate_entry('xl/styles.xml', XLSX_STYLES, self.work_dir),
+        ]
+
+# 형식별 그룹 파일 싱크
+FILE_SINKS = {
+    'csv': CsvSink,
+    'tsv': TsvSink,
+    'jsonl': JsonlSink,
+    'parquet': ParquetSink,
+}
+
+def create_sink(output_format, target, columns, compression=None, workers=1):
+    """출력 형식에 맞는 싱크 생성
+
+    xlsx는 target을 파일 경로(또는 파일 객체)로, 나머지 형식은 출력 디렉토리로 사용합니다.
+    xlsx에서 workers가 2 이상이면 그룹 시트를 병렬로 직렬화하는 ParallelExcelWriter를 사용합니다.
+    """
+    if compression == 'none':
+        compression = None
+    if output_format == 'xlsx':
+        if workers > 1:
+            return ParallelExcelWriter(target, columns, workers)
+        return StreamingExcelWriter(target, columns)
+    if output_format not in FILE_SINKS:
+        raise ValueError(f"지원하지 않는 출력 형식: {output_format}")
+    return FILE_SINKS[output_format](target, columns, compression)
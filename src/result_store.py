@@ -0,0 +1,224 @@
+"""
+키워드 생성 결과를 임시 디렉토리에 저장하는 결과 저장소
+
+웹앱 세션은 결과 DataFrame이나 엑셀 바이트 대신 가벼운 ResultHandle만 들고 있고,
+값 코드는 결과별 디렉토리에 .npy 파일로 저장해 필요할 때 memory-map으로 읽습니다.
+마지막 사용 후 TTL이 지났거나 전체 크기 한도를 넘은 결과는 오래된 것부터 삭제합니다.
+"""
+
+import os
+import pickle
+import shutil
+import tempfile
+import threading
+import time
+import uuid
+
+import numpy as np
+
+from keyword_generator import CompactKeywordResults
+
+# 결과 저장 디렉토리 (환경 변수로 변경 가능)
+DEFAULT_STORE_DIR = os.environ.get(
+    'KEYWORD_GENERATOR_RESULT_DIR',
+    os.path.join(tempfile.gettempdir(), 'keyword_generator_results')
+)
+
+# 마지막 사용 후 결과를 보관하는 시간 (초)
+STORE_TTL_SECONDS = 6 * 60 * 60
+
+# 저장소 전체 크기 한도 (넘으면 오래 사용하지 않은 결과부터 삭제)
+STORE_MAX_BYTES = 4 * 1024 * 1024 * 1024
+
+# 결과 디렉토리 안의 메타데이터 파일 (규칙 정보, 마지막 사용 시각 기준)
+META_FILE = 'meta.pkl'
+
+# 기록 중인 내보내기 파일의 확장자 (이런 파일이 있는 결과는 정리하지 않음)
+PART_SUFFIX = '.part'
+
+# 새로 만든 내보내기 파일로 대체된 이전 파일을 남겨 두는 시간 (초, 다른 세션이 아직 읽을 수 있도록)
+SUPERSEDED_GRACE_SECONDS = 10 * 60
+
+class ResultHandle:
+    """저장된 결과를 가리키는 가벼운 핸들 (세션 상태에 저장)"""
+
+    def __init__(self, result_id, rows):
+        self.result_id = result_id
+        self.rows = rows
+
+    def __len__(self):
+        return self.rows
+
+class ResultStore:
+    """결과별 디렉토리에 값 코드 배열과 내보낸 파일을 저장하는 저장소
+
+    여러 세션이 같은 저장소 객체를 공유하며, 로드할 때마다 마지막 사용 시각을 갱신합니다.
+    """
+
+    def __init__(self, root=DEFAULT_STORE_DIR, ttl=STORE_TTL_SECONDS, max_bytes=STORE_MAX_BYTES):
+        self.root = root
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.lock = threading.Lock()
+        os.makedirs(root, exist_ok=True)
+
+    def result_dir(self, handle):
+        return os.path.join(self.root, handle.result_id)
+
+    def save(self, results):
+        """CompactKeywordResults를 저장하고 핸들 반환"""
+        frame = results.frame
+        handle = ResultHandle(uuid.uuid4().hex, len(frame))
+        path = self.result_dir(handle)
+        os.makedirs(path)
+
+        np.save(os.path.join(path, 'rule_ids.npy'), frame['rule'].cat.codes.to_numpy().astype(np.int32))
+        code_columns = [name for name in frame.columns if name.startswith('c') and name[1:].isdigit()]
+        for name in code_columns:
+            np.save(os.path.join(path, f'{name}.npy'), frame[name].to_numpy())
+
+        meta = {
+            'rules': results.rules,
+            'rule_groups': results.rule_groups,
+            'rule_columns': results.rule_columns,
+            'rule_values': results.rule_values,
+            'runs': results.rule_runs(),
+            'summary': results.summary,
+            'budget': results.budget,
+            'width': len(code_columns)
+        }
+        # 메타데이터를 마지막에 기록해 완성된 결과만 로드되도록 함
+        with open(os.path.join(path, META_FILE), 'wb') as f:
+            pickle.dump(meta, f, protocol=pickle.HIGHEST_PROTOCOL)
+
+        self.evict(keep=handle)
+        return handle
+
+    def load(self, handle):
+        """핸들의 결과를 memory-map으로 읽어 CompactKeywordResults로 반환 (만료/삭제된 경우 None)"""
+        if handle is None:
+            return None
+        path = self.result_dir(handle)
+        meta_path = os.path.join(path, META_FILE)
+        try:
+            if time.time() - os.path.getmtime(meta_path) > self.ttl:
+                self.discard(handle)
+                return None
+            with open(meta_path, 'rb') as f:
+                meta = pickle.load(f)
+            rule_ids = np.load(os.path.join(path, 'rule_ids.npy'), mmap_mode='r')
+            codes = [
+                np.load(os.path.join(path, f'c{position}.npy'), mmap_mode='r')
+                for position in range(meta['width'])
+            ]
+        except (FileNotFoundError, EOFError, pickle.UnpicklingError):
+            return None
+
+        self.touch(handle)
+        return CompactKeywordResults.from_codes(
+            meta['rules'], meta['rule_groups'], meta['rule_columns'], meta['rule_values'], rule_ids, codes,
+            runs=meta.get('runs'), summary=meta.get('summary'), budget=meta.get('budget')
+        )
+
+    def exists(self, handle):
+        return handle is not None and os.path.exists(os.path.join(self.result_dir(handle), META_FILE))
+
+    def touch(self, handle):
+        """마지막 사용 시각 갱신"""
+        try:
+            os.utime(os.path.join(self.result_dir(handle), META_FILE))
+        except FileNotFoundError:
+            pass
+
+    def file_path(self, handle, name):
+        """결과와 함께 보관할 파일(엑셀 등)의 경로"""
+        return os.path.join(self.result_dir(handle), name)
+
+    def part_path(self, path):
+        """path로 옮기기 전에 기록할 임시 파일 경로 (세션마다 다른 이름)"""
+        return f"{path}.{uuid.uuid4().hex}{PART_SUFFIX}"
+
+    def find_file(self, handle, extension):
+        """결과 디렉토리에서 확장자가 extension인 가장 최근 파일 경로 반환 (없거나 결과가 삭제되었으면 None)
+
+        여러 세션이 같은 결과를 공유하므로 파일을 다시 만들 때는 이전 파일을 지우지 않고 새 이름으로
+        기록하며, 대체된 이전 파일은 evict()가 정리합니다.
+        """
+        if not self.exists(handle):
+            return None
+        try:
+            files = [entry for entry in os.scandir(self.result_dir(handle))
+                     if entry.is_file() and entry.name.endswith(extension)]
+            newest = max(files, key=lambda entry: entry.stat().st_mtime, default=None)
+        except FileNotFoundError:
+            return None
+        return newest.path if newest is not None else None
+
+    def discard(self, handle):
+        """결과 디렉토리 삭제"""
+        with self.lock:
+            shutil.rmtree(self.result_dir(handle), ignore_errors=True)
+
+    def size(self, handle):
+        """결과 디렉토리의 파일 크기 합계 (없으면 0)"""
+        if handle is None:
+            return 0
+        try:
+            return sum(entry.stat().st_size for entry in os.scandir(self.result_dir(handle)) if entry.is_file())
+        except FileNotFoundError:
+            return 0
+
+    def evict(self, keep=None):
+        """TTL이 지난 결과를 지우고, 전체 크기가 한도를 넘으면 오래 사용하지 않은 결과부터 삭제
+
+        keep(방금 저장했거나 파일을 기록한 결과의 핸들)은 한도를 넘더라도 삭제하지 않으며,
+        그 결과 하나가 한도보다 크면 다른 결과를 모두 지운 뒤 그대로 둡니다.
+        다른 세션이 내보내기 파일을 기록 중인(.part 파일이 있는) 결과는 건너뛰고,
+        새 파일로 대체된 지 SUPERSEDED_GRACE_SECONDS가 지난 이전 내보내기 파일은 삭제합니다.
+        """
+        keep_id = keep.result_id if keep is not None else None
+        with self.lock:
+            entries = []
+            now = time.time()
+            for result_id in os.listdir(self.root):
+                path = os.path.join(self.root, result_id)
+                try:
+                    files = [entry for entry in os.scandir(path) if entry.is_file()]
+                    if any(entry.name.endswith(PART_SUFFIX) for entry in files):
+                        continue
+                    self._remove_superseded(files, now)
+                    if result_id == keep_id:
+                        continue
+                    last_used = os.path.getmtime(os.path.join(path, META_FILE))
+                    size = sum(entry.stat().st_size for entry in os.scandir(path) if entry.is_file())
+                except (FileNotFoundError, NotADirectoryError):
+                    # 저장 중이거나 이미 삭제된 결과, 결과 디렉토리가 아닌 파일
+                    continue
+                if now - last_used > self.ttl:
+                    shutil.rmtree(path, ignore_errors=True)
+                else:
+                    entries.append((last_used, size, path))
+
+            total = sum(size for _, size, _ in entries) + self.size(keep)
+            for last_used, size, path in sorted(entries):
+                if total <= self.max_bytes:
+                    break
+                shutil.rmtree(path, ignore_errors=True)
+                total -= size
+
+    @staticmethod
+    def _remove_superseded(files, now):
+        """결과 디렉토리의 내보내기 파일 중 같은 확장자의 더 새 파일로 대체된 지 오래된 파일 삭제"""
+        exports = {}
+        for entry in files:
+            if entry.name == META_FILE or entry.name.endswith('.npy'):
+                continue
+            exports.setdefault(os.path.splitext(entry.name)[1], []).append((entry.stat().st_mtime, entry.path))
+        for versions in exports.values():
+            versions.sort()
+            for (_, path), (replaced, _) in zip(versions, versions[1:]):
+                if now - replaced > SUPERSEDED_GRACE_SECONDS:
+                    try:
+                        os.remove(path)
+                    except FileNotFoundError:
+                        pass
@@ -0,0 +1,162 @@
+"""
+CLI 실행 단계별 계측과 JSON 실행 보고서
+
+단계(로드, 매핑, 규칙별 생성, 기록, Dashboard)마다 소요 시간, 처리 행 수, 초당 행 수와
+tracemalloc으로 잰 최대 Python 메모리를 모아 --report 경로에 JSON으로 저장합니다.
+생성과 기록은 청크 단위로 번갈아 일어나므로 같은 이름의 단계는 여러 번 측정한 값을 합산합니다.
+"""
+
+import contextlib
+import itertools
+import json
+import os
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+# 보고서 형식 버전
+REPORT_VERSION = 1
+
+def rate(rows, seconds):
+    """초당 행 수 (측정할 수 없으면 None)"""
+    if not rows or not seconds:
+        return None
+    return round(rows / seconds, 1)
+
+class RunReport:
+    """단계별/규칙별 소요 시간, 행 수, 최대 메모리 기록
+
+    trace_memory가 True면 tracemalloc을 시작하고, 단계가 끝날 때마다 그 사이의 최대 메모리를
+    열려 있는 모든 단계(바깥 단계 포함)에 반영한 뒤 최대치를 초기화합니다.
+    tracemalloc은 Python/NumPy 할당만 추적하므로 병렬 워커 프로세스의 메모리는 포함되지 않습니다.
+    이 보고서가 시작한 추적은 close()에서 멈추므로, 여러 작업을 이어서 처리하는 워커에서도 다음 작업이
+    추적 비용을 물려받지 않습니다.
+    """
+
+    def __init__(self, trace_memory=True):
+        self.created = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
+        self.started = time.perf_counter()
+        self.stages = {}
+        self.rules = {}
+        self.info = {}
+        self.peak_bytes = 0
+        self._open = []
+        self.trace_memory = trace_memory
+        self.started_tracing = False
+        if trace_memory and not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.started_tracing = True
+
+    def _take_peak(self, *records):
+        """직전 측정 이후의 최대 메모리를 records와 열린 단계에 반영하고 최대치 초기화"""
+        if not self.trace_memory or not tracemalloc.is_tracing():
+            return
+        _, peak = tracemalloc.get_traced_memory()
+        tracemalloc.reset_peak()
+        self.peak_bytes = max(self.peak_bytes, peak)
+        for record in itertools.chain(records, self._open):
+            record['peak_bytes'] = max(record['peak_bytes'], peak)
+
+    def _stage_record(self, name):
+        record = self.stages.get(name)
+        if record is None:
+            record = {'seconds': 0.0, 'rows': 0, 'calls': 0, 'peak_bytes': 0}
+            self.stages[name] = record
+        return record
+
+    @contextlib.contextmanager
+    def stage(self, name, rows=None):
+        """단계 측정 (같은 이름은 합산). yield한 dict의 'rows'를 채우면 처리 행 수로 기록"""
+        record = self._stage_record(name)
+        self._take_peak()
+        self._open.append(record)
+        counter = {'rows': rows or 0}
+        start = time.perf_counter()
+        try:
+            yield counter
+        finally:
+            record['seconds'] += time.perf_counter() - start
+            record['rows'] += counter['rows']
+            record['calls'] += 1
+            self._open.remove(record)
+            self._take_peak(record)
+
+    def add_rule(self, rule_str, group, seconds, rows):
+        """규칙 하나의 청크 생성 시간과 행 수 누적 ('generate' 단계에도 합산)"""
+        record = self.rules.get(rule_str)
+        if record is None:
+            record = {'group': group, 'seconds': 0.0, 'rows': 0, 'chunks': 0, 'peak_bytes': 0}
+            self.rules[rule_str] = record
+        record['seconds'] += seconds
+        record['rows'] += rows
+        record['chunks'] += 1
+        stage = self._stage_record('generate')
+        stage['seconds'] += seconds
+        stage['rows'] += rows
+        stage['calls'] += 1
+        self._take_peak(record, stage)
+
+    def time_chunks(self, chunks):
+        """키워드 청크 제너레이터를 감싸 청크를 만드는 데 걸린 시간을 규칙별로 기록하는 제너레이터
+
+        소비하는 쪽(기록)에서 쓴 시간은 제외되며, 병렬 생성에서는 결과를 기다린 시간이 기록됩니다.
+        """
+        iterator = iter(chunks)
+        while True:
+            start = time.perf_counter()
+            try:
+                chunk = next(iterator)
+            except StopIteration:
+                return
+            seconds = time.perf_counter() - start
+            if len(chunk):
+                self.add_rule(chunk['rule'].iat[0], chunk['group'].iat[0], seconds, len(chunk))
+            yield chunk
+
+    def close(self):
+        """이 보고서가 시작한 tracemalloc 추적 중지 (기록한 최대 메모리는 그대로 남음)"""
+        if self.started_tracing:
+            tracemalloc.stop()
+            self.started_tracing = False
+
+    @property
+    def total_seconds(self):
+        return time.perf_counter() - self.started
+
+    def to_dict(self):
+        def entry(record, **extra):
+            return dict(extra, seconds=round(record['seconds'], 4), rows=record['rows'],
+                        rows_per_sec=rate(record['rows'], record['seconds']),
+                        peak_bytes=record['peak_bytes'] if self.trace_memory else None,
+                        **{key: record[key] for key in ('calls', 'chunks', 'group') if key in record})
+
+        return {
+            'version': REPORT_VERSION,
+            'created': self.created,
+            'command': sys.argv,
+            'total_seconds': round(self.total_seconds, 4),
+            'peak_bytes': self.peak_bytes if self.trace_memory else None,
+            'info': self.info,
+            'stages': [entry(record, name=name) for name, record in self.stages.items()],
+            'rules': [entry(record, rule=rule_str) for rule_str, record in self.rules.items()]
+        }
+
+    def save(self, path):
+        """보고서를 JSON으로 저장 (디렉토리가 없으면 생성)"""
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False, indent=2)
+
+    def print_summary(self, format_bytes):
+        """단계별 소요 시간/처리량/최대 메모리 표 출력"""
+        print("\n=== 단계별 실행 시간 ===")
+        print(f"  {'단계':<12}{'시간(초)':>10}{'행 수':>14}{'행/초':>14}{'최대 메모리':>14}")
+        for name, record in self.stages.items():
+            speed = rate(record['rows'], record['seconds'])
+            peak = format_bytes(record['peak_bytes']) if self.trace_memory else '-'
+            print(f"  {name:<12}{record['seconds']:>10.2f}{record['rows']:>14,}"
+                  f"{f'{speed:,.0f}' if speed else '-':>14}{peak:>14}")
+        print(f"  {'전체':<12}{self.total_seconds:>10.2f}")
@@ -1,36 +1,163 @@
 import streamlit as st
 import pandas as pd
-import itertools
 import os
 import io
+import threading
+from collections import OrderedDict
 from datetime import datetime
 import sys
 
 # keyword_generator.py의 함수들을 import하기 위해 현재 디렉토리를 sys.path에 추가
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
+from keyword_generator import (
+    BUDGET_POLICIES, DEFAULT_CHUNK_SIZE, RESULT_COLUMNS, BudgetExceeded, CancellationToken, GenerationBudget,
+    GenerationCancelled, KeywordEngine, build_dashboard_data, content_hash, format_bytes, format_duration,
+    load_raw_workbook, parse_size, plan_keyword_generation, prepare_generation, split_source_data
+)
+from output_sinks import ParallelExcelWriter
+from result_store import ResultStore
+
+# 엑셀 시트 직렬화에 사용할 프로세스 수
+EXPORT_WORKERS = min(4, os.cpu_count() or 1)
+
+# 공유 호스트를 보호하는 생성 자원 예산 (환경 변수로 변경 가능, 0이면 제한 없음)
+# 기본값은 abort 정책의 행 수/시간 한도라 결과를 몰래 줄이지 않으면서 큰 업로드 하나가 프로세스를
+# 독차지하지 못하게 하며, 적용되는 예산은 생성 전에 화면에 표시합니다.
+# 메모리 한도는 모든 세션이 함께 쓰는 웹앱 프로세스의 RSS 기준입니다.
+WEB_MAX_ROWS = int(os.environ.get('KEYWORD_WEB_MAX_ROWS', 5_000_000))
+WEB_MAX_RULE_ROWS = int(os.environ.get('KEYWORD_WEB_MAX_RULE_ROWS', 0))
+WEB_MAX_SECONDS = float(os.environ.get('KEYWORD_WEB_MAX_SECONDS', 600))
+WEB_MAX_RSS = parse_size(os.environ.get('KEYWORD_WEB_MAX_RSS', '0'))
+WEB_BUDGET_POLICY = os.environ.get('KEYWORD_WEB_BUDGET_POLICY', 'abort')
+if WEB_BUDGET_POLICY not in BUDGET_POLICIES:
+    raise ValueError(f"KEYWORD_WEB_BUDGET_POLICY는 {', '.join(BUDGET_POLICIES)} 중 하나여야 합니다: "
+                     f"{WEB_BUDGET_POLICY}")
+
+# 예산 정책별로 한도를 넘을 때 웹앱에서 일어나는 일
+WEB_BUDGET_POLICY_TEXT = {
+    'abort': '한도를 넘으면 생성을 중단합니다',
+    'truncate': '한도를 넘으면 규칙 앞에서부터 한도까지만 생성합니다',
+    'sample': '한도를 넘으면 규칙마다 고르게 추출해 한도까지만 생성합니다',
+}
+
+# 미리보기 페이지 크기 선택지
+PREVIEW_PAGE_SIZES = [20, 50, 100, 500, 1000]
+
+# 세션 간 공유 캐시 한도 (항목 수, 대략적인 메모리 크기)
+SHARED_CACHE_MAX_ENTRIES = 32
+SHARED_CACHE_MAX_BYTES = 1024 * 1024 * 1024
+
+class SharedLRUCache:
+    """업로드 파일 내용 해시를 키로 쓰는, 모든 세션이 공유하는 LRU 캐시
+
+    항목 수나 크기 합계가 한도를 넘으면 가장 오래 쓰이지 않은 항목부터 버립니다.
+    저장된 값은 여러 세션이 함께 읽으므로 꺼낸 뒤 수정하면 안 됩니다.
+    """
+
+    def __init__(self, max_entries=SHARED_CACHE_MAX_ENTRIES, max_bytes=SHARED_CACHE_MAX_BYTES):
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.entries = OrderedDict()
+        self.total_bytes = 0
+        self.lock = threading.Lock()
+
+    def get(self, key):
+        """키에 해당하는 값 반환 (없으면 None)"""
+        with self.lock:
+            entry = self.entries.get(key)
+            if entry is None:
+                return None
+            self.entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value, size):
+        """값 저장 후 한도를 넘는 오래된 항목 제거"""
+        with self.lock:
+            self._remove(key)
+            if size > self.max_bytes:
+                return
+            self.entries[key] = (value, size)
+            self.total_bytes += size
+            while len(self.entries) > self.max_entries or self.total_bytes > self.max_bytes:
+                oldest = next(iter(self.entries))
+                self._remove(oldest)
+
+    def discard(self, key):
+        """키에 해당하는 항목 제거"""
+        with self.lock:
+            self._remove(key)
+
+    def _remove(self, key):
+        entry = self.entries.pop(key, None)
+        if entry is not None:
+            self.total_bytes -= entry[1]
+
+@st.cache_resource
+def get_shared_cache():
+    """프로세스에 하나뿐인 공유 캐시 (모든 세션에서 같은 객체)"""
+    return SharedLRUCache()
+
+@st.cache_resource
+def get_result_store():
+    """세션들이 공유하는 디스크 결과 저장소"""
+    return ResultStore()
+
+def frame_bytes(df):
+    """DataFrame의 대략적인 메모리 크기"""
+    return int(df.memory_usage(index=True, deep=True).sum())
+
+def parse_source_cached(data, file_hash):
+    """업로드 파일을 파싱하고 생성 입력(컬럼 인덱스, 제약조건)까지 만들어 공유 캐시에 저장
+
+    같은 내용의 파일은 세션과 관계없이 다시 읽지 않습니다. 생성 입력은 CLI와 같은
+    prepare_generation으로 만들어 업로드 워크북의 '제약조건' 시트를 똑같이 적용합니다.
+    반환값: (df_raw, df_data, column_numbers, category_titles, inputs, cache_hit)
+    cache_hit은 공유 캐시면 'memory', 디스크 파싱 캐시면 'disk', 새로 읽었으면 None
+    """
+    cache = get_shared_cache()
+    key = ('source', file_hash)
+    parsed = cache.get(key)
+    if parsed is not None:
+        return parsed + ('memory',)
+    
+    # header=None으로 읽어서 원본 데이터 그대로 가져오기 (같은 내용의 파일은 디스크 캐시 사용)
+    df_raw, disk_hit = load_raw_workbook(data)
+    # 1행: 컬럼 번호, 2행: 카테고리 제목, 3행부터: 실제 데이터
+    df_data, column_numbers, category_titles = split_source_data(df_raw)
+    inputs = prepare_generation(data, df_data, category_titles)
+    
+    parsed = (df_raw, df_data, column_numbers, category_titles, inputs)
+    size = frame_bytes(df_raw) + frame_bytes(df_data) + sum(
+        entry['total_bytes'] + 64 * len(entry['values']) for entry in inputs['column_index'].values()
+    )
+    cache.put(key, parsed, size)
+    return parsed + ('disk' if disk_hit else None,)
+
 # 기존 함수들을 그대로 재사용하되, print를 streamlit UI로 변경
-def load_source_data_streamlit(uploaded_file):
-    """Load and preprocess source Excel file for Streamlit"""
+def load_source_data_streamlit(uploaded_file, file_hash=None):
+    """Load and preprocess source Excel file for Streamlit
+
+    반환값: (df_data, column_numbers, category_titles, inputs) - inputs는 prepare_generation 결과
+    """
     try:
-        # header=None으로 읽어서 원본 데이터 그대로 가져오기
-        df_raw = pd.read_excel(uploaded_file, header=None)
-        st.info(f"원본 데이터 로드 완료: {df_raw.shape}")
-        
-        # 첫 번째 행 (엑셀의 1행): 컬럼 번호들
-        column_numbers = df_raw.iloc[0].tolist()
-        
-        # 두 번째 행 (엑셀의 2행): 카테고리 제목들
-        category_titles = df_raw.iloc[1].tolist()
-        
-        # 실제 데이터는 3행부터 (인덱스 2부터)
-        df_data = df_raw.iloc[2:].reset_index(drop=True)
-        
-        # 컬럼명을 카테고리 제목으로 설정
-        df_data.columns = category_titles
+        data = uploaded_file.getvalue()
+        if file_hash is None:
+            file_hash = content_hash(data)
+        df_raw, df_data, column_numbers, category_titles, inputs, cache_hit = parse_source_cached(
+            data, file_hash
+        )
+        cache_label = {'memory': ' (공유 캐시)', 'disk': ' (캐시)'}.get(cache_hit, '')
+        st.info(f"원본 데이터 로드 완료: {df_raw.shape}{cache_label}")
         
         st.success(f"실제 데이터 형태: {df_data.shape}")
-        
+
+        constraints = inputs['constraints']
+        if constraints is not None:
+            st.info(f"제약조건: {constraints.describe()}")
+            for warning in constraints.warnings:
+                st.warning(f"제약조건 {warning}")
+
         # 컬럼 정보 표시
         with st.expander("📊 데이터 구조 확인"):
             st.write("**컬럼 번호와 카테고리 매핑:**")
@@ -40,191 +167,147 @@ def load_source_data_streamlit(uploaded_file):
                     col_info.append({"컬럼 번호": str(col_num), "카테고리": str(category)})
             st.dataframe(pd.DataFrame(col_info))
         
-        return df_data, column_numbers, category_titles
+        return df_data, column_numbers, category_titles, inputs
         
     except Exception as e:
         st.error(f"데이터 로드 오류: {e}")
-        return None, None, None
+        return None, None, None, None
 
-def parse_combination_rule(rule_str):
-    """조합 규칙 문자열을 파싱 (예: "2,3" -> [2, 3])"""
-    try:
-        if pd.isna(rule_str):
-            return []
-        # 숫자만 추출하여 리스트로 변환
-        numbers = [int(x.strip()) for x in str(rule_str).split(',') if x.strip().isdigit()]
-        return numbers
-    except:
-        return []
-
-def get_column_values(df, col_index, category_titles):
-    """특정 컬럼의 모든 고유값 반환 (NaN 제외)"""
-    if col_index > len(category_titles) - 1:
-        return []
-    
-    # 카테고리 제목을 통해 컬럼명 찾기
-    col_name = category_titles[col_index]
-    
-    if col_name in df.columns:
-        unique_values = df[col_name].dropna().unique().tolist()
-        # 빈 문자열이나 공백만 있는 값 제외
-        unique_values = [val for val in unique_values if str(val).strip()]
-        return unique_values
-    return []
-
-def generate_keyword_combinations_streamlit(df_data, column_numbers, category_titles):
-    """스트림릿용 모든 조합 규칙에 따라 키워드 조합 생성"""
-    results = []
-    rule_group_mapping = {}
+def make_web_budget():
+    """웹앱 생성 자원 예산 (생성할 때마다 새로 만들어 적용 결과를 결과와 함께 보관)"""
+    return GenerationBudget(WEB_MAX_ROWS or None, WEB_MAX_RULE_ROWS or None, WEB_MAX_SECONDS or None,
+                            WEB_MAX_RSS or None, WEB_BUDGET_POLICY)
+
+def generate_keyword_combinations_streamlit(df_data, column_numbers, category_titles, inputs=None, cancel=None,
+                                            budget=None):
+    """스트림릿용 모든 조합 규칙에 따라 키워드 조합 생성
     
-    # 진행 상황 표시
+    CLI와 같은 KeywordEngine과 생성 입력(inputs, prepare_generation 결과)으로 생성하고,
+    청크마다 진행률과 처리 속도, 남은 시간을 표시합니다.
+    cancel(CancellationToken)이 취소되면 GenerationCancelled가, budget(GenerationBudget)의
+    abort 정책에서 한도를 넘으면 BudgetExceeded가 발생합니다.
+    결과는 문자열 대신 값 코드로 저장한 CompactKeywordResults로 반환하며,
+    keyword/components 문자열은 미리보기와 다운로드 시점에 필요한 행만 만듭니다.
+    """
     progress_bar = st.progress(0)
     status_text = st.empty()
     
-    status_text.text("조합 규칙-그룹 매핑 생성 중...")
+    def show_progress(progress):
+        progress_bar.progress(min(progress['fraction'], 1.0))
+        if progress['finished']:
+            status_text.text("키워드 조합 생성 완료!")
+            return
+        eta = format_duration(progress['eta']) if progress['eta'] is not None else '-'
+        status_text.text(
+            f"조합 규칙 '{progress['rule']}' 처리 중... ({progress['rules_done']}/{progress['rules_total']}) "
+            f"· {progress['rows']:,}/{progress['rows_total']:,}개 · {progress['rows_per_sec']:,.0f}개/초 · 남은 시간 {eta}"
+        )
     
-    for idx, row in df_data.iterrows():
-        rule = row.iloc[0]  # 조합 규칙 (A열)
-        group = row.iloc[1]  # 그룹 (B열)
-        
-        # 조합 규칙이 있고, 그룹이 비어있으면 'ungrouped'으로 대체
-        if pd.notna(rule):
-            if pd.isna(group) or str(group).strip() == '':
-                group = 'ungrouped'
-            rule_group_mapping[str(rule)] = str(group)
-    
-    st.info(f"총 {len(rule_group_mapping)}개 매핑 완료")
-    
-    # 규칙 매핑 정보 표시
-    with st.expander("🔗 조합 규칙-그룹 매핑"):
-        mapping_data = [{"조합 규칙": str(rule), "그룹": str(group)} for rule, group in rule_group_mapping.items()]
-        st.dataframe(pd.DataFrame(mapping_data))
-    
-    total_rules = len(rule_group_mapping)
-    current_rule = 0
-    
-    for rule_str, group in rule_group_mapping.items():
-        current_rule += 1
-        progress = current_rule / total_rules
-        progress_bar.progress(progress)
-        status_text.text(f"조합 규칙 '{rule_str}' 처리 중... ({current_rule}/{total_rules})")
-        
-        # 조합 규칙 파싱
-        rule_numbers = parse_combination_rule(rule_str)
-        if not rule_numbers:
-            continue
-        
-        # 각 규칙 번호에 해당하는 컬럼 값들 가져오기
-        column_values_list = []
-        column_names = []
-        
-        for rule_num in rule_numbers:
-            # rule_num은 1부터 시작하는 컬럼 번호
-            # category_titles에서 찾기 위해 인덱스 조정
-            col_values = get_column_values(df_data, rule_num + 1, category_titles)  # +1은 조합/그룹 컬럼 때문
-            if col_values:
-                column_values_list.append(col_values)
-                # 컬럼명 찾기
-                if rule_num + 1 < len(category_titles):
-                    col_name = category_titles[rule_num + 1]
-                    column_names.append(col_name)
-        
-        if not column_values_list:
-            continue
-        
-        # 카테시안 곱으로 모든 조합 생성
-        combinations = list(itertools.product(*column_values_list))
-        
-        # 결과에 추가
-        for combo in combinations:
-            keyword = " ".join(str(item) for item in combo)
-            components = " | ".join(str(item) for item in combo)
-            
-            results.append({
-                'rule': rule_str,
-                'group': group,
-                'columns': ", ".join(column_names),
-                'keyword': keyword,
-                'components': components
-            })
-    
-    progress_bar.progress(1.0)
-    status_text.text("키워드 조합 생성 완료!")
-    
-    return pd.DataFrame(results)
+    engine = KeywordEngine(df_data, column_numbers, category_titles, **(inputs or {}),
+                           progress=show_progress, cancel=cancel, verbose=False, budget=budget)
+    return engine.compact_results()
 
-def create_dashboard_data(results_df):
-    """Dashboard용 통계 데이터 생성"""
-    dashboard_data = []
-    
-    # 기본 통계
-    total_keywords = len(results_df)
-    total_rules = results_df['rule'].nunique()
-    total_groups = results_df['group'].nunique()
+def start_generation():
+    """생성 시작 버튼 콜백: 이번 생성에 쓸 취소 토큰을 세션 상태에 보관"""
+    st.session_state.generation_cancel = CancellationToken()
+    st.session_state.generation_state = 'running'
+
+def stop_generation():
+    """생성 중지 버튼 콜백: 세션 상태의 토큰(실행 중인 생성이 확인하는 토큰)을 취소
+
+    Streamlit은 클릭한 뒤의 재실행에서 콜백을 부르고 실행 중이던 스크립트는 재실행 예외로 멈추므로,
+    중지 상태도 세션에 남겨 다음 실행에서 중지 안내를 표시합니다.
+    """
+    cancel = st.session_state.get('generation_cancel')
+    if cancel is not None:
+        cancel.cancel()
+    st.session_state.generation_state = 'stopped'
+
+def create_excel_download(results, progress_bar=None, status_text=None, chunk_size=DEFAULT_CHUNK_SIZE, target=None):
+    """다운로드용 엑셀 파일 생성
     
-    # 헤더 추가 (Numbers 호환성을 위해 === 제거)
-    dashboard_data.append(['키워드 생성 통계', ''])
-    dashboard_data.append(['생성 일시', datetime.now().strftime("%Y-%m-%d %H:%M:%S")])
-    dashboard_data.append(['총 키워드 수', f"{total_keywords:,}"])
-    dashboard_data.append(['총 조합 규칙 수', total_rules])
-    dashboard_data.append(['총 그룹 수', total_groups])
-    dashboard_data.append(['', ''])
+    값 코드로 저장된 결과를 청크 단위로 문자열로 만들어 그룹별로 나눈 뒤, 그룹 시트 XML을
+    여러 프로세스에서 병렬로 직렬화하여 하나의 엑셀 파일로 묶습니다.
+    엑셀 행 제한을 넘는 그룹은 '그룹_2', '그룹_3' 시트로 나누어 저장합니다.
+    target(파일 경로)을 주면 파일로 저장해 경로를, 없으면 메모리에서 만든 바이트를 반환합니다.
+    """
+    buffer = io.BytesIO() if target is None else target
+    writer = ParallelExcelWriter(buffer, RESULT_COLUMNS, EXPORT_WORKERS)
     
-    # 그룹별 통계
-    dashboard_data.append(['그룹별 키워드 수', ''])
-    dashboard_data.append(['그룹명', '키워드 수'])
-    group_counts = results_df['group'].value_counts()
-    for group, count in group_counts.items():
-        dashboard_data.append([group, f"{count:,}"])
+    # 그룹별로 나누기 (청크 단위로 한 번 순회)
+    total_rows = len(results)
+    try:
+        for chunk in results.iter_chunks(chunk_size):
+            writer.write_chunk(chunk)
+            
+            if status_text:
+                status_text.text(f"📋 그룹별로 나누는 중... ({writer.total_rows:,}/{total_rows:,})")
+            if progress_bar:
+                # 0%에서 40%까지 나눈 행 수에 따라 진행
+                progress_bar.progress(int(writer.total_rows / total_rows * 40))
+        
+        # Dashboard 시트 (첫 번째 시트로 저장됨)
+        writer.write_dashboard(build_dashboard_data(results.summary, budget=results.budget))
+    except BaseException:
+        # 그룹별 임시 파일 정리 (Streamlit 재실행으로 중단될 때 포함)
+        writer.abort()
+        raise
     
-    dashboard_data.append(['', ''])
+    # 그룹 시트 병렬 직렬화 후 엑셀 파일로 묶기
+    if status_text:
+        status_text.text(f"📊 시트 생성 중... (프로세스 {EXPORT_WORKERS}개)")
+    writer.close()
     
-    # 규칙별 통계 (상위 15개)
-    dashboard_data.append(['규칙별 키워드 수 (상위 15개)', ''])
-    dashboard_data.append(['규칙', '키워드 수'])
-    rule_counts = results_df['rule'].value_counts().head(15)
-    for rule, count in rule_counts.items():
-        dashboard_data.append([rule, f"{count:,}"])
+    if progress_bar:
+        progress_bar.progress(100)
     
-    return dashboard_data
+    return buffer.getvalue() if target is None else target
 
-def create_excel_download(results_df, progress_bar=None, status_text=None):
-    """엑셀 파일을 메모리에서 생성하여 다운로드 가능한 형태로 반환"""
-    buffer = io.BytesIO()
+def show_generation_plan(df_data, column_numbers, category_titles, inputs=None):
+    """키워드를 생성하기 전에 규칙/그룹별 키워드 수와 예상 크기, 메모리 표시"""
+    plan = plan_keyword_generation(df_data, column_numbers, category_titles, **(inputs or {}))
     
-    # ExcelWriter로 여러 시트 생성
-    with pd.ExcelWriter(buffer, engine='openpyxl') as writer:
-        # Dashboard 시트
-        if status_text:
-            status_text.text("📊 Dashboard 시트 생성 중...")
-        dashboard_data = create_dashboard_data(results_df)
-        dashboard_df = pd.DataFrame(dashboard_data, columns=['항목', '값'])
-        dashboard_df.to_excel(writer, sheet_name='Dashboard', index=False)
+    with st.expander("📐 생성 계획 (예상 규모)", expanded=True):
+        col1, col2, col3, col4 = st.columns(4)
+        with col1:
+            st.metric("예상 키워드 수", f"{plan['total_keywords']:,}")
+        with col2:
+            st.metric("예상 엑셀 크기", format_bytes(plan['output_bytes']['xlsx']))
+        with col3:
+            st.metric("예상 CSV 크기", format_bytes(plan['output_bytes']['csv']))
+        with col4:
+            # 웹앱은 전체 결과를 메모리에 보관
+            st.metric("예상 최대 메모리", format_bytes(plan['peak_memory']['in_memory']))
         
-        if progress_bar:
-            progress_bar.progress(30)
+        budget = make_web_budget()
+        if budget:
+            st.info(f"웹앱 자원 예산: {budget.describe()} - {WEB_BUDGET_POLICY_TEXT[WEB_BUDGET_POLICY]}")
         
-        # 그룹별 시트 생성
-        unique_groups = results_df['group'].unique()
-        total_groups = len(unique_groups)
+        if WEB_MAX_ROWS and plan['total_keywords'] > WEB_MAX_ROWS:
+            if WEB_BUDGET_POLICY == 'abort':
+                st.error(f"예상 키워드 수가 웹앱 한도({WEB_MAX_ROWS:,}개)를 넘어 생성할 수 없습니다. "
+                         "명령행(keyword_generator.py)으로 생성해 주세요.")
+            else:
+                method = '규칙마다 고르게 추출' if WEB_BUDGET_POLICY == 'sample' else '규칙 앞에서부터'
+                st.warning(f"예상 키워드 수가 웹앱 한도({WEB_MAX_ROWS:,}개)를 넘어 {method} "
+                           f"{WEB_MAX_ROWS:,}개까지만 생성합니다. 전체 결과는 명령행으로 생성해 주세요.")
         
-        for i, group in enumerate(unique_groups):
-            if status_text:
-                status_text.text(f"📋 {group} 그룹 시트 생성 중... ({i+1}/{total_groups})")
-            
-            group_data = results_df[results_df['group'] == group]
-            group_data.to_excel(writer, sheet_name=group, index=False)
-            
-            if progress_bar:
-                # 30%에서 90%까지 그룹별로 진행
-                progress = 30 + (i + 1) / total_groups * 60
-                progress_bar.progress(int(progress))
+        col1, col2 = st.columns(2)
+        with col1:
+            st.write("**규칙별 키워드 수**")
+            rule_data = [{
+                "조합 규칙": rule_plan['rule'],
+                "그룹": rule_plan['group'],
+                "키워드 수": rule_plan['keywords'],
+                "평균 길이": round(rule_plan['avg_keyword_length'], 1)
+            } for rule_plan in plan['rules']]
+            st.dataframe(pd.DataFrame(rule_data), use_container_width=True, hide_index=True)
+        with col2:
+            st.write("**그룹별 키워드 수**")
+            group_data = [{"그룹": group, "키워드 수": keywords} for group, keywords in plan['groups'].items()]
+            st.dataframe(pd.DataFrame(group_data), use_container_width=True, hide_index=True)
     
-    if progress_bar:
-        progress_bar.progress(100)
-    
-    buffer.seek(0)
-    return buffer.getvalue()
+    return plan
 
 # Streamlit 앱 메인 UI
 def main():
@@ -236,18 +319,21 @@ def main():
     )
     
     # 세션 상태 초기화
-    if 'results_df' not in st.session_state:
-        st.session_state.results_df = None
+    if 'results' not in st.session_state:
+        st.session_state.results = None
     if 'file_processed' not in st.session_state:
         st.session_state.file_processed = False
-    if 'current_file_name' not in st.session_state:
-        st.session_state.current_file_name = None
-    if 'excel_data' not in st.session_state:
-        st.session_state.excel_data = None
-    if 'excel_filename' not in st.session_state:
-        st.session_state.excel_filename = None
+    if 'current_file_hash' not in st.session_state:
+        st.session_state.current_file_hash = None
+    if 'excel_path' not in st.session_state:
+        st.session_state.excel_path = None
+    if 'excel_regenerate' not in st.session_state:
+        st.session_state.excel_regenerate = False
     if 'reset_uploader' not in st.session_state:
         st.session_state.reset_uploader = False
+    if 'generation_state' not in st.session_state:
+        st.session_state.generation_state = None
+        st.session_state.generation_cancel = None
     
     # 메인 헤더
     st.title("🔤 키워드 조합 생성기")
@@ -290,14 +376,14 @@ def main():
         st.markdown("---")
         
         # 현재 상태 표시
-        if st.session_state.results_df is not None:
-            st.success(f"✅ 생성된 키워드: {len(st.session_state.results_df):,}개")
+        if st.session_state.results is not None:
+            st.success(f"✅ 생성된 키워드: {len(st.session_state.results):,}개")
             if st.button("🔄 새로운 파일로 시작", use_container_width=True):
-                st.session_state.results_df = None
+                st.session_state.results = None
                 st.session_state.file_processed = False
-                st.session_state.current_file_name = None
-                st.session_state.excel_data = None
-                st.session_state.excel_filename = None
+                st.session_state.current_file_hash = None
+                st.session_state.excel_path = None
+                st.session_state.excel_regenerate = False
                 # 파일 업로더 초기화를 위해 세션 상태에 플래그 추가
                 st.session_state.reset_uploader = True
                 st.rerun()
@@ -326,13 +412,14 @@ def main():
             st.info(f"파일명: {uploaded_file.name}")
             st.info(f"파일 크기: {uploaded_file.size:,} bytes")
             
-            # 새로운 파일인 경우 상태 초기화
-            if st.session_state.current_file_name != uploaded_file.name:
-                st.session_state.results_df = None
+            # 새로운 파일(내용 기준)인 경우 상태 초기화
+            file_hash = content_hash(uploaded_file.getvalue())
+            if st.session_state.current_file_hash != file_hash:
+                st.session_state.results = None
                 st.session_state.file_processed = False
-                st.session_state.current_file_name = uploaded_file.name
-                st.session_state.excel_data = None
-                st.session_state.excel_filename = None
+                st.session_state.current_file_hash = file_hash
+                st.session_state.excel_path = None
+                st.session_state.excel_regenerate = False
     
     # 메인 콘텐츠
     if uploaded_file is not None:
@@ -341,34 +428,106 @@ def main():
         # 파일 로드 및 데이터 분석
         st.header("📊 데이터 분석")
         
+        file_hash = st.session_state.current_file_hash
         with st.spinner("파일을 분석하는 중..."):
-            df_data, column_numbers, category_titles = load_source_data_streamlit(uploaded_file)
+            # 파싱 결과와 생성 입력(컬럼 인덱스, 제약조건)은 공유 캐시에서 재사용 (생성 계획과 키워드 생성에서 공유)
+            df_data, column_numbers, category_titles, inputs = load_source_data_streamlit(
+                uploaded_file, file_hash
+            )
         
         if df_data is not None:
+            shared_cache = get_shared_cache()
+            # 생성 결과는 디스크 저장소에 두고 세션에는 핸들만 보관
+            result_store = get_result_store()
+            
+            # 다른 세션에서 같은 파일로 이미 생성한 결과가 있으면 그대로 사용
+            if st.session_state.results is None:
+                cached_handle = shared_cache.get(('results', file_hash))
+                if result_store.exists(cached_handle):
+                    st.session_state.results = cached_handle
+                    st.session_state.file_processed = True
+                    st.info("♻️ 같은 파일로 생성된 결과를 캐시에서 불러왔습니다.")
+            
+            # 저장소에서 만료되어 삭제된 결과는 다시 생성하도록 상태 초기화
+            results = result_store.load(st.session_state.results)
+            if st.session_state.results is not None and results is None:
+                shared_cache.discard(('results', file_hash))
+                st.session_state.results = None
+                st.session_state.file_processed = False
+                st.session_state.excel_path = None
+                st.session_state.excel_regenerate = False
+                st.warning("⏰ 저장된 결과가 만료되었습니다. 키워드 조합을 다시 생성해 주세요.")
+            
             # 키워드 생성 섹션
             st.markdown("---")
             st.header("🚀 키워드 생성")
             
-            # 아직 결과가 없는 경우에만 생성 버튼 표시
-            if st.session_state.results_df is None:
-                if st.button("🔥 키워드 조합 생성 시작", type="primary", use_container_width=True):
-                    with st.spinner("키워드 조합을 생성하는 중... 잠시만 기다려주세요."):
-                        results_df = generate_keyword_combinations_streamlit(df_data, column_numbers, category_titles)
+            # 아직 결과가 없는 경우에만 생성 계획과 생성 버튼 표시
+            if st.session_state.results is None:
+                show_generation_plan(df_data, column_numbers, category_titles, inputs)
+                
+                running = st.session_state.generation_state == 'running'
+                # 중지 버튼은 생성보다 먼저 만들어 두어 클릭이 실행 중인 생성의 세션 토큰을 취소하도록 함
+                col1, col2 = st.columns(2)
+                with col1:
+                    st.button("🔥 키워드 조합 생성 시작", type="primary", use_container_width=True,
+                              on_click=start_generation, disabled=running)
+                with col2:
+                    st.button("⏹ 생성 중지", on_click=stop_generation, use_container_width=True,
+                              disabled=not running)
+                
+                if st.session_state.generation_state == 'stopped':
+                    st.session_state.generation_state = None
+                    st.warning("⏹ 키워드 생성이 중지되었습니다. 중지 전까지 만든 결과는 저장하지 않았습니다. "
+                               "다시 시작하려면 생성 버튼을 눌러 주세요.")
+                
+                if running:
+                    try:
+                        with st.spinner("키워드 조합을 생성하는 중... 잠시만 기다려주세요."):
+                            results = generate_keyword_combinations_streamlit(
+                                df_data, column_numbers, category_titles, inputs,
+                                st.session_state.generation_cancel, make_web_budget()
+                            )
+                    except BudgetExceeded as e:
+                        results = None
+                        st.error(f"❌ 웹앱 자원 한도를 넘어 생성을 중단했습니다: {e}")
+                    except GenerationCancelled:
+                        results = None
+                        st.warning("⏹ 키워드 생성이 중지되었습니다. 중지 전까지 만든 결과는 저장하지 않았습니다. "
+                                   "다시 시작하려면 생성 버튼을 눌러 주세요.")
+                    else:
+                        if results.empty:
+                            st.error("❌ 키워드 조합 생성에 실패했습니다.")
+                    finally:
+                        # 재실행으로 중단된 경우 포함 (중지 버튼이면 다음 실행의 콜백이 'stopped'로 바꿈)
+                        if st.session_state.generation_state == 'running':
+                            st.session_state.generation_state = None
+                        st.session_state.generation_cancel = None
                     
-                    if not results_df.empty:
+                    if results is not None and not results.empty:
                         # 세션 상태에 결과 저장
-                        st.session_state.results_df = results_df
+                        handle = result_store.save(results)
+                        st.session_state.results = handle
                         st.session_state.file_processed = True
-                        st.success(f"🎉 총 {len(results_df):,}개의 키워드 조합이 생성되었습니다!")
+                        shared_cache.put(('results', file_hash), handle, 0)
+                        st.success(f"🎉 총 {len(results):,}개의 키워드 조합이 생성되었습니다!")
                         st.rerun()  # 페이지 새로고침하여 결과 표시
-                    else:
-                        st.error("❌ 키워드 조합 생성에 실패했습니다.")
             
             # 결과가 있는 경우 결과 표시
-            if st.session_state.results_df is not None:
-                results_df = st.session_state.results_df
+            if results is not None:
+                # 통계는 생성 시 한 번 집계해 저장한 요약에서 읽음
+                summary = results.summary
                 
-                st.success(f"🎉 총 {len(results_df):,}개의 키워드 조합이 생성되었습니다!")
+                st.success(f"🎉 총 {summary.total:,}개의 키워드 조합이 생성되었습니다!")
+                budget = results.budget
+                if budget is not None and budget.applied:
+                    message = f"⚠️ 웹앱 자원 한도({budget.describe()})로 결과를 줄였습니다."
+                    if budget.cuts:
+                        message += f" 조합 규칙 {len(budget.cuts):,}개에서 키워드 {budget.removed:,}개를 제외했습니다."
+                    if budget.stopped is not None:
+                        message += (f" {budget.stopped['reason']}로 생성을 멈춰 "
+                                    f"조합 규칙 {budget.stopped['skipped_rules']:,}개는 생성하지 못했습니다.")
+                    st.warning(message + " 자세한 내역은 엑셀 Dashboard 시트에 기록됩니다.")
                 
                 # 결과 통계 표시
                 st.markdown("---")
@@ -376,11 +535,11 @@ def main():
                 
                 col1, col2, col3, col4 = st.columns(4)
                 with col1:
-                    st.metric("총 키워드 수", f"{len(results_df):,}")
+                    st.metric("총 키워드 수", f"{summary.total:,}")
                 with col2:
-                    st.metric("총 규칙 수", results_df['rule'].nunique())
+                    st.metric("총 규칙 수", len(summary.rule_counts))
                 with col3:
-                    st.metric("총 그룹 수", results_df['group'].nunique())
+                    st.metric("총 그룹 수", len(summary.group_counts))
                 with col4:
                     timestamp = datetime.now().strftime("%Y-%m-%d %H:%M:%S")
                     st.metric("현재 시간", timestamp.split()[1])
@@ -390,28 +549,30 @@ def main():
                 
                 with col1:
                     st.subheader("📊 그룹별 키워드 수")
-                    group_counts = results_df['group'].value_counts()
+                    group_counts = pd.Series(dict(summary.top_groups()), name='count')
                     st.bar_chart(group_counts)
                 
                 with col2:
                     st.subheader("📋 그룹별 상세 정보")
                     group_stats = []
-                    for group in results_df['group'].unique():
-                        count = len(results_df[results_df['group'] == group])
-                        percentage = (count / len(results_df)) * 100
+                    for group, count in summary.group_counts.items():
+                        percentage = (count / summary.total) * 100
                         group_stats.append({
                             "그룹": str(group),
                             "키워드 수": f"{count:,}",
                             "비율": f"{percentage:.1f}%"
                         })
                     st.dataframe(pd.DataFrame(group_stats), use_container_width=True)
+                    st.caption(
+                        f"중복 키워드 {summary.duplicates:,}개 · 평균 길이 {summary.average_length:.1f}자"
+                    )
                 
                 # 결과 미리보기
                 st.markdown("---")
                 st.header("🔍 생성된 키워드 미리보기")
                 
-                # 그룹 필터 (key를 사용하여 상태 유지)
-                all_groups = sorted(results_df['group'].unique())
+                # 그룹 필터 (key를 사용하여 상태 유지, 그룹 목록과 행 수는 그룹별 행 구간 인덱스에서 조회)
+                all_groups = sorted(results.group_ranges)
                 default_groups = all_groups[:3] if len(all_groups) > 3 else all_groups
                 
                 selected_groups = st.multiselect(
@@ -422,22 +583,32 @@ def main():
                 )
                 
                 if selected_groups:
-                    filtered_df = results_df[results_df['group'].isin(selected_groups)]
+                    total_rows = sum(results.group_size(group) for group in selected_groups)
                     
-                    # 표시할 행 수 선택
-                    max_rows = min(1000, len(filtered_df))
-                    num_rows = st.slider(
-                        "표시할 행 수", 
-                        10, 
-                        max_rows, 
-                        min(50, max_rows),
-                        key="num_rows_slider"
-                    )
+                    # 페이지 크기와 페이지 번호 선택
+                    col1, col2 = st.columns(2)
+                    with col1:
+                        page_size = st.selectbox(
+                            "페이지당 행 수",
+                            PREVIEW_PAGE_SIZES,
+                            index=1,
+                            key="page_size"
+                        )
+                    page_count = max(1, -(-total_rows // page_size))
+                    with col2:
+                        page_number = st.number_input(
+                            f"페이지 (전체 {page_count:,}페이지)",
+                            min_value=1,
+                            max_value=page_count,
+                            value=1,
+                            step=1,
+                            key="page_number"
+                        )
+                    page_number = min(int(page_number), page_count)
+                    offset = (page_number - 1) * page_size
                     
-                    # 데이터프레임 표시 (모든 컬럼을 문자열로 변환)
-                    display_df = filtered_df.head(num_rows).copy()
-                    for col in display_df.columns:
-                        display_df[col] = display_df[col].astype(str)
+                    # 현재 페이지의 행만 잘라서 문자열 키워드로 변환
+                    display_df = results.render(results.page(selected_groups, offset, page_size))
                     
                     st.dataframe(
                         display_df,
@@ -445,7 +616,10 @@ def main():
                         hide_index=True
                     )
                     
-                    st.info(f"선택된 그룹에서 {len(filtered_df):,}개 중 {min(num_rows, len(filtered_df))}개 표시")
+                    st.info(
+                        f"선택된 그룹의 {total_rows:,}개 중 "
+                        f"{offset + 1:,}~{offset + len(display_df):,}번째 표시"
+                    )
                 else:
                     st.warning("표시할 그룹을 선택해주세요.")
                 
@@ -462,21 +636,35 @@ def main():
                     - **그룹별 시트**: 각 그룹의 키워드 목록
                     """)
                     
-                    # 이미 생성된 엑셀 파일이 있는지 확인
-                    if st.session_state.excel_data is not None:
+                    # 다른 세션에서 같은 파일로 만든 엑셀 파일이 있으면 그대로 사용 (재생성 요청 시 제외)
+                    if not st.session_state.excel_regenerate and (
+                            st.session_state.excel_path is None or not os.path.exists(st.session_state.excel_path)):
+                        st.session_state.excel_path = result_store.find_file(st.session_state.results, '.xlsx')
+                    
+                    # 이미 생성된 엑셀 파일이 있는지 확인 (읽기 전에 정리되었으면 다시 생성)
+                    excel_data = None
+                    if st.session_state.excel_path is not None:
+                        try:
+                            with open(st.session_state.excel_path, 'rb') as excel_file:
+                                excel_data = excel_file.read()
+                        except FileNotFoundError:
+                            st.session_state.excel_path = None
+                    
+                    if excel_data is not None:
                         st.success("📁 엑셀 파일이 이미 준비되어 있습니다!")
                         st.download_button(
                             label="📥 엑셀 파일 다운로드",
-                            data=st.session_state.excel_data,
-                            file_name=st.session_state.excel_filename,
+                            data=excel_data,
+                            file_name=os.path.basename(st.session_state.excel_path),
                             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
                             type="primary",
                             use_container_width=True
                         )
                         
+                        # 다른 세션이 같은 파일을 쓰고 있을 수 있으므로 지우지 않고 새 이름으로 다시 만듦
                         if st.button("🔄 엑셀 파일 재생성", use_container_width=True):
-                            st.session_state.excel_data = None
-                            st.session_state.excel_filename = None
+                            st.session_state.excel_path = None
+                            st.session_state.excel_regenerate = True
                             st.rerun()
                     else:
                         # 엑셀 파일 생성 버튼
@@ -490,50 +678,68 @@ def main():
                                 timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
                                 filename = f"generated_keywords_{timestamp}.xlsx"
                                 
-                                # 엑셀 파일 생성 (진행 상황 표시 포함)
-                                excel_data = create_excel_download(results_df, progress_bar, status_text)
-                                
-                                # 세션 상태에 저장
-                                st.session_state.excel_data = excel_data
-                                st.session_state.excel_filename = filename
-                                
-                                # 완료 메시지
-                                status_text.text("✅ 엑셀 파일 생성 완료!")
+                                # 엑셀 파일 생성 (진행 상황 표시 포함, 결과 저장소에 파일로 기록)
+                                # (다른 세션이 쓰는 중인 파일을 읽지 않도록 임시 이름으로 쓴 뒤 이름 변경)
+                                excel_path = result_store.file_path(st.session_state.results, filename)
+                                try:
+                                    os.replace(
+                                        create_excel_download(results, progress_bar, status_text,
+                                                              target=result_store.part_path(excel_path)),
+                                        excel_path
+                                    )
+                                    with open(excel_path, 'rb') as excel_file:
+                                        excel_data = excel_file.read()
+                                except FileNotFoundError:
+                                    # 기록하는 사이 결과 디렉토리가 만료되어 삭제됨
+                                    excel_path = None
                                 
-                                # 다운로드 버튼 표시
-                                st.success("📁 엑셀 파일이 준비되었습니다!")
-                                st.download_button(
-                                    label="📥 엑셀 파일 다운로드",
-                                    data=excel_data,
-                                    file_name=filename,
-                                    mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
-                                    type="primary",
-                                    use_container_width=True
-                                )
+                                if excel_path is None:
+                                    status_text.empty()
+                                    st.warning("⏰ 저장된 결과가 만료되어 엑셀 파일을 만들지 못했습니다. "
+                                               "다시 시도해 주세요.")
+                                else:
+                                    result_store.evict(keep=st.session_state.results)
+                                    
+                                    # 세션 상태에는 경로만 저장
+                                    st.session_state.excel_path = excel_path
+                                    st.session_state.excel_regenerate = False
+                                    
+                                    # 완료 메시지
+                                    status_text.text("✅ 엑셀 파일 생성 완료!")
+                                    
+                                    # 다운로드 버튼 표시
+                                    st.success("📁 엑셀 파일이 준비되었습니다!")
+                                    st.download_button(
+                                        label="📥 엑셀 파일 다운로드",
+                                        data=excel_data,
+                                        file_name=filename,
+                                        mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+                                        type="primary",
+                                        use_container_width=True
+                                    )
                         else:
                             st.info("💡 위의 '엑셀 파일 생성' 버튼을 클릭하여 다운로드 파일을 준비하세요.")
                 
                 with col2:
                     # 파일 정보 표시
-                    if st.session_state.excel_data is not None:
+                    if st.session_state.excel_path is not None:
                         st.success(f"""
                         **📁 엑셀 파일 정보**
-                        - 파일명: {st.session_state.excel_filename}
-                        - 총 시트 수: {results_df['group'].nunique() + 1}
-                        - 총 키워드 수: {len(results_df):,}
+                        - 파일명: {os.path.basename(st.session_state.excel_path)}
+                        - 총 시트 수: {len(summary.group_counts) + 1}
+                        - 총 키워드 수: {summary.total:,}
                         """)
                     else:
                         st.info(f"""
                         **📊 예상 파일 정보**
-                        - 총 시트 수: {results_df['group'].nunique() + 1}
-                        - 총 키워드 수: {len(results_df):,}
+                        - 총 시트 수: {len(summary.group_counts) + 1}
+                        - 총 키워드 수: {summary.total:,}
                         """)
                     
                     # 생성될 시트 목록
                     with st.expander("📋 생성될 시트 목록"):
                         st.write("1. **Dashboard** (통계 정보)")
-                        for i, group in enumerate(sorted(results_df['group'].unique()), 2):
-                            group_count = len(results_df[results_df['group'] == group])
+                        for i, (group, group_count) in enumerate(sorted(summary.group_counts.items()), 2):
                             st.write(f"{i}. **{group}** ({group_count:,}개 키워드)")
         else:
             st.error("❌ 파일 로드에 실패했습니다.")
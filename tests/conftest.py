@@ -0,0 +1,116 @@
+"""
+테스트 공통 설정: src 모듈 import 경로와 테스트용 입력 워크북
+"""
+
+import itertools
+import os
+import sys
+
+import openpyxl
+import pandas as pd
+import pytest
+
+SRC_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
+if SRC_DIR not in sys.path:
+    sys.path.insert(0, SRC_DIR)
+
+# 테스트 워크북 컬럼 (1번부터, 중복 값과 빈 칸, 숫자 값 포함)
+SAMPLE_COLUMNS = [
+    ('brand', ['나이키', '아디다스', '뉴발란스', '나이키']),
+    ('item', ['운동화', '러닝화', None, '슬리퍼', '샌들']),
+    ('color', ['검정', '흰색', '  ']),
+    ('size', [230, 240, 250]),
+]
+
+# (조합 규칙, 그룹) - 그룹이 없으면 ungrouped
+SAMPLE_RULES = [
+    ('1,2', '신발'),
+    ('1,2,3', '신발'),
+    ('2,3', '색상'),
+    ('1,2,4', '사이즈'),
+    ('3', None),
+    ('1,3,4', '사이즈'),
+]
+
+def write_workbook(path, columns=SAMPLE_COLUMNS, rules=SAMPLE_RULES, constraints=None):
+    """1행 컬럼 번호, 2행 카테고리 제목, 3행부터 규칙/그룹/컬럼 값인 입력 워크북 작성
+
+    constraints를 주면 '제약조건' 시트에 (유형, 컬럼1, 값1, 컬럼2, 값2[, 그룹]) 행으로 기록합니다.
+    """
+    workbook = openpyxl.Workbook()
+    sheet = workbook.active
+    sheet.append(['규칙', None] + list(range(1, len(columns) + 1)))
+    sheet.append(['조합', '그룹'] + [name for name, _ in columns])
+    height = max([len(rules)] + [len(values) for _, values in columns])
+    for row in range(height):
+        rule, group = rules[row] if row < len(rules) else (None, None)
+        sheet.append([rule, group] + [values[row] if row < len(values) else None for _, values in columns])
+    if constraints is not None:
+        constraint_sheet = workbook.create_sheet('제약조건')
+        constraint_sheet.append(['유형', '컬럼1', '값1', '컬럼2', '값2', '그룹'])
+        for constraint in constraints:
+            constraint_sheet.append(list(constraint))
+    workbook.save(path)
+    return str(path)
+
+def baseline_keywords(path):
+    """최적화 이전 구현과 같은 방식(itertools.product)으로 만든 기준 결과 DataFrame"""
+    df_raw = pd.read_excel(path, header=None)
+    category_titles = df_raw.iloc[1].tolist()
+    df_data = df_raw.iloc[2:].reset_index(drop=True)
+    df_data.columns = category_titles
+
+    rule_groups = {}
+    for _, row in df_data.iterrows():
+        rule, group = row.iloc[0], row.iloc[1]
+        if pd.notna(rule):
+            if pd.isna(group) or str(group).strip() == '':
+                group = 'ungrouped'
+            rule_groups[str(rule)] = str(group)
+
+    results = []
+    for rule_str, group in rule_groups.items():
+        rule_numbers = [int(x.strip()) for x in rule_str.split(',') if x.strip().isdigit()]
+        values_list = []
+        column_names = []
+        for rule_num in rule_numbers:
+            if rule_num + 1 >= len(category_titles):
+                continue
+            name = category_titles[rule_num + 1]
+            values = [value for value in df_data[name].dropna().unique().tolist() if str(value).strip()]
+            if values:
+                values_list.append(values)
+                column_names.append(name)
+        for combo in itertools.product(*values_list):
+            results.append({
+                'rule': rule_str,
+                'group': group,
+                'columns': ", ".join(column_names),
+                'keyword': " ".join(str(item) for item in combo),
+                'components': " | ".join(str(item) for item in combo),
+            })
+    return pd.DataFrame(results)
+
+@pytest.fixture
+def sample_workbook(tmp_path):
+    return write_workbook(tmp_path / 'sample.xlsx')
+
+@pytest.fixture
+def sample_data(sample_workbook):
+    """(df_data, column_numbers, category_titles) - 파싱 캐시 없이 읽음"""
+    import keyword_generator
+    return keyword_generator.load_source_data(sample_workbook, cache_dir=None)
+
+@pytest.fixture
+def sample_results(sample_data):
+    """테스트 워크북의 전체 키워드 결과 DataFrame"""
+    import keyword_generator
+    return keyword_generator.generate_keyword_combinations(*sample_data)
+
+def read_xlsx(path):
+    """엑셀 파일의 시트 이름 -> 행(튜플) 목록"""
+    workbook = openpyxl.load_workbook(path, read_only=True)
+    try:
+        return {sheet.title: [tuple(row) for row in sheet.iter_rows(values_only=True)] for sheet in workbook.worksheets}
+    finally:
+        workbook.close()
@@ -0,0 +1,56 @@
+import json
+import os
+
+import pytest
+
+from conftest import SAMPLE_RULES, baseline_keywords, write_workbook
+from keyword_batch import assign_output_dirs, find_workbooks, main
+
+def test_find_workbooks(tmp_path):
+    inputs = tmp_path / 'inputs'
+    (inputs / 'nested').mkdir(parents=True)
+    for name in ('b.xlsx', 'a.XLSX', '~$a.xlsx', 'notes.txt', 'nested/c.xlsx'):
+        (inputs / name).write_bytes(b'')
+    assert find_workbooks([str(inputs)]) == [str(inputs / 'a.XLSX'), str(inputs / 'b.xlsx')]
+    # 여러 소스에 걸린 파일은 한 번만, 없는 파일은 그대로 남김
+    found = find_workbooks([str(inputs / '**' / '*.xlsx'), str(inputs / 'b.xlsx'), 'missing.xlsx'])
+    assert found == [str(inputs / 'b.xlsx'), str(inputs / 'nested' / 'c.xlsx'), 'missing.xlsx']
+
+def test_assign_output_dirs():
+    targets = assign_output_dirs(['x/a.xlsx', 'y/a.xlsx', 'b.xlsx', 'z/a.xlsx'], 'out')
+    assert [output_dir for _, output_dir in targets] == [
+        os.path.join('out', name) for name in ('a', 'a_2', 'b', 'a_3')
+    ]
+
+def test_batch_run(tmp_path):
+    inputs = tmp_path / 'inputs'
+    inputs.mkdir()
+    write_workbook(inputs / 'first.xlsx')
+    write_workbook(inputs / 'second.xlsx', rules=SAMPLE_RULES[:2])
+    (inputs / 'broken.xlsx').write_bytes(b'not a workbook')
+    output_dir = tmp_path / 'out'
+    report_path = tmp_path / 'batch.json'
+
+    assert main([str(inputs), '-o', str(output_dir), '-j', '2', '--report', str(report_path),
+                 '--', '-f', 'csv', '--quiet']) == 1
+    report = json.loads(report_path.read_text(encoding='utf-8'))
+    assert report['counts'] == {'ok': 2, 'failed': 1, 'cancelled': 0, 'skipped': 0}
+    files = {os.path.basename(entry['input']): entry for entry in report['files']}
+    assert [os.path.basename(entry['input']) for entry in report['files']] == ['broken.xlsx', 'first.xlsx',
+                                                                               'second.xlsx']
+    for name in ('first', 'second'):
+        entry = files[f'{name}.xlsx']
+        assert entry['keywords'] == len(baseline_keywords(inputs / f'{name}.xlsx'))
+        assert entry['output'].startswith(str(output_dir / name))
+        assert os.path.exists(output_dir / name / 'run.log')
+    assert report['keywords'] == files['first.xlsx']['keywords'] + files['second.xlsx']['keywords']
+    assert files['broken.xlsx']['status'] == 'failed' and files['broken.xlsx']['error']
+
+@pytest.mark.parametrize('options', [
+    ['-o', 'elsewhere'], ['--out', 'shared'], ['-oshared'], ['--outp=shared'], ['--inp', 'other.xlsx'],
+    ['--rep', 'r.json'], ['--rep'], ['--prof', 'run.prof'],
+])
+def test_reserved_options_are_rejected(tmp_path, options):
+    with pytest.raises(SystemExit):
+        main([str(tmp_path), '-o', str(tmp_path / 'out'), '--', '-f', 'csv', *options])
+    assert not (tmp_path / 'out').exists()
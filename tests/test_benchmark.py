@@ -0,0 +1,34 @@
+import keyword_generator as kg
+from keyword_benchmark import build_synthetic_workbook, compare_with_baseline
+
+def test_synthetic_workbook_matches_expected_size(tmp_path):
+    path = tmp_path / 'synthetic.xlsx'
+    rules, keywords = build_synthetic_workbook(path, columns=4, values=5, rules=6, arity=3, groups=2, seed=1)
+    df_data, column_numbers, category_titles = kg.load_source_data(str(path), cache_dir=None)
+    plan = kg.plan_keyword_generation(df_data, column_numbers, category_titles)
+    assert (rules, keywords) == (6, 6 * 5 ** 3)
+    assert plan['total_keywords'] == keywords
+    # 같은 시드는 같은 워크북
+    other = tmp_path / 'other.xlsx'
+    build_synthetic_workbook(other, columns=4, values=5, rules=6, arity=3, groups=2, seed=1)
+    assert kg.load_source_data(str(other), cache_dir=None)[0].equals(df_data)
+
+def scenario(throughput, peak_rss):
+    return {'scenarios': [{'name': 'small', 'stages': [
+        {'stage': 'generate', 'throughput': throughput, 'peak_rss': peak_rss},
+        {'stage': 'csv', 'error': 'failed'},
+    ]}]}
+
+def test_compare_with_baseline_flags_regressions():
+    baseline = scenario(1000.0, 100)
+    rows, regressions = compare_with_baseline(scenario(950.0, 105), baseline)
+    assert regressions == 0
+    assert rows == [('small', 'generate', 0.95, 1.05, False)]
+
+    _, regressions = compare_with_baseline(scenario(800.0, 100), baseline)
+    assert regressions == 1
+    _, regressions = compare_with_baseline(scenario(1000.0, 120), baseline)
+    assert regressions == 1
+    # 메모리를 잴 수 없으면 처리량만 비교
+    rows, regressions = compare_with_baseline(scenario(1000.0, None), baseline)
+    assert (rows[0][3], regressions) == (None, 0)
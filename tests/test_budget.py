@@ -0,0 +1,101 @@
+import pandas as pd
+import pytest
+
+import keyword_generator as kg
+from conftest import write_workbook
+
+def generate(data, budget, **options):
+    engine = kg.KeywordEngine(*data, chunk_size=4, verbose=False, budget=budget, **options)
+    frames = list(engine.iter_chunks())
+    return pd.concat(frames, ignore_index=True) if frames else pd.DataFrame(columns=kg.RESULT_COLUMNS)
+
+def rule_keywords(frame):
+    return {rule: group['keyword'].tolist() for rule, group in frame.groupby('rule', sort=False)}
+
+def test_truncate_keeps_prefix_of_each_rule(sample_data, sample_results):
+    budget = kg.GenerationBudget(max_rule_rows=5, policy='truncate')
+    result = generate(sample_data, budget)
+    expected = {rule: keywords[:5] for rule, keywords in rule_keywords(sample_results).items()}
+    assert rule_keywords(result) == expected
+    assert set(budget.cuts) == {rule for rule, keywords in rule_keywords(sample_results).items() if len(keywords) > 5}
+    assert all(cut['rows'] == cut['limit'] == 5 for cut in budget.cuts.values())
+    assert budget.removed == len(sample_results) - len(result)
+
+def test_truncate_total_fills_in_generation_order(sample_data, sample_results):
+    budget = kg.GenerationBudget(max_rows=20, policy='truncate')
+    result = generate(sample_data, budget)
+    pd.testing.assert_frame_equal(result, sample_results.head(20))
+    assert budget.applied
+
+def test_sample_is_evenly_spaced(sample_data, sample_results):
+    budget = kg.GenerationBudget(max_rule_rows=5, policy='sample')
+    result = rule_keywords(generate(sample_data, budget))
+    for rule, keywords in rule_keywords(sample_results).items():
+        count = min(5, len(keywords))
+        assert result[rule] == [keywords[i * len(keywords) // count] for i in range(count)]
+
+def test_sample_total_is_split_by_rule_size(sample_data, sample_results):
+    budget = kg.GenerationBudget(max_rows=30, policy='sample')
+    result = generate(sample_data, budget)
+    assert len(result) <= 30
+    sizes = sample_results['rule'].value_counts()
+    for rule, rows in result['rule'].value_counts().items():
+        assert rows == sizes[rule] * 30 // len(sample_results)
+
+def test_sample_with_constraints_is_subset(tmp_path):
+    path = write_workbook(tmp_path / 'con.xlsx', constraints=[('제외', 'brand', '나이키', 'item', '운동화')])
+    data = kg.load_source_data(path, cache_dir=None)
+    inputs = kg.prepare_generation(path, data[0], data[2], cache_dir=None)
+    full = rule_keywords(generate(data, None, **inputs))
+    budget = kg.GenerationBudget(max_rule_rows=4, policy='sample')
+    result = rule_keywords(generate(data, budget, **inputs))
+    for rule, keywords in result.items():
+        assert len(keywords) <= 4
+        positions = [full[rule].index(keyword) for keyword in keywords]
+        assert positions == sorted(set(positions))
+
+def test_abort(sample_data, tmp_path):
+    with pytest.raises(kg.BudgetExceeded):
+        kg.KeywordEngine(*sample_data, verbose=False, budget=kg.GenerationBudget(max_rows=10))
+    with pytest.raises(kg.BudgetExceeded):
+        kg.KeywordEngine(*sample_data, verbose=False, budget=kg.GenerationBudget(max_rule_rows=10))
+    # 제약조건이 있으면 계획이 최대치이므로 생성하면서 확인
+    path = write_workbook(tmp_path / 'con.xlsx', constraints=[('제외', 'brand', '나이키', 'item', '운동화')])
+    data = kg.load_source_data(path, cache_dir=None)
+    inputs = kg.prepare_generation(path, data[0], data[2], cache_dir=None)
+    with pytest.raises(kg.BudgetExceeded):
+        generate(data, kg.GenerationBudget(max_rows=10), **inputs)
+    with pytest.raises(ValueError):
+        kg.GenerationBudget(policy='skip')
+
+def test_time_limit_stops_with_partial_output(sample_data, sample_results):
+    budget = kg.GenerationBudget(max_seconds=0, policy='truncate')
+    result = generate(sample_data, budget)
+    assert len(result) < len(sample_results)
+    pd.testing.assert_frame_equal(result, sample_results.head(len(result)))
+    assert budget.stopped['reason'].startswith("생성 시간 한도")
+    assert budget.stopped['skipped_rules'] > 0
+    with pytest.raises(kg.BudgetExceeded):
+        generate(sample_data, kg.GenerationBudget(max_seconds=0))
+
+def test_describe_and_truthiness():
+    assert not kg.GenerationBudget()
+    assert kg.GenerationBudget().describe() == "제한 없음 (abort)"
+    assert kg.GenerationBudget(max_rows=1000, max_rule_rows=10, policy='sample').describe() == \
+        "전체 1,000행, 규칙별 10행 (sample)"
+
+def test_web_budget_defaults_and_policy_check(monkeypatch):
+    pytest.importorskip('streamlit')
+    import importlib
+    import streamlit_app
+
+    # 기본 예산은 결과를 줄이지 않는 abort 정책의 유한한 한도
+    budget = streamlit_app.make_web_budget()
+    assert budget and budget.policy == 'abort'
+    assert budget.max_rows is not None or budget.max_rss is not None
+
+    monkeypatch.setenv('KEYWORD_WEB_BUDGET_POLICY', 'skip')
+    with pytest.raises(ValueError, match='KEYWORD_WEB_BUDGET_POLICY'):
+        importlib.reload(streamlit_app)
+    monkeypatch.delenv('KEYWORD_WEB_BUDGET_POLICY')
+    importlib.reload(streamlit_app)
@@ -0,0 +1,27 @@
+import keyword_generator as kg
+
+def test_values_are_unique_strings_without_blanks(sample_data):
+    df_data, _, category_titles = sample_data
+    column_index = kg.build_column_index(df_data, category_titles)
+
+    assert sorted(column_index) == [1, 2, 3, 4]
+    assert column_index[1]['name'] == 'brand'
+    assert column_index[1]['values'] == ['나이키', '아디다스', '뉴발란스']
+    assert column_index[2]['values'] == ['운동화', '러닝화', '슬리퍼', '샌들']
+    assert column_index[3]['values'] == ['검정', '흰색']
+    assert column_index[4]['values'] == ['230', '240', '250']
+
+def test_lengths_and_bytes(sample_data):
+    df_data, _, category_titles = sample_data
+    entry = kg.build_column_index(df_data, category_titles)[1]
+    assert entry['lengths'] == [3, 4, 4]
+    assert entry['total_length'] == 11
+    assert entry['total_bytes'] == sum(len(value.encode('utf-8')) for value in entry['values'])
+    assert entry['wide']
+    assert not kg.build_column_index(df_data, category_titles)[4]['wide']
+
+def test_engine_accepts_shared_index(sample_data, sample_results):
+    df_data, column_numbers, category_titles = sample_data
+    column_index = kg.build_column_index(df_data, category_titles)
+    result = kg.generate_keyword_combinations(df_data, column_numbers, category_titles, column_index=column_index)
+    assert result['keyword'].tolist() == sample_results['keyword'].tolist()
@@ -0,0 +1,42 @@
+import pandas as pd
+
+import keyword_generator as kg
+
+def compact(sample_data, chunk_size=5):
+    return kg.KeywordEngine(*sample_data, chunk_size=chunk_size, verbose=False).compact_results()
+
+def test_render_matches_generation(sample_data, sample_results):
+    results = compact(sample_data)
+    assert len(results) == len(sample_results)
+    pd.testing.assert_frame_equal(results.to_dataframe(), sample_results.reset_index(drop=True))
+    rendered = pd.concat(list(results.iter_chunks(7)), ignore_index=True)
+    pd.testing.assert_frame_equal(rendered, sample_results.reset_index(drop=True))
+
+def test_frame_stores_codes(sample_data):
+    frame = compact(sample_data).frame
+    assert isinstance(frame['rule'].dtype, pd.CategoricalDtype)
+    assert [name for name in frame.columns if name.startswith('c') and name[1:].isdigit()] == ['c0', 'c1', 'c2']
+    # 컬럼이 하나뿐인 규칙 '3'의 뒤쪽 코드는 -1
+    assert (frame.loc[frame['rule'] == '3', ['c1', 'c2']] == -1).all().all()
+
+def test_slice_frame(sample_data, sample_results):
+    results = compact(sample_data)
+    expected = sample_results.reset_index(drop=True)
+    sliced = results.render(results.slice_frame(3, 17))
+    pd.testing.assert_frame_equal(sliced, expected.iloc[3:17].reset_index(drop=True))
+
+def test_summary_counts(sample_data, sample_results):
+    summary = compact(sample_data).summary
+    assert summary.total == len(sample_results)
+    assert dict(summary.rule_counts) == sample_results.groupby('rule', sort=False).size().to_dict()
+
+def test_page_across_rules_of_different_width(sample_data, sample_results):
+    results = compact(sample_data)
+    expected = sample_results.reset_index(drop=True)
+    groups = ['사이즈', '신발']
+    selected = pd.concat([expected[expected['group'] == group] for group in groups], ignore_index=True)
+
+    for offset, limit in [(0, 10), (30, 25), (50, 100), (200, 10)]:
+        page = results.render(results.page(groups, offset, limit))
+        pd.testing.assert_frame_equal(page, selected.iloc[offset:offset + limit].reset_index(drop=True))
+    assert results.group_size('사이즈') == (expected['group'] == '사이즈').sum()
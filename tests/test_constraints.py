@@ -0,0 +1,89 @@
+import pandas as pd
+
+import keyword_generator as kg
+from conftest import baseline_keywords, write_workbook
+
+def generate(path, **options):
+    df_data, column_numbers, category_titles = kg.load_source_data(path, cache_dir=None)
+    inputs = kg.prepare_generation(path, df_data, category_titles, cache_dir=None, **options)
+    engine = kg.KeywordEngine(df_data, column_numbers, category_titles, chunk_size=5, verbose=False, **inputs)
+    frames = list(engine.iter_chunks())
+    return (pd.concat(frames, ignore_index=True) if frames else pd.DataFrame()), inputs['constraints']
+
+def filter_baseline(path, allowed):
+    """기준 결과에서 allowed(행의 {컬럼: 값}, 그룹)가 참인 행만 남김"""
+    baseline = baseline_keywords(path)
+    keep = [allowed(dict(zip(row.columns.split(", "), row.components.split(" | "))), row.group)
+            for row in baseline.itertuples()]
+    return baseline[keep].reset_index(drop=True)
+
+def assert_same_keywords(result, expected):
+    assert result['keyword'].tolist() == expected['keyword'].tolist()
+    assert result['rule'].tolist() == expected['rule'].tolist()
+
+def test_exclude_and_include_match_filtered_baseline(tmp_path):
+    path = write_workbook(tmp_path / 'con.xlsx', constraints=[
+        ('제외', 'brand', '나이키', 'item', '운동화'),
+        ('제외', 2, ' 러닝화 ', 'color', '흰색'),
+        ('포함', 'brand', '아디다스', 'item', '러닝화'),
+        ('포함', 'brand', '아디다스', 'item', '샌들'),
+    ])
+
+    def allowed(values, group):
+        brand, item, color = values.get('brand'), values.get('item'), values.get('color')
+        if brand == '나이키' and item == '운동화':
+            return False
+        if item == '러닝화' and color == '흰색':
+            return False
+        if brand == '아디다스' and item is not None and item not in ('러닝화', '샌들'):
+            return False
+        return True
+
+    result, constraints = generate(path)
+    assert constraints.describe() == "제외 2개, 포함 2개"
+    assert constraints.warnings == []
+    assert_same_keywords(result, filter_baseline(path, allowed))
+
+    # 제약조건을 끄면 기준 결과 전체
+    result, constraints = generate(path, use_constraints=False)
+    assert constraints is None
+    assert_same_keywords(result, baseline_keywords(path))
+
+def test_group_scoped_constraint(tmp_path):
+    path = write_workbook(tmp_path / 'group.xlsx', constraints=[
+        ('exclude', 'item', '운동화', 'color', '검정', '색상'),
+    ])
+
+    def allowed(values, group):
+        return not (group == '색상' and values.get('item') == '운동화' and values.get('color') == '검정')
+
+    result, _ = generate(path)
+    expected = filter_baseline(path, allowed)
+    assert_same_keywords(result, expected)
+    # 신발 그룹의 같은 조합은 그대로 남음
+    assert '나이키 운동화 검정' in result['keyword'].tolist()
+    assert '운동화 검정' not in result['keyword'].tolist()
+
+def test_unknown_columns_are_reported(tmp_path):
+    path = write_workbook(tmp_path / 'warn.xlsx', constraints=[
+        ('제외', 'brand', '나이키', '없는 컬럼', '운동화'),
+        ('포함', 9, '나이키', 'item', '운동화'),
+        ('제외', 'brand', None, 'item', '운동화'),
+        ('메모', 'brand', '나이키', 'item', '운동화'),
+    ])
+    result, constraints = generate(path)
+    assert len(constraints) == 0
+    # 헤더가 1행, 알 수 없는 유형의 행은 경고 없이 건너뜀
+    assert constraints.warnings == [f"{row}행: 컬럼 또는 값을 알 수 없어 건너뜀" for row in (2, 3, 4)]
+    assert_same_keywords(result, baseline_keywords(path))
+
+def test_constraints_from_separate_workbook(tmp_path):
+    path = write_workbook(tmp_path / 'plain.xlsx')
+    constraint_path = write_workbook(tmp_path / 'rules.xlsx', constraints=[
+        ('제외', 'brand', '뉴발란스', 'item', '샌들'),
+    ])
+    result, constraints = generate(path, constraint_source=constraint_path)
+    assert len(constraints) == 1
+    assert_same_keywords(result, filter_baseline(
+        path, lambda values, group: not (values.get('brand') == '뉴발란스' and values.get('item') == '샌들')))
+    assert kg.load_constraints(path, kg.load_source_data(path, cache_dir=None)[2], cache_dir=None) is None
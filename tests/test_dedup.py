@@ -0,0 +1,64 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+import keyword_generator as kg
+from conftest import write_workbook
+
+def with_duplicates(results):
+    """다른 규칙/그룹에서 앞의 키워드 일부를 다시 만든 결과 (청크 안 중복 포함)"""
+    repeated = results.iloc[::3].assign(rule='99', group='중복')
+    return pd.concat([results, repeated, repeated.iloc[:2]], ignore_index=True)
+
+def test_exact_matches_drop_duplicates(sample_results):
+    frame = with_duplicates(sample_results)
+    dedup = kg.KeywordDeduplicator('exact')
+    kept = pd.concat(list(dedup.filter_chunks(kg.iter_dataframe_chunks(frame, 8))), ignore_index=True)
+
+    expected = frame.drop_duplicates('keyword').reset_index(drop=True)
+    pd.testing.assert_frame_equal(kept, expected)
+    assert dedup.removed == len(frame) - len(expected)
+    assert dedup.kept == len(expected)
+    assert dict(dedup.removed_groups) == {'중복': dedup.removed}
+    # 중복 그룹의 키워드는 모두 앞서 나온 그룹의 키워드와 겹침
+    assert sum(dedup.collisions.values()) == dedup.removed
+    assert all(removed == '중복' for _, removed in dedup.collisions)
+
+def test_bloom_removes_all_duplicates(sample_results):
+    frame = with_duplicates(sample_results)
+    dedup = kg.KeywordDeduplicator('bloom', capacity=len(frame), error_rate=1e-6)
+    kept = pd.concat(list(dedup.filter_chunks(kg.iter_dataframe_chunks(frame, 8))), ignore_index=True)
+    assert kept['keyword'].is_unique
+    assert len(kept) == frame['keyword'].nunique()
+    with pytest.raises(ValueError):
+        kg.KeywordDeduplicator('bloom')
+
+def test_priority_group_keeps_its_keywords(tmp_path):
+    # 1번과 2번 컬럼의 값이 같아 규칙 '1'과 '2'가 같은 키워드를 만듦
+    path = write_workbook(tmp_path / 'dup.xlsx', columns=[('a', ['x', 'y']), ('b', ['y', 'z'])],
+                          rules=[('1', '먼저'), ('2', '우선')])
+    df_data, column_numbers, category_titles = kg.load_source_data(path, cache_dir=None)
+    for priority_groups, owner in [(None, '먼저'), (['우선'], '우선')]:
+        engine = kg.KeywordEngine(df_data, column_numbers, category_titles, priority_groups=priority_groups,
+                                  verbose=False)
+        dedup = kg.KeywordDeduplicator('exact', priority_groups=priority_groups)
+        kept = pd.concat(list(dedup.filter_chunks(engine.iter_chunks())), ignore_index=True)
+        assert sorted(kept['keyword']) == ['x', 'y', 'z']
+        assert kept.loc[kept['keyword'] == 'y', 'group'].item() == owner
+
+def test_compact_results_with_dedup(sample_data, sample_results):
+    engine = kg.KeywordEngine(*sample_data, verbose=False)
+    dedup = kg.KeywordDeduplicator('exact')
+    results = engine.compact_results(dedup)
+    assert len(results) == sample_results['keyword'].nunique()
+    assert dedup.removed == 0
+
+def test_hash_set_merges_runs():
+    hash_set = kg.KeywordHashSet()
+    for start in range(0, 64, 8):
+        hashes = np.arange(start, start + 8, dtype=np.int64) * 7919
+        hash_set.add(hashes, np.full(8, start, dtype=np.int32))
+    assert len(hash_set) == 64
+    assert len(hash_set.runs) == 1
+    lookup = hash_set.lookup(np.array([0, 7919 * 9, 5], dtype=np.int64))
+    assert lookup.tolist() == [0, 8, -1]
@@ -0,0 +1,29 @@
+import pandas as pd
+
+import keyword_generator as kg
+from conftest import baseline_keywords, write_workbook
+
+def engine_frame(df_data, column_numbers, category_titles, **options):
+    engine = kg.KeywordEngine(df_data, column_numbers, category_titles, verbose=False, **options)
+    chunks = list(engine.iter_chunks())
+    return pd.concat(chunks, ignore_index=True)[kg.RESULT_COLUMNS]
+
+def test_matches_baseline(sample_workbook, sample_data):
+    expected = baseline_keywords(sample_workbook)
+    result = kg.generate_keyword_combinations(*sample_data)
+    pd.testing.assert_frame_equal(result.reset_index(drop=True), expected)
+
+def test_small_chunks_match_baseline(sample_workbook, sample_data):
+    expected = baseline_keywords(sample_workbook)
+    result = engine_frame(*sample_data, chunk_size=4)
+    pd.testing.assert_frame_equal(result, expected)
+
+def test_iter_keyword_rows_match_baseline(sample_workbook, sample_data):
+    expected = baseline_keywords(sample_workbook)
+    rows = pd.DataFrame(list(kg.iter_keyword_rows(*sample_data)))
+    pd.testing.assert_frame_equal(rows, expected)
+
+def test_missing_rule_column_is_skipped(tmp_path):
+    path = write_workbook(tmp_path / 'missing.xlsx', rules=[('1,9', 'g'), ('2', 'g')])
+    df_data, column_numbers, category_titles = kg.load_source_data(path, cache_dir=None)
+    pd.testing.assert_frame_equal(engine_frame(df_data, column_numbers, category_titles), baseline_keywords(path))
@@ -0,0 +1,66 @@
+import pandas as pd
+
+import keyword_generator as kg
+from conftest import read_xlsx
+from output_sinks import DASHBOARD_NAME, StreamingExcelWriter, split_sheet_name, unique_name
+
+def write_xlsx(results, path, max_rows, chunk_size=5):
+    writer = StreamingExcelWriter(path, kg.RESULT_COLUMNS, max_rows=max_rows)
+    for chunk in kg.iter_dataframe_chunks(results, chunk_size):
+        writer.write_chunk(chunk)
+    writer.write_dashboard([('총 키워드 수', len(results))])
+    writer.close()
+    return writer
+
+def group_rows(sheets, names):
+    """여러 시트로 나뉜 그룹의 데이터 행 (시트마다 헤더 제외)"""
+    rows = []
+    for name in names:
+        assert sheets[name][0] == tuple(kg.RESULT_COLUMNS)
+        rows.extend(sheets[name][1:])
+    return rows
+
+def test_round_trip_with_sheet_rollover(tmp_path, sample_results):
+    path = tmp_path / 'out.xlsx'
+    writer = write_xlsx(sample_results, path, max_rows=10)
+    sheets = read_xlsx(path)
+
+    assert list(sheets) == writer.sheet_names
+    assert list(sheets)[0] == DASHBOARD_NAME
+    assert sheets[DASHBOARD_NAME] == [('항목', '값'), ('총 키워드 수', len(sample_results))]
+    for group, expected in sample_results.groupby('group', sort=False):
+        names = [name for name in sheets if name == group or name.startswith(f"{group}_")]
+        # 헤더 포함 10행씩이므로 시트마다 데이터 9행
+        assert len(names) == -(-len(expected) // 9)
+        assert all(len(sheets[name]) <= 10 for name in names)
+        assert group_rows(sheets, names) == list(expected.itertuples(index=False, name=None))
+
+def test_invalid_and_colliding_sheet_names(tmp_path):
+    frame = pd.DataFrame({
+        'rule': '1', 'group': ['a/b', 'a_b', 'dashboard', 'x' * 40, 'x' * 40 + 'y'],
+        'columns': 'c', 'keyword': ['k1', 'k2', 'k3', 'k4', 'k5'], 'components': 'c'
+    })
+    path = tmp_path / 'names.xlsx'
+    write_xlsx(frame, path, max_rows=100)
+    sheets = read_xlsx(path)
+    assert list(sheets) == [DASHBOARD_NAME, 'a_b', 'a_b_2', 'dashboard_2', 'x' * 31, 'x' * 29 + '_2']
+    assert [rows[1][3] for name, rows in sheets.items() if name != DASHBOARD_NAME] == ['k1', 'k2', 'k3', 'k4', 'k5']
+
+def test_abort_leaves_no_open_sheets(tmp_path, sample_results):
+    writer = StreamingExcelWriter(tmp_path / 'aborted.xlsx', kg.RESULT_COLUMNS)
+    writer.write_chunk(sample_results)
+    writer.abort()
+    assert all(sheet.closed for sheet in writer.workbook.worksheets)
+
+def test_split_sheet_name_keeps_length_limit():
+    assert split_sheet_name('그룹', 1) == '그룹'
+    assert split_sheet_name('그룹', 3) == '그룹_3'
+    assert len(split_sheet_name('g' * 40, 12)) == 31
+    assert split_sheet_name("'[a]'", 1) == '_a_'
+
+def test_unique_name_ignores_case():
+    used = {'dashboard'}
+    assert unique_name('Dashboard', used) == 'Dashboard_2'
+    assert unique_name('DASHBOARD', used) == 'DASHBOARD_3'
+    assert unique_name('abcdef', used, max_length=6) == 'abcdef'
+    assert unique_name('abcdef', used, max_length=6) == 'abcd_2'
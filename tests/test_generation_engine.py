@@ -0,0 +1,113 @@
+import signal
+import threading
+
+import pandas as pd
+import pytest
+
+import keyword_generator as kg
+from conftest import write_workbook
+
+def test_progress_reports_every_chunk(sample_data, sample_results):
+    updates = []
+    engine = kg.KeywordEngine(*sample_data, chunk_size=4, verbose=False, progress=updates.append)
+    chunks = list(engine.iter_chunks())
+
+    *running, last = updates
+    assert len(running) == len(chunks)
+    assert [update['rows'] for update in running] == list(pd.Series([len(chunk) for chunk in chunks]).cumsum())
+    assert [update['rule'] for update in running] == [chunk['rule'].iat[0] for chunk in chunks]
+    assert all(not update['finished'] and update['rows_total'] == len(sample_results) for update in running)
+    assert [update['fraction'] for update in running] == sorted(update['fraction'] for update in running)
+    assert last['finished'] and last['fraction'] == 1.0
+    assert (last['rows'], last['rules_done'], last['rules_total']) == (len(sample_results), 6, 6)
+
+def test_cancel_from_progress_callback(sample_data):
+    cancel = kg.CancellationToken()
+
+    def progress(update):
+        if update['rows'] >= 10:
+            cancel.cancel()
+
+    engine = kg.KeywordEngine(*sample_data, chunk_size=4, verbose=False, progress=progress, cancel=cancel)
+    rows = 0
+    with pytest.raises(kg.GenerationCancelled):
+        for chunk in engine.iter_chunks():
+            rows += len(chunk)
+    # 취소한 뒤에는 다음 청크를 만들지 않음
+    assert rows == engine.rows == 12
+
+def test_cli_cancel_returns_interrupted(sample_workbook, tmp_path):
+    cancel = kg.CancellationToken()
+    cancel.cancel()
+    args = kg.parse_arguments(['-i', sample_workbook, '-o', str(tmp_path / 'out'), '-f', 'csv', '--quiet'])
+    assert kg.run(args, cancel=cancel) == 130
+
+def test_web_inputs_match_cli(tmp_path, monkeypatch):
+    pytest.importorskip('streamlit')
+    import streamlit_app
+
+    path = write_workbook(tmp_path / 'con.xlsx', constraints=[
+        ('제외', 'brand', '나이키', 'item', '운동화'),
+        ('포함', 'item', '러닝화', 'color', '흰색'),
+    ])
+    # 테스트마다 새 공유 캐시와 캐시 없는 워크북 읽기 사용
+    monkeypatch.setattr(streamlit_app, 'get_shared_cache', lambda cache=streamlit_app.SharedLRUCache(): cache)
+    monkeypatch.setattr(streamlit_app, 'load_raw_workbook',
+                        lambda source: kg.load_raw_workbook(source, cache_dir=None))
+    monkeypatch.setattr(streamlit_app, 'prepare_generation',
+                        lambda *args, **options: kg.prepare_generation(*args, cache_dir=None, **options))
+    with open(path, 'rb') as f:
+        data = f.read()
+    _, df_data, column_numbers, category_titles, inputs, cache_hit = streamlit_app.parse_source_cached(data, 'key')
+    assert cache_hit is None
+    assert streamlit_app.parse_source_cached(data, 'key')[-1] == 'memory'
+    assert inputs['constraints'].describe() == "제외 1개, 포함 1개"
+
+    web = kg.KeywordEngine(df_data, column_numbers, category_titles, verbose=False, **inputs)
+    cli_data = kg.load_source_data(path, cache_dir=None)
+    cli = kg.KeywordEngine(*cli_data, verbose=False,
+                           **kg.prepare_generation(path, cli_data[0], cli_data[2], cache_dir=None))
+    pd.testing.assert_frame_equal(pd.concat(list(web.iter_chunks()), ignore_index=True),
+                                  pd.concat(list(cli.iter_chunks()), ignore_index=True))
+
+def test_web_stop_button_cancels_running_generation(sample_data, monkeypatch):
+    pytest.importorskip('streamlit')
+    import streamlit_app
+
+    class ClickStopOnProgress:
+        """첫 진행률 표시 때 중지 버튼 콜백을 부르는 진행률 막대 (생성 중 클릭)"""
+
+        def progress(self, value):
+            streamlit_app.stop_generation()
+
+    monkeypatch.setattr(streamlit_app.st, 'progress', lambda value: ClickStopOnProgress())
+    streamlit_app.start_generation()
+    cancel = streamlit_app.st.session_state.generation_cancel
+    assert streamlit_app.st.session_state.generation_state == 'running'
+    with pytest.raises(kg.GenerationCancelled):
+        streamlit_app.generate_keyword_combinations_streamlit(*sample_data, cancel=cancel)
+    assert cancel.cancelled
+    assert streamlit_app.st.session_state.generation_state == 'stopped'
+    # 다시 시작하면 취소되지 않은 새 토큰 사용
+    streamlit_app.start_generation()
+    assert not streamlit_app.st.session_state.generation_cancel.cancelled
+
+def test_cli_restores_interrupt_handler(sample_workbook, tmp_path):
+    def previous(signum, frame):
+        pass
+
+    original = signal.signal(signal.SIGINT, previous)
+    try:
+        args = kg.parse_arguments(['-i', sample_workbook, '-o', str(tmp_path / 'out'), '-f', 'csv', '--quiet'])
+        assert kg.run(args) == 0
+        assert signal.getsignal(signal.SIGINT) is previous
+    finally:
+        signal.signal(signal.SIGINT, original)
+
+def test_cli_runs_off_main_thread(sample_workbook, tmp_path):
+    args = kg.parse_arguments(['-i', sample_workbook, '-o', str(tmp_path / 'out'), '-f', 'csv', '--quiet'])
+    codes = []
+    thread = threading.Thread(target=lambda: codes.append(kg.run(args)))
+    thread.start()
+    thread.join()
+    assert codes == [0]
@@ -0,0 +1,130 @@
+import glob
+import os
+
+import numpy as np
+import pandas as pd
+
+import keyword_generator as kg
+from conftest import SAMPLE_COLUMNS, read_xlsx, write_workbook
+from output_manifest import OutputManifest, RuleOutputCache, manifest_path_for, rule_cache_dir_for
+
+def rule_hashes(path):
+    df_data, _, category_titles = kg.load_source_data(path, cache_dir=None)
+    inputs = kg.prepare_generation(path, df_data, category_titles, cache_dir=None)
+    manifest = kg.build_manifest(df_data, category_titles, inputs['column_index'], inputs['limits'],
+                                 inputs['constraints'])
+    return {rule_str: info['hash'] for rule_str, info in manifest.rules.items()}
+
+def replace_column(index, column):
+    columns = list(SAMPLE_COLUMNS)
+    columns[index] = column
+    return columns
+
+def changed_rules(before, after):
+    return {rule_str for rule_str in before if before[rule_str] != after[rule_str]}
+
+def test_rule_hash_tracks_column_values_and_names(tmp_path):
+    base = rule_hashes(write_workbook(tmp_path / 'base.xlsx'))
+    assert base == rule_hashes(write_workbook(tmp_path / 'same.xlsx'))
+
+    values = rule_hashes(write_workbook(tmp_path / 'values.xlsx',
+                                        columns=replace_column(3, ('size', [230, 240, 260]))))
+    assert changed_rules(base, values) == {'1,2,4', '1,3,4'}
+
+    renamed = rule_hashes(write_workbook(tmp_path / 'renamed.xlsx',
+                                         columns=replace_column(2, ('colour', ['검정', '흰색', '  ']))))
+    assert changed_rules(base, renamed) == {'1,2,3', '2,3', '3', '1,3,4'}
+
+    constrained = rule_hashes(write_workbook(tmp_path / 'constrained.xlsx', constraints=[
+        ('제외', 'brand', '나이키', 'size', 230, '사이즈'),
+    ]))
+    assert changed_rules(base, constrained) == {'1,2,4', '1,3,4'}
+
+def test_rule_cache_round_trip(tmp_path):
+    cache = RuleOutputCache(str(tmp_path / 'rules'))
+    values_list = [['a', 'b'], ['x', 'y', 'z']]
+    chunks = [[np.array([0, 0, 1]), np.array([0, 2, 1])], [np.array([1]), np.array([2])]]
+    cache.save('full', values_list, chunks)
+    cache.save('empty', None, [])
+
+    loaded_values, loaded_chunks = cache.load('full')
+    assert loaded_values == values_list
+    loaded_chunks = list(loaded_chunks)
+    assert len(loaded_chunks) == 2
+    for loaded, expected in zip(loaded_chunks, chunks):
+        assert [column.dtype for column in loaded] == [np.int32, np.int32]
+        assert [column.tolist() for column in loaded] == [column.tolist() for column in expected]
+    assert cache.load('empty')[0] is None and list(cache.load('empty')[1]) == []
+    assert cache.load('missing') is None
+
+    # 취소된 기록은 캐시에 남지 않음
+    writer = cache.writer('cancelled')
+    writer.write(values_list, chunks[0])
+    writer.discard()
+    assert not cache.exists('cancelled')
+
+    (tmp_path / 'rules' / 'old.pkl').write_bytes(b'')
+    cache.prune(['full'])
+    assert os.listdir(tmp_path / 'rules') == ['full.codes']
+
+def run_cli(path, output_dir, *options):
+    args = kg.parse_arguments(['-i', str(path), '-o', str(output_dir), '--quiet', *options])
+    assert kg.run(args) == 0
+
+def read_group_files(directory):
+    return {os.path.basename(path): pd.read_csv(path, dtype=str, keep_default_na=False)
+            for path in sorted(glob.glob(os.path.join(directory, '*.csv')))
+            if os.path.basename(path) != 'Dashboard.csv'}
+
+def fresh_groups(path, output_dir):
+    run_cli(path, output_dir, '-f', 'csv')
+    [directory] = [path for path in glob.glob(os.path.join(output_dir, 'generated_keywords_*')) if os.path.isdir(path)]
+    return read_group_files(directory)
+
+def test_incremental_csv_matches_fresh_run(tmp_path, capsys):
+    path = write_workbook(tmp_path / 'input.xlsx')
+    output_dir = tmp_path / 'incremental'
+    target = output_dir / 'generated_keywords'
+    run_cli(path, output_dir, '-f', 'csv', '--incremental')
+    assert "규칙 6개 중 6개 다시 생성" in capsys.readouterr().out
+    first = read_group_files(target)
+    expected = fresh_groups(path, tmp_path / 'fresh')
+    assert first.keys() == expected.keys()
+    for name, frame in expected.items():
+        pd.testing.assert_frame_equal(first[name], frame)
+    mtimes = {name: os.path.getmtime(target / name) for name in first}
+
+    # 사이즈 컬럼만 바꾸면 그 컬럼을 쓰는 규칙만 다시 만들고 다른 그룹 파일은 그대로 둠
+    write_workbook(path, columns=replace_column(3, ('size', [230, 240, 260, 270])))
+    capsys.readouterr()
+    run_cli(path, output_dir, '-f', 'csv', '--incremental')
+    assert "규칙 6개 중 2개 다시 생성" in capsys.readouterr().out
+    second = read_group_files(target)
+    expected = fresh_groups(path, tmp_path / 'fresh_changed')
+    assert second.keys() == expected.keys()
+    for name, frame in expected.items():
+        pd.testing.assert_frame_equal(second[name], frame)
+    for name, mtime in mtimes.items():
+        if name != '사이즈.csv':
+            assert os.path.getmtime(target / name) == mtime
+
+    manifest = OutputManifest.load(manifest_path_for(target))
+    assert manifest.groups['사이즈']['rows'] == len(second['사이즈.csv'])
+    assert len(os.listdir(rule_cache_dir_for(target))) == 6
+
+def test_incremental_xlsx_rebuilds_from_cache(tmp_path, capsys):
+    path = write_workbook(tmp_path / 'input.xlsx')
+    output_dir = tmp_path / 'out'
+    run_cli(path, output_dir, '--incremental')
+    capsys.readouterr()
+    run_cli(path, output_dir, '--incremental')
+    assert "규칙 6개 중 0개 다시 생성" in capsys.readouterr().out
+
+    run_cli(path, tmp_path / 'fresh')
+    [fresh] = glob.glob(os.path.join(tmp_path / 'fresh', 'generated_keywords_*.xlsx'))
+    cached = read_xlsx(output_dir / 'generated_keywords.xlsx')
+    expected = read_xlsx(fresh)
+    assert cached.keys() == expected.keys()
+    for title in expected:
+        if title != 'Dashboard':
+            assert cached[title] == expected[title]
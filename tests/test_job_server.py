@@ -0,0 +1,86 @@
+import io
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+import zipfile
+from http.server import ThreadingHTTPServer
+
+import pandas as pd
+import pytest
+
+from conftest import baseline_keywords
+from keyword_server import JobRequestError, JobRequestHandler, JobService, check_options, query_options
+
+def test_query_options():
+    params = [('name', 'a.xlsx'), ('format', 'csv'), ('quiet', ''), ('dedup_priority', 'A'),
+              ('dedup-priority', 'B')]
+    assert query_options(params) == ['--format=csv', '--quiet', '--dedup-priority', 'A', 'B']
+    with pytest.raises(JobRequestError):
+        query_options([('output', '/tmp')])
+
+def test_check_options():
+    assert check_options(['--format=csv', '--max-rows=10'], max_workers=1).max_rows == 10
+    for options in (['--unknown'], ['--workers=4'], ['--inp=other.xlsx']):
+        with pytest.raises(JobRequestError):
+            check_options(options, max_workers=2)
+
+@pytest.fixture
+def server(tmp_path):
+    service = JobService(str(tmp_path / 'jobs'), jobs=1, max_queue=2)
+    httpd = ThreadingHTTPServer(('127.0.0.1', 0), JobRequestHandler)
+    httpd.daemon_threads = True
+    httpd.service = service
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+    httpd.server_close()
+    service.shutdown()
+
+def request(url, data=None, method=None):
+    with urllib.request.urlopen(urllib.request.Request(url, data=data, method=method), timeout=60) as response:
+        body = response.read()
+        return response.status, response.headers, body
+
+def wait_finished(base, job_id, timeout=120):
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        job = json.loads(request(f"{base}/jobs/{job_id}")[2])
+        if job['status'] in ('ok', 'failed', 'cancelled'):
+            return job
+        time.sleep(0.2)
+    raise AssertionError(f"작업이 끝나지 않았습니다: {job}")
+
+def test_job_round_trip(server, sample_workbook):
+    with open(sample_workbook, 'rb') as f:
+        data = f.read()
+    status, _, body = request(f"{server}/jobs?name=sample.xlsx&format=csv&quiet", data)
+    assert status == 202
+    job = wait_finished(server, json.loads(body)['id'])
+    assert job['status'] == 'ok'
+    assert job['keywords'] == len(baseline_keywords(sample_workbook))
+
+    status, headers, body = request(f"{server}{job['result']}")
+    assert "sample_keywords.zip" in headers['Content-Disposition']
+    with zipfile.ZipFile(io.BytesIO(body)) as archive:
+        groups = [name for name in archive.namelist() if not name.startswith('Dashboard')]
+        rows = sum(len(pd.read_csv(archive.open(name), dtype=str)) for name in groups)
+    assert rows == job['keywords']
+    assert request(f"{server}/jobs/{job['id']}/log")[0] == 200
+
+    # 끝난 작업을 삭제하면 파일까지 지워지고 더 이상 찾을 수 없음
+    assert json.loads(request(f"{server}/jobs/{job['id']}", method='DELETE')[2]) == {'id': job['id'], 'deleted': True}
+    with pytest.raises(urllib.error.HTTPError) as error:
+        request(f"{server}/jobs/{job['id']}")
+    assert error.value.code == 404
+
+def test_rejected_requests(server):
+    with pytest.raises(urllib.error.HTTPError) as error:
+        request(f"{server}/jobs", b'not a workbook')
+    assert error.value.code == 415
+    with pytest.raises(urllib.error.HTTPError) as error:
+        request(f"{server}/jobs?output=elsewhere", b'PK\x03\x04')
+    assert error.value.code == 400
+    assert json.loads(request(f"{server}/health")[2])['queued'] == 0
@@ -0,0 +1,68 @@
+import itertools
+import random
+
+import pandas as pd
+import pytest
+
+import keyword_generator as kg
+
+def brute_force(values_list, limits):
+    """모든 조합을 만들어 상한 안에 드는 (키워드 수, 글자 수 합계)"""
+    keywords = [" ".join(combo) for combo in itertools.product(*values_list)]
+    fitting = [keyword for keyword in keywords
+               if (limits.max_length is None or len(keyword) <= limits.max_length)
+               and (limits.max_words is None or keyword.count(' ') + 1 <= limits.max_words)]
+    return len(fitting), sum(map(len, fitting))
+
+def random_values(rng, count):
+    words = ['강남', '피부과', '보톡스 가격', 'A', '리프팅 시술 후기', '100유닛', 'best price']
+    return list(dict.fromkeys(rng.choice(words) + str(rng.randint(0, 9)) * rng.randint(0, 2) for _ in range(count)))
+
+@pytest.mark.parametrize('seed', range(5))
+@pytest.mark.parametrize('max_length, max_words', [(None, None), (12, None), (None, 3), (15, 4), (3, 1)])
+def test_count_matches_brute_force(seed, max_length, max_words):
+    rng = random.Random(seed)
+    values_list = [random_values(rng, rng.randint(1, 5)) for _ in range(rng.randint(1, 4))]
+    limits = kg.KeywordLimits(max_length, max_words)
+    assert limits.count(values_list) == brute_force(values_list, limits)
+
+@pytest.mark.parametrize('seed', range(5))
+def test_pruner_enumerates_exactly_fitting_combinations(seed):
+    rng = random.Random(seed)
+    values_list = [random_values(rng, rng.randint(2, 5)) for _ in range(3)]
+    limits = kg.KeywordLimits(14, 4)
+    pruner = kg.CombinationPruner.prepare(values_list, limits)
+    expected = [" ".join(combo) for combo in itertools.product(*values_list)
+                if len(" ".join(combo)) <= 14 and " ".join(combo).count(' ') < 4]
+    if pruner is None:
+        assert expected == []
+        return
+    keywords = []
+    for codes in kg.iter_pruned_codes(pruner, chunk_size=3):
+        keywords.extend(kg.join_coded_parts(kg.value_parts(pruner.values_list), codes)[0].tolist())
+    assert keywords == expected
+
+def test_engine_limits_match_filtered_baseline(sample_data, sample_results):
+    limits = kg.KeywordLimits(max_length=10, max_words=2)
+    engine = kg.KeywordEngine(*sample_data, limits=limits, chunk_size=4, verbose=False)
+    result = pd.concat(list(engine.iter_chunks()), ignore_index=True)
+    keywords = sample_results['keyword']
+    expected = sample_results[keywords.str.len().le(10) & keywords.str.count(' ').lt(2)]
+    assert result['keyword'].tolist() == expected['keyword'].tolist()
+    assert result['rule'].tolist() == expected['rule'].tolist()
+
+@pytest.mark.parametrize('options, value, expected', [
+    ({}, '  보톡스   가격\t', '보톡스 가격'),
+    ({'case_fold': True}, 'Best PRICE', 'best price'),
+    ({'korean_spacing': 'join'}, '보톡스 가격 100', '보톡스가격 100'),
+    ({'korean_spacing': 'split'}, '보톡스100유닛', '보톡스 100 유닛'),
+])
+def test_normalizer(options, value, expected):
+    assert kg.ValueNormalizer(**options)(value) == expected
+
+def test_normalized_values_are_merged():
+    normalizer = kg.ValueNormalizer(case_fold=True)
+    assert normalizer.normalize_values(['Botox', 'botox ', ' ', 'BOTOX', 'filler']) == ['botox', 'filler']
+    assert (normalizer.values_in, normalizer.values_out) == (5, 2)
+    with pytest.raises(ValueError):
+        kg.ValueNormalizer(korean_spacing='auto')
@@ -0,0 +1,43 @@
+import itertools
+
+import numpy as np
+
+import keyword_generator as kg
+
+VALUES = [['a', 'b', 'c'], ['x'], ['1', '2'], ['p', 'q', 'r', 's']]
+
+def test_mixed_radix_codes_follow_product_order():
+    radices = [len(values) for values in VALUES]
+    expected = list(itertools.product(*[range(radix) for radix in radices]))
+    codes = kg.mixed_radix_codes(radices, 0, len(expected))
+    assert list(zip(*(column.tolist() for column in codes))) == expected
+
+def test_chunk_ranges_concatenate_to_full_range():
+    radices = [len(values) for values in VALUES]
+    total = kg.count_combinations(VALUES)
+    full = kg.mixed_radix_codes(radices, 0, total)
+    for chunk_size in (1, 5, 7, total):
+        pieces = [kg.mixed_radix_codes(radices, start, min(start + chunk_size, total))
+                  for start in range(0, total, chunk_size)]
+        for position, column in enumerate(full):
+            np.testing.assert_array_equal(np.concatenate([piece[position] for piece in pieces]), column)
+
+def test_index_codes_for_arbitrary_indexes():
+    radices = [len(values) for values in VALUES]
+    expected = list(itertools.product(*[range(radix) for radix in radices]))
+    index = np.array([23, 0, 7, 11], dtype=np.int64)
+    codes = kg.index_codes(radices, index)
+    assert list(zip(*(column.tolist() for column in codes))) == [expected[i] for i in index]
+
+def test_join_keyword_arrays_matches_join():
+    total = kg.count_combinations(VALUES)
+    keyword, components = kg.join_keyword_arrays(VALUES, 3, total - 2)
+    combos = list(itertools.product(*VALUES))[3:total - 2]
+    assert keyword.tolist() == [" ".join(combo) for combo in combos]
+    assert components.tolist() == [" | ".join(combo) for combo in combos]
+
+def test_build_keyword_chunk_columns():
+    chunk = kg.build_keyword_chunk('1,2', 'g', ['c1', 'c2'], VALUES[:2], 0, 3)
+    assert chunk.columns.tolist() == kg.RESULT_COLUMNS
+    assert chunk['keyword'].tolist() == ['a x', 'b x', 'c x']
+    assert set(chunk['columns']) == {'c1, c2'}
@@ -0,0 +1,11 @@
+import pandas as pd
+
+import keyword_generator as kg
+from conftest import baseline_keywords
+
+def test_workers_match_baseline(sample_workbook, sample_data):
+    engine = kg.KeywordEngine(*sample_data, chunk_size=7, workers=2, verbose=False)
+    result = pd.concat(list(engine.iter_chunks()), ignore_index=True)[kg.RESULT_COLUMNS]
+
+    pd.testing.assert_frame_equal(result, baseline_keywords(sample_workbook))
+    assert sum(stats['rows'] for stats in engine.worker_stats.values()) == len(result)
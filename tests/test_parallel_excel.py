@@ -0,0 +1,81 @@
+import os
+import struct
+import zipfile
+
+import pandas as pd
+import pytest
+
+import keyword_generator as kg
+import output_sinks
+from conftest import read_xlsx
+from output_sinks import DASHBOARD_NAME, ParallelExcelWriter, StreamingExcelWriter
+
+def write_xlsx(writer_class, results, path, **options):
+    writer = writer_class(str(path), kg.RESULT_COLUMNS, max_rows=10, **options)
+    for chunk in kg.iter_dataframe_chunks(results, 6):
+        writer.write_chunk(chunk)
+    writer.write_dashboard([('총 키워드 수', len(results)), ('비고', '<&"특수문자">')])
+    writer.close()
+    return writer
+
+@pytest.mark.parametrize('workers', [1, 2])
+def test_same_sheets_as_streaming_writer(tmp_path, sample_results, workers):
+    frame = pd.concat([sample_results, pd.DataFrame({
+        'rule': '9', 'group': ['a/b', 'a_b'], 'columns': 'c', 'keyword': ['<a & "b">', 'k'], 'components': 'c'
+    })], ignore_index=True)
+    parallel = write_xlsx(ParallelExcelWriter, frame, tmp_path / 'parallel.xlsx', workers=workers)
+    streaming = write_xlsx(StreamingExcelWriter, frame, tmp_path / 'streaming.xlsx')
+
+    parallel_sheets = read_xlsx(tmp_path / 'parallel.xlsx')
+    streaming_sheets = read_xlsx(tmp_path / 'streaming.xlsx')
+    # 시트 이름과 내용은 같고, 병렬 writer는 그룹의 시트를 모아서 배치
+    assert list(parallel_sheets) == parallel.sheet_names
+    assert sorted(parallel_sheets) == sorted(streaming.sheet_names)
+    assert list(parallel_sheets)[0] == DASHBOARD_NAME
+    for name, rows in streaming_sheets.items():
+        if name == DASHBOARD_NAME:
+            # 병렬 writer는 모든 값을 문자열로 기록
+            assert [[str(value) for value in row] for row in parallel_sheets[name]] == \
+                [[str(value) for value in row] for row in rows]
+        elif name.startswith('a_b'):
+            assert len(parallel_sheets[name]) == 2
+        else:
+            assert parallel_sheets[name] == rows
+    assert not os.path.exists(parallel.work_dir)
+
+def test_zip64_records(tmp_path, sample_results, monkeypatch):
+    # 한도를 낮춰 모든 항목과 중앙 디렉토리를 ZIP64 형식으로 기록
+    monkeypatch.setattr(output_sinks, 'ZIP64_LIMIT', 64)
+    path = tmp_path / 'zip64.xlsx'
+    write_xlsx(ParallelExcelWriter, sample_results, path, workers=1)
+
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+        infos = archive.infolist()
+        assert all(info.file_size > 0 for info in infos)
+    data = path.read_bytes()
+    assert struct.unpack('<I', data[:4])[0] == 0x04034b50
+    assert struct.unpack('<H', data[4:6])[0] == 45
+    assert data.rfind(struct.pack('<I', 0x06064b50)) > 0
+    assert data.rfind(struct.pack('<I', 0x07064b50)) > 0
+    assert len(read_xlsx(path)) == len(expected_sheet_names(sample_results))
+
+def expected_sheet_names(results):
+    """max_rows=10에서 만들어지는 시트 이름 수만큼의 목록 (Dashboard 포함)"""
+    counts = results.groupby('group', sort=False).size()
+    return [DASHBOARD_NAME] + [group for group, rows in counts.items() for _ in range(-(-rows // 9))]
+
+def test_small_archive_has_no_zip64_records(tmp_path, sample_results):
+    path = tmp_path / 'plain.xlsx'
+    write_xlsx(ParallelExcelWriter, sample_results, path, workers=1)
+    data = path.read_bytes()
+    assert data.find(struct.pack('<I', 0x06064b50)) == -1
+    with zipfile.ZipFile(path) as archive:
+        assert archive.testzip() is None
+
+def test_abort_removes_work_dir(tmp_path, sample_results):
+    writer = ParallelExcelWriter(str(tmp_path / 'aborted.xlsx'), kg.RESULT_COLUMNS)
+    writer.write_chunk(sample_results)
+    writer.abort()
+    assert not os.path.exists(writer.work_dir)
+    assert not os.path.exists(tmp_path / 'aborted.xlsx')
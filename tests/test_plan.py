@@ -0,0 +1,31 @@
+import keyword_generator as kg
+
+def test_plan_counts_match_generation(sample_data, sample_results):
+    plan = kg.plan_keyword_generation(*sample_data)
+
+    assert plan['total_keywords'] == len(sample_results)
+    assert plan['groups'] == sample_results.groupby('group', sort=False).size().to_dict()
+    for rule_plan in plan['rules']:
+        rows = sample_results[sample_results['rule'] == rule_plan['rule']]
+        assert rule_plan['keywords'] == len(rows)
+        assert rule_plan['avg_keyword_length'] == rows['keyword'].str.len().mean()
+
+def test_plan_output_sizes(sample_data, sample_results):
+    plan = kg.plan_keyword_generation(*sample_data)
+    for rule_plan in plan['rules']:
+        rows = sample_results[sample_results['rule'] == rule_plan['rule']]
+        # CSV는 정확히, JSON Lines는 행당 고정 오버헤드로 근사
+        assert rule_plan['csv_bytes'] == len(rows.to_csv(index=False, header=False).encode('utf-8'))
+        jsonl_bytes = len(rows.to_json(orient='records', lines=True, force_ascii=False).encode('utf-8'))
+        assert abs(rule_plan['jsonl_bytes'] - jsonl_bytes) <= 0.02 * jsonl_bytes
+
+def test_plan_with_limits_counts_only_fitting_keywords(sample_data, sample_results):
+    limits = kg.KeywordLimits(max_length=10, max_words=2)
+    plan = kg.plan_keyword_generation(*sample_data, limits=limits)
+    fits = sample_results['keyword'].str.len().le(10) & sample_results['keyword'].str.count(' ').lt(2)
+    assert plan['total_keywords'] == int(fits.sum())
+    assert plan['limits'] == limits.describe()
+
+def test_streaming_memory_is_bounded_by_chunk(sample_data):
+    plan = kg.plan_keyword_generation(*sample_data, chunk_size=10)
+    assert plan['peak_memory']['streaming'] < plan['peak_memory']['in_memory']
@@ -0,0 +1,55 @@
+import itertools
+
+import keyword_generator as kg
+
+VALUES = {1: ['a', 'b'], 2: ['x', 'y', 'z'], 3: ['1', '2'], 4: ['p', 'q']}
+
+def rule_values(column_keys):
+    return [VALUES[key] for key in column_keys]
+
+def test_shared_prefix_is_built_once_and_reused():
+    trie = kg.PrefixTrie()
+    rules = [(1, 2, 3), (1, 2, 4), (2, 3)]
+    for column_keys in rules:
+        trie.add_rule(column_keys)
+
+    first = trie.acquire(rule_values(rules[0]), rules[0])
+    second = trie.acquire(rule_values(rules[1]), rules[1])
+    depth, keyword, components = first
+    assert depth == 2
+    assert keyword.tolist() == [" ".join(combo) for combo in itertools.product(VALUES[1], VALUES[2])]
+    assert components.tolist() == [" | ".join(combo) for combo in itertools.product(VALUES[1], VALUES[2])]
+    assert second[1] is keyword
+    assert trie.hits == 1
+    # 접두사를 공유하는 규칙이 없으면 캐시하지 않음
+    assert trie.acquire(rule_values(rules[2]), rules[2]) is None
+
+def test_prefix_joins_match_full_join():
+    trie = kg.PrefixTrie()
+    for column_keys in [(1, 2, 3), (1, 2, 4)]:
+        trie.add_rule(column_keys)
+    for column_keys in [(1, 2, 3), (1, 2, 4)]:
+        values = rule_values(column_keys)
+        total = kg.count_combinations(values)
+        prefix = trie.acquire(values, column_keys)
+        assert kg.join_keyword_arrays(values, 1, total, prefix)[0].tolist() == \
+            kg.join_keyword_arrays(values, 1, total)[0].tolist()
+
+def test_release_frees_arrays():
+    trie = kg.PrefixTrie()
+    rules = [(1, 2, 3), (1, 2, 4)]
+    for column_keys in rules:
+        trie.add_rule(column_keys)
+    for column_keys in rules:
+        trie.acquire(rule_values(column_keys), column_keys)
+    node = trie.root['children'][1]['children'][2]
+    trie.release(rules[0])
+    assert node['arrays'] is not None
+    trie.release(rules[1])
+    assert node['arrays'] is None
+
+def test_prefix_larger_than_limit_is_not_cached():
+    trie = kg.PrefixTrie(max_rows=5)
+    for column_keys in [(1, 2, 3), (1, 2, 4)]:
+        trie.add_rule(column_keys)
+    assert trie.acquire(rule_values((1, 2, 3)), (1, 2, 3)) is None
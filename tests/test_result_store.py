@@ -0,0 +1,100 @@
+import os
+import time
+
+import pandas as pd
+
+import keyword_generator as kg
+from result_store import ResultStore
+
+def compact(sample_data):
+    return kg.KeywordEngine(*sample_data, verbose=False).compact_results()
+
+def test_save_and_load_round_trip(tmp_path, sample_data, sample_results):
+    store = ResultStore(str(tmp_path / 'store'))
+    handle = store.save(compact(sample_data))
+    loaded = store.load(handle)
+
+    assert len(handle) == len(sample_results)
+    pd.testing.assert_frame_equal(loaded.to_dataframe(), sample_results.reset_index(drop=True))
+    assert loaded.summary.total == len(sample_results)
+
+def test_expired_result_is_discarded(tmp_path, sample_data):
+    store = ResultStore(str(tmp_path / 'store'), ttl=60)
+    handle = store.save(compact(sample_data))
+    meta_path = store.file_path(handle, 'meta.pkl')
+    os.utime(meta_path, (0, 0))
+    assert store.load(handle) is None
+    assert not store.exists(handle)
+
+def test_evict_keeps_current_result_over_limit(tmp_path, sample_data):
+    results = compact(sample_data)
+    store = ResultStore(str(tmp_path / 'store'), max_bytes=1)
+    first = store.save(results)
+    assert store.exists(first)
+    second = store.save(results)
+    # 한도를 넘어도 방금 저장한 결과는 남기고 이전 결과만 삭제
+    assert not store.exists(first)
+    assert store.exists(second)
+
+    with open(store.file_path(second, 'export.xlsx'), 'wb') as f:
+        f.write(b'x' * 1000)
+    store.evict(keep=second)
+    assert store.exists(second)
+    assert store.find_file(second, '.xlsx') == store.file_path(second, 'export.xlsx')
+
+def test_evict_oldest_first(tmp_path, sample_data):
+    results = compact(sample_data)
+    store = ResultStore(str(tmp_path / 'store'))
+    handles = [store.save(results) for _ in range(3)]
+    for age, handle in enumerate(handles):
+        os.utime(store.file_path(handle, 'meta.pkl'), (1e9 + age, 1e9 + age))
+    store.ttl = float('inf')
+    store.max_bytes = 2 * store.size(handles[0])
+    store.evict()
+    assert [store.exists(handle) for handle in handles] == [False, True, True]
+
+def test_evict_ignores_stray_files(tmp_path, sample_data):
+    store = ResultStore(str(tmp_path / 'store'))
+    handle = store.save(compact(sample_data))
+    (tmp_path / 'store' / 'notes.txt').write_text('')
+    store.evict()
+    assert store.exists(handle)
+
+def test_find_file_returns_newest_export(tmp_path, sample_data):
+    store = ResultStore(str(tmp_path / 'store'))
+    handle = store.save(compact(sample_data))
+    for age, name in enumerate(['b.xlsx', 'a.xlsx']):
+        path = store.file_path(handle, name)
+        open(path, 'wb').close()
+        os.utime(path, (1e9 + age, 1e9 + age))
+    # 기록 중인 임시 파일은 결과로 보지 않음
+    open(store.part_path(store.file_path(handle, 'c.xlsx')), 'wb').close()
+    assert store.find_file(handle, '.xlsx') == store.file_path(handle, 'a.xlsx')
+
+    store.discard(handle)
+    assert store.find_file(handle, '.xlsx') is None
+
+def test_evict_removes_superseded_exports_after_grace(tmp_path, sample_data):
+    store = ResultStore(str(tmp_path / 'store'))
+    handle = store.save(compact(sample_data))
+    old, recent, newest = (store.file_path(handle, f'{name}.xlsx') for name in ('old', 'recent', 'newest'))
+    for path, mtime in ((old, 1e9), (recent, 1e9 + 100), (newest, time.time())):
+        open(path, 'wb').close()
+        os.utime(path, (mtime, mtime))
+    store.evict(keep=handle)
+    # old는 오래전에 recent로 대체되었고, recent는 방금 newest로 대체되어 아직 남겨 둠
+    assert [os.path.exists(path) for path in (old, recent, newest)] == [False, True, True]
+    assert store.exists(handle)
+
+def test_evict_skips_results_being_exported(tmp_path, sample_data):
+    results = compact(sample_data)
+    store = ResultStore(str(tmp_path / 'store'), max_bytes=1)
+    writing = store.save(results)
+    part = store.part_path(store.file_path(writing, 'export.xlsx'))
+    open(part, 'wb').close()
+    # 다른 세션의 저장으로 한도를 넘어도 내보내기 중인 결과는 지우지 않음
+    other = store.save(results)
+    assert store.exists(writing) and os.path.exists(part)
+    os.remove(part)
+    store.evict(keep=other)
+    assert not store.exists(writing)
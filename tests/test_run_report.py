@@ -0,0 +1,72 @@
+import json
+import time
+import tracemalloc
+
+from conftest import baseline_keywords
+import keyword_generator as kg
+from run_report import RunReport
+
+def test_stages_accumulate_and_nest():
+    report = RunReport(trace_memory=True)
+    with report.stage('write') as counter:
+        counter['rows'] = 10
+        with report.stage('dashboard'):
+            data = bytearray(1 << 20)
+        del data
+    with report.stage('write', rows=5):
+        time.sleep(0.001)
+
+    write, dashboard = report.stages['write'], report.stages['dashboard']
+    assert (write['rows'], write['calls']) == (15, 2)
+    # 안쪽 단계의 최대 메모리는 바깥 단계에도 반영
+    assert dashboard['peak_bytes'] >= 1 << 20
+    assert write['peak_bytes'] >= dashboard['peak_bytes']
+    assert report.peak_bytes >= write['peak_bytes']
+    report.close()
+
+def test_time_chunks_records_rules(sample_data, sample_results):
+    report = RunReport(trace_memory=False)
+    # 엔진 청크는 규칙 하나에 속하므로 청크 첫 행의 규칙으로 집계
+    engine = kg.KeywordEngine(*sample_data, chunk_size=4, verbose=False)
+    chunks = list(report.time_chunks(engine.iter_chunks()))
+    assert sum(map(len, chunks)) == len(sample_results)
+    counts = sample_results.groupby('rule', sort=False).size()
+    assert {rule: record['rows'] for rule, record in report.rules.items()} == counts.to_dict()
+    assert report.stages['generate']['rows'] == len(sample_results)
+    assert report.to_dict()['peak_bytes'] is None
+
+def test_cli_report(sample_workbook, tmp_path):
+    report_path = tmp_path / 'reports' / 'run.json'
+    args = kg.parse_arguments(['-i', sample_workbook, '-o', str(tmp_path / 'out'), '-f', 'csv', '--quiet',
+                               '--report', str(report_path)])
+    assert kg.run(args) == 0
+    data = json.loads(report_path.read_text(encoding='utf-8'))
+    stages = {entry['name']: entry for entry in data['stages']}
+    assert {'load', 'generate', 'write', 'dashboard'} <= stages.keys()
+    assert stages['generate']['rows'] == len(baseline_keywords(sample_workbook))
+    assert sum(entry['rows'] for entry in data['rules']) == stages['generate']['rows']
+    assert data['info']['input'] == sample_workbook
+
+def test_close_stops_only_own_tracing():
+    assert not tracemalloc.is_tracing()
+    report = RunReport(trace_memory=True)
+    with report.stage('write'):
+        data = bytearray(1 << 16)
+    del data
+    report.close()
+    assert not tracemalloc.is_tracing()
+    # 닫은 뒤에도 측정한 최대 메모리는 보고서에 남음
+    assert report.to_dict()['stages'][0]['peak_bytes'] >= 1 << 16
+
+    tracemalloc.start()
+    try:
+        RunReport(trace_memory=True).close()
+        assert tracemalloc.is_tracing()
+    finally:
+        tracemalloc.stop()
+
+def test_cli_trace_memory_does_not_leave_tracing_on(sample_workbook, tmp_path):
+    args = kg.parse_arguments(['-i', sample_workbook, '-o', str(tmp_path / 'out'), '-f', 'csv', '--quiet',
+                               '--trace-memory'])
+    assert kg.run(args) == 0
+    assert not tracemalloc.is_tracing()
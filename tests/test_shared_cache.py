@@ -0,0 +1,35 @@
+import pytest
+
+pytest.importorskip('streamlit')
+
+from streamlit_app import SharedLRUCache
+
+def test_least_recently_used_entry_is_evicted():
+    cache = SharedLRUCache(max_entries=2, max_bytes=100)
+    cache.put('a', 1, 10)
+    cache.put('b', 2, 10)
+    assert cache.get('a') == 1
+    cache.put('c', 3, 10)
+    assert cache.get('b') is None
+    assert (cache.get('a'), cache.get('c')) == (1, 3)
+
+def test_size_limit():
+    cache = SharedLRUCache(max_entries=10, max_bytes=100)
+    cache.put('a', 1, 60)
+    cache.put('b', 2, 60)
+    assert cache.get('a') is None
+    assert cache.total_bytes == 60
+    # 한도보다 큰 값은 저장하지 않음
+    cache.put('c', 3, 200)
+    assert cache.get('c') is None
+    assert cache.total_bytes == 60
+
+def test_replace_and_discard():
+    cache = SharedLRUCache()
+    cache.put('a', 1, 10)
+    cache.put('a', 2, 20)
+    assert cache.get('a') == 2
+    assert cache.total_bytes == 20
+    cache.discard('a')
+    assert cache.get('a') is None
+    assert cache.total_bytes == 0
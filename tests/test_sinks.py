@@ -0,0 +1,77 @@
+import os
+
+import pandas as pd
+import pytest
+
+import keyword_generator as kg
+from output_sinks import COMPRESSION_SUFFIXES, create_sink
+
+def read_output(path, output_format):
+    """그룹 파일을 문자열 DataFrame으로 다시 읽기 (압축은 확장자로 판별)"""
+    if output_format in ('csv', 'tsv'):
+        return pd.read_csv(path, sep=',' if output_format == 'csv' else '\t', dtype=str, keep_default_na=False)
+    if output_format == 'jsonl':
+        return pd.read_json(path, lines=True, dtype=False, convert_dates=False)
+    return pd.read_parquet(path)
+
+def write_results(results, output_format, output_dir, compression=None, chunk_size=5):
+    sink = create_sink(output_format, str(output_dir), kg.RESULT_COLUMNS, compression)
+    for chunk in kg.iter_dataframe_chunks(results, chunk_size):
+        sink.write_chunk(chunk)
+    sink.write_dashboard([('총 키워드 수', len(results))])
+    sink.close()
+    return sink
+
+@pytest.mark.parametrize('output_format, compression', [
+    ('csv', None), ('csv', 'gzip'), ('tsv', None), ('jsonl', None), ('jsonl', 'gzip'),
+    ('csv', 'zstd'), ('parquet', None), ('parquet', 'gzip'),
+])
+def test_round_trip(tmp_path, sample_results, output_format, compression):
+    if compression == 'zstd':
+        pytest.importorskip('zstandard')
+    if output_format == 'parquet':
+        pytest.importorskip('pyarrow')
+    output_dir = tmp_path / 'out'
+    sink = write_results(sample_results, output_format, output_dir, compression)
+    suffix = '' if output_format == 'parquet' else COMPRESSION_SUFFIXES[compression]
+
+    assert sink.total_rows == len(sample_results)
+    assert sorted(os.listdir(output_dir)) == sorted(sink.output_names)
+    dashboard = read_output(output_dir / f"Dashboard.{output_format}{suffix}", output_format)
+    assert dashboard.values.tolist() == [['총 키워드 수', str(len(sample_results))]]
+    for group, expected in sample_results.groupby('group', sort=False):
+        path = output_dir / f"{sink.file_names[group]}.{output_format}{suffix}"
+        result = read_output(path, output_format)
+        assert result.columns.tolist() == kg.RESULT_COLUMNS
+        assert result.values.tolist() == expected.values.tolist()
+
+def test_colliding_group_file_names(tmp_path):
+    groups = ['a/b', 'a_b', 'Dashboard', 'dashboard', 'x:[1]']
+    frame = pd.DataFrame({'rule': '1', 'group': groups, 'columns': 'c',
+                          'keyword': [f"k{i}" for i in range(len(groups))], 'components': 'c'})
+    sink = write_results(frame, 'csv', tmp_path)
+
+    assert sink.file_names == {'a/b': 'a_b', 'a_b': 'a_b_2', 'Dashboard': 'Dashboard_2',
+                               'dashboard': 'dashboard_3', 'x:[1]': 'x_[1]'}
+    assert len(os.listdir(tmp_path)) == len(groups) + 1
+    for index, group in enumerate(groups):
+        result = read_output(tmp_path / f"{sink.file_names[group]}.csv", 'csv')
+        assert result['keyword'].tolist() == [f"k{index}"]
+
+def test_claimed_file_names_are_kept(tmp_path):
+    sink = create_sink('csv', str(tmp_path), kg.RESULT_COLUMNS)
+    sink.claim_file_names({'a_b': 'a_b_2'})
+    assert sink.path_for('a/b').endswith('a_b.csv')
+    assert sink.path_for('a_b').endswith('a_b_2.csv')
+
+def test_discard_group_keeps_names_in_use(tmp_path):
+    sink = write_results(pd.DataFrame({'rule': '1', 'group': ['a_b'], 'columns': 'c', 'keyword': 'k',
+                                       'components': 'c'}), 'csv', tmp_path)
+    (tmp_path / 'old.csv').write_text('rule\n')
+    sink.discard_group('old', 'old')
+    sink.discard_group('a/b', 'a_b')
+    assert sorted(os.listdir(tmp_path)) == ['Dashboard.csv', 'a_b.csv']
+
+def test_unknown_format():
+    with pytest.raises(ValueError):
+        create_sink('xml', 'out', kg.RESULT_COLUMNS)
@@ -0,0 +1,49 @@
+import pickle
+import random
+
+import numpy as np
+import pandas as pd
+
+import keyword_generator as kg
+
+def test_counts_match_dataframe(sample_results):
+    summary = kg.KeywordSummary.from_dataframe(sample_results)
+    lengths = sample_results['keyword'].str.len()
+
+    assert summary.total == len(sample_results)
+    assert dict(summary.group_counts) == sample_results.groupby('group', sort=False).size().to_dict()
+    assert dict(summary.length_counts) == lengths.value_counts().to_dict()
+    assert dict(summary.word_counts) == (sample_results['keyword'].str.count(' ') + 1).value_counts().to_dict()
+    assert summary.average_length == lengths.mean()
+    assert summary.top_rules(1) == [('1,2,4', 36)]
+
+def test_duplicates_across_chunks(sample_results):
+    doubled = pd.concat([sample_results, sample_results.iloc[:10]], ignore_index=True)
+    summary = kg.KeywordSummary()
+    for chunk in kg.iter_dataframe_chunks(doubled, 7):
+        summary.update(chunk)
+    assert summary.duplicates == 10
+
+def test_pending_hashes_are_folded(monkeypatch):
+    monkeypatch.setattr(kg, 'SUMMARY_FOLD_HASHES', 50)
+    rng = random.Random(1)
+    keywords = [f"k{rng.randint(0, 400)}" for _ in range(3000)]
+    summary = kg.KeywordSummary()
+    for start in range(0, len(keywords), 37):
+        summary.update_rule('1', 'g', np.array(keywords[start:start + 37], dtype=object))
+        # 모아 둔 해시는 고유 해시 수(또는 한도)를 넘지 않음
+        assert summary._pending <= max(50, len(summary._unique_hashes)) + 37
+    assert summary.duplicates == len(keywords) - len(set(keywords))
+    assert len(summary._unique_hashes) == len(set(keywords))
+
+def test_pickle_keeps_duplicate_count(sample_results):
+    summary = kg.KeywordSummary.from_dataframe(pd.concat([sample_results] * 2, ignore_index=True))
+    restored = pickle.loads(pickle.dumps(summary))
+    assert restored.duplicates == len(sample_results)
+    assert len(restored._unique_hashes) == 0
+
+def test_length_histogram():
+    summary = kg.KeywordSummary.from_dataframe(pd.DataFrame({
+        'rule': '1', 'group': 'g', 'keyword': ['a' * 5, 'b' * 12, 'c' * 15]
+    }))
+    assert summary.length_histogram() == [('0~9자', 1), ('10~19자', 2)]
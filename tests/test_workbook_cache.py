@@ -0,0 +1,39 @@
+import os
+
+import pandas as pd
+
+import keyword_generator as kg
+from conftest import write_workbook
+
+def test_matches_read_excel(sample_workbook):
+    df_raw, cache_hit = kg.load_raw_workbook(sample_workbook, cache_dir=None)
+    assert not cache_hit
+    pd.testing.assert_frame_equal(df_raw, pd.read_excel(sample_workbook, header=None), check_dtype=False)
+
+def test_cache_hit_on_same_content(tmp_path, sample_workbook):
+    cache_dir = tmp_path / 'cache'
+    first, first_hit = kg.load_raw_workbook(sample_workbook, cache_dir)
+    with open(sample_workbook, 'rb') as f:
+        second, second_hit = kg.load_raw_workbook(f.read(), cache_dir)
+    assert (first_hit, second_hit) == (False, True)
+    pd.testing.assert_frame_equal(first, second)
+    assert len(os.listdir(cache_dir)) == 1
+
+def test_named_sheet_is_cached_separately(tmp_path):
+    path = write_workbook(tmp_path / 'constraints.xlsx', constraints=[('제외', 'brand', '나이키', 'item', '샌들')])
+    cache_dir = tmp_path / 'cache'
+    df_main, _ = kg.load_raw_workbook(path, cache_dir)
+    df_sheet, _ = kg.load_raw_workbook(path, cache_dir, sheet_names=kg.CONSTRAINT_SHEET_NAMES)
+    assert df_sheet.iloc[1].tolist()[:5] == ['제외', 'brand', '나이키', 'item', '샌들']
+    assert df_main.shape != df_sheet.shape
+    assert len(os.listdir(cache_dir)) == 2
+    missing, _ = kg.load_raw_workbook(path, None, sheet_names=['없는 시트'])
+    assert missing.empty
+
+def test_prune_cache_keeps_recent_files(tmp_path):
+    for index in range(5):
+        path = tmp_path / f"{index}.pkl"
+        path.write_bytes(b'')
+        os.utime(path, (index, index))
+    kg.prune_cache(tmp_path, max_files=2)
+    assert sorted(os.listdir(tmp_path)) == ['3.pkl', '4.pkl']